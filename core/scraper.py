@@ -5,8 +5,9 @@ SwissKnife AI Scraper - Core Scraper Implementation
 import asyncio
 import logging
 import time
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
+from dataclasses import dataclass
 
 from config.settings import get_settings
 from services.crawl4ai_client import Crawl4aiDockerClient
@@ -20,6 +21,14 @@ from features.multimodal_processing import MultiModalProcessor
 from utils.exceptions import ScrapingError, InitializationError
 
 
+@dataclass
+class ScrapeJob:
+    """A single unit of work for SwissKnifeScraper.scrape_batch"""
+    url: str
+    query: Optional[str] = None
+    extraction_config: Optional[Dict[str, Any]] = None
+
+
 class SwissKnifeScraper:
     """
     The main SwissKnife AI Scraper class that orchestrates all components
@@ -127,6 +136,12 @@ class SwissKnifeScraper:
             self.logger.error(f"❌ Failed to initialize SwissKnife AI Scraper: {e}")
             raise InitializationError(f"Scraper initialization failed: {e}")
     
+    async def warmup(self) -> bool:
+        """Warm up the crawl4ai browser pool so the first scrape is not a cold start"""
+        if not self.crawl4ai_client:
+            return False
+        return await self.crawl4ai_client.warmup()
+    
     async def scrape(
         self,
         url: str,
@@ -146,76 +161,27 @@ class SwissKnifeScraper:
 
             # PERFORMANCE OPTIMIZATION: Intelligent request routing
             extraction_type = self._determine_extraction_type(extraction_config, query)
-
-            if self.performance_optimizer:
-                # Check cache first
-                cache_key = self.performance_optimizer._generate_cache_key(
-                    "scraper", "scrape", {"url": url, "query": query, "config": extraction_config}
-                )
-                cached_result = await self.performance_optimizer.get_cached_result(cache_key)
-                if cached_result:
-                    self.logger.info("⚡ Cache hit - returning cached result")
-                    return cached_result
-
-                # Get intelligent routing decision
-                routing_decision = await self.performance_optimizer.intelligent_request_routing(
-                    url, extraction_type, query
-                )
-                self.logger.info(f"🎯 Routing decision: {routing_decision}")
-
-                # Handle rate limiting
-                if "wait" in routing_decision:
-                    wait_time = float(routing_decision.split("_")[-1].replace("s", ""))
-                    self.logger.warning(f"⏳ Rate limited, waiting {wait_time}s")
-                    await asyncio.sleep(wait_time)
+            cache_key, cached_result = await self._check_cache_and_route(url, query, extraction_config, extraction_type)
+            if cached_result:
+                return cached_result
 
             # PRIORITY 1: Use crawl4ai Docker service (Primary Engine) with optimization
             if self.crawl4ai_client:
                 self.logger.info("🚀 Using optimized crawl4ai Docker service (Primary Engine)")
 
-                # Get optimized configuration
-                if self.performance_optimizer:
-                    crawl4ai_config = await self.performance_optimizer.optimize_crawl4ai_config(extraction_type)
-                else:
-                    crawl4ai_config = {}
-
                 try:
-                    if query and extraction_config:
-                        # Use LLM extraction via crawl4ai
-                        result = await self.crawl4ai_client.extract_with_llm(url, query)
-                    elif extraction_config and extraction_config.get("css_selectors"):
-                        # Use CSS extraction via crawl4ai
-                        result = await self.crawl4ai_client.extract_with_css(url, extraction_config["css_selectors"])
-                    elif extraction_config and extraction_config.get("xpath_expressions"):
-                        # Use XPath extraction via crawl4ai
-                        result = await self.crawl4ai_client.extract_with_xpath(url, extraction_config["xpath_expressions"])
+                    strategy = self.crawl4ai_client.build_extraction_strategy(query, extraction_config)
+                    if strategy:
+                        # LLM, CSS or XPath extraction via crawl4ai
+                        result = await self.crawl4ai_client.crawl_url(url, extraction_strategy=strategy)
                     else:
-                        # Basic crawl via crawl4ai
+                        # Basic crawl via crawl4ai with the optimized configuration
+                        crawl4ai_config = await self._optimized_crawl4ai_config(extraction_type)
                         result = await self.crawl4ai_client.crawl_url(url, crawler_config=crawl4ai_config)
 
-                    # Record performance metrics
-                    response_time = time.time() - start_time
-                    if self.performance_optimizer:
-                        self.performance_optimizer.record_response_time('crawl4ai', response_time)
-                        self.performance_optimizer.record_request_outcome(result.get("success", False))
-
-                        # Cache successful results
-                        if result.get("success"):
-                            ttl = self.performance_optimizer.optimization_config['cache_ttl'].get(f'crawl4ai_{extraction_type}', 3600)
-                            await self.performance_optimizer.set_cached_result(cache_key, result, ttl)
-
-                    final_result = {
-                        "url": url,
-                        "query": query,
-                        "result": result,
-                        "method": "crawl4ai_docker_primary_optimized",
-                        "timestamp": datetime.now().isoformat(),
-                        "source": "crawl4ai_docker_service",
-                        "response_time": response_time,
-                        "extraction_type": extraction_type
-                    }
-
-                    return final_result
+                    return await self._finish_crawl4ai_scrape(
+                        url, query, result, extraction_type, cache_key, time.time() - start_time
+                    )
 
                 except Exception as e:
                     self.logger.warning(f"⚠️ Optimized crawl4ai failed: {e}")
@@ -223,26 +189,90 @@ class SwissKnifeScraper:
                     if self.performance_optimizer:
                         self.performance_optimizer.record_request_outcome(False)
 
-            # FALLBACK 1: Use adaptive extraction if available
-            if self.extraction_engine and query:
-                self.logger.info("⚠️ Falling back to adaptive extraction engine")
-                result = await self.extraction_engine.analyze_and_extract(url, query)
-                return {
-                    "url": url,
-                    "query": query,
-                    "result": result,
-                    "method": "adaptive_extraction_fallback",
-                    "timestamp": datetime.now().isoformat()
-                }
-
-            # FALLBACK 2: Basic extraction
-            self.logger.warning("⚠️ Using basic extraction fallback")
-            return await self._basic_scrape(url, extraction_config)
+            return await self._fallback_scrape(url, query, extraction_config)
             
         except Exception as e:
             self.logger.error(f"❌ Scraping failed for {url}: {e}")
             raise ScrapingError(f"Scraping failed: {e}")
     
+    async def scrape_batch(self, jobs: List[ScrapeJob]) -> List[Dict[str, Any]]:
+        """
+        Scrape several URLs at once, batching requests to crawl4ai Docker
+        
+        Each job goes through the same cache, routing and fallback path as
+        scrape(); only the crawl4ai requests are batched. Returns one result
+        per job, in order, shaped like the result of scrape().
+        """
+        if not self.is_initialized:
+            raise ScrapingError("Scraper not initialized. Call initialize() first.")
+        
+        if not self.crawl4ai_client:
+            return list(await asyncio.gather(*(
+                self.scrape(job.url, query=job.query, extraction_config=job.extraction_config)
+                for job in jobs
+            )))
+        
+        try:
+            start_time = time.time()
+            self.logger.info(f"🔍 Starting batch scrape for {len(jobs)} jobs")
+            
+            extraction_types = [
+                self._determine_extraction_type(job.extraction_config, job.query) for job in jobs
+            ]
+            prepared = await asyncio.gather(*(
+                self._check_cache_and_route(job.url, job.query, job.extraction_config, extraction_type)
+                for job, extraction_type in zip(jobs, extraction_types)
+            ))
+            results: List[Optional[Dict[str, Any]]] = [cached_result for _, cached_result in prepared]
+            
+            # Jobs without a cached result are crawled together
+            pending = [index for index, result in enumerate(results) if not result]
+            crawl_jobs = []
+            for index in pending:
+                job = jobs[index]
+                strategy = self.crawl4ai_client.build_extraction_strategy(job.query, job.extraction_config)
+                crawl_job = {"url": job.url}
+                if strategy:
+                    crawl_job["extraction_strategy"] = strategy
+                else:
+                    crawl_job["crawler_config"] = await self._optimized_crawl4ai_config(extraction_types[index])
+                crawl_jobs.append(crawl_job)
+            
+            try:
+                crawled = await self.crawl4ai_client.crawl_batch(crawl_jobs, return_exceptions=True) if crawl_jobs else []
+            except Exception as e:
+                crawled = [e] * len(crawl_jobs)
+            response_time = time.time() - start_time
+            
+            # Jobs whose crawl failed take scrape()'s fallbacks
+            fallbacks = []
+            for index, result in zip(pending, crawled):
+                job = jobs[index]
+                try:
+                    if isinstance(result, Exception):
+                        raise result
+                    results[index] = await self._finish_crawl4ai_scrape(
+                        job.url, job.query, result, extraction_types[index], prepared[index][0], response_time
+                    )
+                except Exception as e:
+                    self.logger.warning(f"⚠️ Optimized crawl4ai failed for {job.url}: {e}")
+                    if self.performance_optimizer:
+                        self.performance_optimizer.record_request_outcome(False)
+                    fallbacks.append(index)
+            
+            fallback_results = await asyncio.gather(*(
+                self._fallback_scrape(jobs[index].url, jobs[index].query, jobs[index].extraction_config)
+                for index in fallbacks
+            ))
+            for index, result in zip(fallbacks, fallback_results):
+                results[index] = result
+            
+            return results
+            
+        except Exception as e:
+            self.logger.error(f"❌ Batch scraping failed: {e}")
+            raise ScrapingError(f"Batch scraping failed: {e}")
+    
     async def natural_language_scrape(
         self,
         url: str,
@@ -379,6 +409,104 @@ class SwissKnifeScraper:
             self.logger.error(f"❌ Multi-modal scraping failed: {e}")
             raise ScrapingError(f"Multi-modal scraping failed: {e}")
     
+    async def _check_cache_and_route(
+        self,
+        url: str,
+        query: Optional[str],
+        extraction_config: Optional[Dict[str, Any]],
+        extraction_type: str
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Look up a cached result, then apply the optimizer's routing decision
+        
+        Returns (cache_key, cached_result); both are None without a performance optimizer.
+        """
+        if not self.performance_optimizer:
+            return None, None
+
+        # Check cache first
+        cache_key = self.performance_optimizer._generate_cache_key(
+            "scraper", "scrape", {"url": url, "query": query, "config": extraction_config}
+        )
+        cached_result = await self.performance_optimizer.get_cached_result(cache_key)
+        if cached_result:
+            self.logger.info("⚡ Cache hit - returning cached result")
+            return cache_key, cached_result
+
+        # Get intelligent routing decision
+        routing_decision = await self.performance_optimizer.intelligent_request_routing(
+            url, extraction_type, query
+        )
+        self.logger.info(f"🎯 Routing decision: {routing_decision}")
+
+        # Handle rate limiting
+        if "wait" in routing_decision:
+            wait_time = float(routing_decision.split("_")[-1].replace("s", ""))
+            self.logger.warning(f"⏳ Rate limited, waiting {wait_time}s")
+            await asyncio.sleep(wait_time)
+
+        return cache_key, None
+    
+    async def _optimized_crawl4ai_config(self, extraction_type: str) -> Dict[str, Any]:
+        """Crawler configuration tuned by the performance optimizer, if there is one"""
+        if self.performance_optimizer:
+            return await self.performance_optimizer.optimize_crawl4ai_config(extraction_type)
+        return {}
+    
+    async def _finish_crawl4ai_scrape(
+        self,
+        url: str,
+        query: Optional[str],
+        result: Dict[str, Any],
+        extraction_type: str,
+        cache_key: Optional[str],
+        response_time: float
+    ) -> Dict[str, Any]:
+        """Record metrics for a crawl4ai result, cache it if it succeeded, and wrap it like scrape()"""
+        # Record performance metrics
+        if self.performance_optimizer:
+            self.performance_optimizer.record_response_time('crawl4ai', response_time)
+            self.performance_optimizer.record_request_outcome(result.get("success", False))
+
+            # Cache successful results
+            if result.get("success"):
+                ttl = self.performance_optimizer.optimization_config['cache_ttl'].get(f'crawl4ai_{extraction_type}', 3600)
+                await self.performance_optimizer.set_cached_result(cache_key, result, ttl)
+
+        return {
+            "url": url,
+            "query": query,
+            "result": result,
+            "method": "crawl4ai_docker_primary_optimized",
+            "timestamp": datetime.now().isoformat(),
+            "source": "crawl4ai_docker_service",
+            "response_time": response_time,
+            "extraction_type": extraction_type
+        }
+    
+    async def _fallback_scrape(
+        self,
+        url: str,
+        query: Optional[str],
+        extraction_config: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Scrape without crawl4ai: adaptive extraction for queries, basic extraction otherwise"""
+        # FALLBACK 1: Use adaptive extraction if available
+        if self.extraction_engine and query:
+            self.logger.info("⚠️ Falling back to adaptive extraction engine")
+            result = await self.extraction_engine.analyze_and_extract(url, query)
+            return {
+                "url": url,
+                "query": query,
+                "result": result,
+                "method": "adaptive_extraction_fallback",
+                "timestamp": datetime.now().isoformat()
+            }
+
+        # FALLBACK 2: Basic extraction
+        self.logger.warning("⚠️ Using basic extraction fallback")
+        return await self._basic_scrape(url, extraction_config)
+    
     async def _basic_scrape(self, url: str, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Basic scraping fallback method"""
         # This would implement basic crawl4ai scraping
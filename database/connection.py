@@ -56,6 +56,7 @@ class DatabaseConnection(LoggingMixin):
                 self.settings.DATABASE_URL,
                 min_size=self.settings.DATABASE_MIN_CONNECTIONS,
                 max_size=self.settings.DATABASE_MAX_CONNECTIONS,
+                max_inactive_connection_lifetime=self.settings.DATABASE_MAX_INACTIVE_CONNECTION_LIFETIME,
                 command_timeout=self.settings.DATABASE_TIMEOUT,
                 server_settings={
                     'jit': 'off'  # Disable JIT for better performance on small queries
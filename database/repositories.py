@@ -14,6 +14,14 @@ from utils.logging import LoggingMixin
 from utils.exceptions import DatabaseError, NotFoundError
 
 
+# User columns that are safe to hand back to callers (everything but password_hash)
+USER_SAFE_COLUMNS = (
+    "id", "email", "username", "full_name", "avatar_url", "is_active",
+    "is_verified", "subscription_tier", "api_key", "created_at",
+    "updated_at", "last_login_at", "metadata"
+)
+
+
 class BaseRepository(LoggingMixin):
     """Base repository class with common CRUD operations"""
     
@@ -156,6 +164,8 @@ class BaseRepository(LoggingMixin):
 class UserRepository(BaseRepository):
     """Repository for user management"""
     
+    SAFE_COLUMNS = ", ".join(USER_SAFE_COLUMNS)
+    
     def __init__(self, db_connection: DatabaseConnection):
         super().__init__(db_connection, "users")
     
@@ -169,10 +179,59 @@ class UserRepository(BaseRepository):
             self.logger.error(f"Get user by email failed: {e}")
             raise DatabaseError(f"Get user by email failed: {e}")
     
+    async def get_by_email_for_auth(self, email: str) -> Optional[Dict[str, Any]]:
+        """Get user by email including the password hash, for credential checks"""
+        try:
+            query = f"SELECT {self.SAFE_COLUMNS}, password_hash FROM users WHERE email = $1"
+            result = await self.db.execute_query(query, email, fetch="one")
+            return dict(result) if result else None
+        except Exception as e:
+            self.logger.error(f"Get user by email for auth failed: {e}")
+            raise DatabaseError(f"Get user by email failed: {e}")
+    
+    async def get_safe_by_id(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Get user by ID without the password hash"""
+        try:
+            query = f"SELECT {self.SAFE_COLUMNS} FROM users WHERE id = $1"
+            result = await self.db.execute_query(query, user_id, fetch="one")
+            return dict(result) if result else None
+        except Exception as e:
+            self.logger.error(f"Get safe user by ID failed: {e}")
+            raise DatabaseError(f"Get user by ID failed: {e}")
+    
+    async def create_if_not_exists(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Create a user unless one with the same email already exists
+        
+        Returns:
+            Created user, or None if the email is already registered
+        """
+        try:
+            if 'id' not in data:
+                data['id'] = str(uuid.uuid4())
+            
+            columns = list(data.keys())
+            placeholders = [f'${i+1}' for i in range(len(columns))]
+            values = list(data.values())
+            
+            query = f"""
+                INSERT INTO users ({', '.join(columns)})
+                VALUES ({', '.join(placeholders)})
+                ON CONFLICT (email) DO NOTHING
+                RETURNING {self.SAFE_COLUMNS}
+            """
+            
+            result = await self.db.execute_query(query, *values, fetch="one")
+            return dict(result) if result else None
+            
+        except Exception as e:
+            self.logger.error(f"Create user if not exists failed: {e}")
+            raise DatabaseError(f"Create user failed: {e}")
+    
     async def get_by_api_key(self, api_key: str) -> Optional[Dict[str, Any]]:
         """Get user by API key"""
         try:
-            query = "SELECT * FROM users WHERE api_key = $1 AND is_active = true"
+            query = f"SELECT {self.SAFE_COLUMNS} FROM users WHERE api_key = $1 AND is_active = true"
             result = await self.db.execute_query(query, api_key, fetch="one")
             return dict(result) if result else None
         except Exception as e:
@@ -205,17 +264,74 @@ class SessionRepository(BaseRepository):
             self.logger.error(f"Get session by token failed: {e}")
             raise DatabaseError(f"Get session by token failed: {e}")
     
-    async def get_user_sessions(self, user_id: str) -> List[Dict[str, Any]]:
-        """Get all active sessions for a user"""
-        return await self.list(
-            filters={"user_id": user_id, "is_active": True},
-            order_by="created_at DESC"
-        )
+    async def get_session_with_user(self, session_token: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a valid session and its owning user in a single round trip
+        
+        User columns are prefixed with ``user__`` so they do not collide with
+        the session's own ``id``/``metadata``/timestamp columns.
+        """
+        try:
+            user_columns = ", ".join(f"u.{col} AS user__{col}" for col in USER_SAFE_COLUMNS)
+            query = f"""
+                SELECT s.*, {user_columns}
+                FROM sessions s
+                JOIN users u ON u.id = s.user_id
+                WHERE s.session_token = $1
+                AND s.is_active = true
+                AND (s.expires_at IS NULL OR s.expires_at > NOW())
+            """
+            result = await self.db.execute_query(query, session_token, fetch="one")
+            return dict(result) if result else None
+        except Exception as e:
+            self.logger.error(f"Get session with user failed: {e}")
+            raise DatabaseError(f"Get session with user failed: {e}")
+    
+    async def get_user_sessions(
+        self,
+        user_id: str,
+        limit: int = 50,
+        only_active: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Get a user's most recently used sessions, unexpired active ones only by default"""
+        try:
+            active_clause = """
+                AND is_active = true
+                AND (expires_at IS NULL OR expires_at > NOW())
+            """ if only_active else ""
+            
+            query = f"""
+                SELECT * FROM sessions
+                WHERE user_id = $1
+                {active_clause}
+                ORDER BY updated_at DESC
+                LIMIT $2
+            """
+            results = await self.db.execute_query(query, user_id, limit, fetch="all")
+            return [dict(row) for row in results]
+        except Exception as e:
+            self.logger.error(f"Get user sessions failed: {e}")
+            raise DatabaseError(f"Get user sessions failed: {e}")
     
     async def deactivate_session(self, session_id: str) -> bool:
         """Deactivate a session"""
         result = await self.update(session_id, {"is_active": False})
         return result is not None
+    
+    async def deactivate_user_sessions(self, user_id: str) -> int:
+        """Deactivate all active sessions for a user"""
+        try:
+            query = """
+                UPDATE sessions
+                SET is_active = false
+                WHERE user_id = $1 AND is_active = true
+            """
+            result = await self.db.execute_query(query, user_id)
+            # Extract number from result like "UPDATE 5"
+            return int(result.split()[-1]) if result else 0
+        except Exception as e:
+            self.logger.error(f"Deactivate user sessions failed: {e}")
+            raise DatabaseError(f"Deactivate user sessions failed: {e}")
 
 
 class ProjectRepository(BaseRepository):
@@ -510,8 +626,8 @@ class RepositoryManager:
     async def get_user_dashboard_data(self, user_id: str) -> Dict[str, Any]:
         """Get comprehensive dashboard data for a user"""
         try:
-            # Get user info
-            user = await self.users.get_by_id(user_id)
+            # Get user info; the dashboard never needs the password hash
+            user = await self.users.get_safe_by_id(user_id)
             if not user:
                 raise NotFoundError("User not found")
 
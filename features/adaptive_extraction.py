@@ -327,20 +327,19 @@ class AdaptiveExtractionEngine:
         """Select optimal extraction strategy"""
         strategy_scores = {}
 
+        # Loop invariants: parse the domain and fetch the content once
+        url_domain = urlparse(page_analysis["url"]).netloc
+        content = page_analysis.get("content", "")
+        success_history = self.success_history
+
         for strategy in self.strategies:
             # Base confidence from strategy
-            confidence = strategy.calculate_confidence(
-                page_analysis.get("content", ""),
-                user_query
-            )
+            confidence = strategy.calculate_confidence(content, user_query)
 
             # Adjust based on historical performance
-            url_domain = urlparse(page_analysis["url"]).netloc
-            history_key = f"{url_domain}_{strategy.name}"
-
-            if history_key in self.success_history:
-                historical_success = self.success_history[history_key]["success_rate"]
-                confidence = (confidence + historical_success) / 2
+            history = success_history.get(f"{url_domain}_{strategy.name}")
+            if history is not None:
+                confidence = (confidence + history["success_rate"]) / 2
 
             strategy_scores[strategy] = confidence
 
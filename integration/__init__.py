@@ -0,0 +1 @@
+# Integration scripts package
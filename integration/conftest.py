@@ -0,0 +1,129 @@
+"""
+Pytest configuration for the crawl4ai / Jina AI integration scripts
+
+Running the scripts together under pytest, e.g.
+
+    pytest integration/
+
+runs every test in this directory on one session-wide event loop. Each
+script declares the settings it needs in a module-level ``TEST_ENV``; they
+are applied around each of its tests only, so scripts with different
+settings never see each other's. The shared clients are opened once per
+distinct ``TEST_ENV`` and reused by every script with the same settings.
+Each script also runs on its own from the repository root, e.g.
+``python -m integration.test_crawl4ai_client``.
+
+The fixtures live here rather than in a root conftest so they never apply to
+the unit tests under tests/.
+"""
+
+import os
+from contextlib import AsyncExitStack, contextmanager
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Iterator, Tuple
+
+import pytest
+import pytest_asyncio
+from pytest_asyncio import is_async_test
+
+_INTEGRATION_DIR = Path(__file__).parent
+
+
+def pytest_collection_modifyitems(items):
+    """Run this directory's async tests on the session loop the shared clients were opened on"""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item) and item.path.is_relative_to(_INTEGRATION_DIR):
+            item.add_marker(session_loop, append=False)
+
+
+@contextmanager
+def _test_env(env: Dict[str, str]) -> Iterator[None]:
+    """Apply ``env`` on top of the real environment, with settings reloaded inside and after"""
+    from config.settings import get_settings
+
+    with pytest.MonkeyPatch.context() as patch:
+        for key, value in env.items():
+            if key not in os.environ:
+                patch.setenv(key, value)
+        get_settings.cache_clear()
+        try:
+            yield
+        finally:
+            get_settings.cache_clear()
+
+
+def _module_env(request) -> Dict[str, str]:
+    """The requesting test module's TEST_ENV"""
+    return getattr(request.module, "TEST_ENV", {})
+
+
+class _SharedClients:
+    """One client per kind and test settings, all closed when the session ends"""
+
+    def __init__(self, stack: AsyncExitStack):
+        self._stack = stack
+        self._clients: Dict[Tuple[str, FrozenSet[Tuple[str, str]]], Any] = {}
+
+    async def get(
+        self,
+        kind: str,
+        env: Dict[str, str],
+        open_client: Callable[[AsyncExitStack], Awaitable[Any]]
+    ) -> Any:
+        """Return the ``kind`` client opened under ``env``, opening it on first use"""
+        key = (kind, frozenset(env.items()))
+        if key not in self._clients:
+            with _test_env(env):
+                self._clients[key] = await open_client(self._stack)
+        return self._clients[key]
+
+
+@pytest.fixture(autouse=True)
+def integration_env(request):
+    """Give each test its own module's TEST_ENV settings"""
+    with _test_env(_module_env(request)):
+        yield
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_clients():
+    """Clients reused across the integration tests, keyed by their settings"""
+    async with AsyncExitStack() as stack:
+        yield _SharedClients(stack)
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def scraper(request, shared_clients):
+    """Initialized SwissKnifeScraper for the module's TEST_ENV, warmed up in the background"""
+    from core.scraper import SwissKnifeScraper
+    from integration.support import background_warmup
+
+    async def open_scraper(stack: AsyncExitStack) -> SwissKnifeScraper:
+        shared_scraper = await stack.enter_async_context(SwissKnifeScraper())
+        await stack.enter_async_context(background_warmup(shared_scraper))
+        return shared_scraper
+
+    return await shared_clients.get("scraper", _module_env(request), open_scraper)
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def crawl4ai_client(request, shared_clients):
+    """crawl4ai Docker client for the module's TEST_ENV"""
+    from services.crawl4ai_client import Crawl4aiDockerClient
+
+    async def open_client(stack: AsyncExitStack) -> Crawl4aiDockerClient:
+        return await stack.enter_async_context(Crawl4aiDockerClient())
+
+    return await shared_clients.get("crawl4ai", _module_env(request), open_client)
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def jina_client(request, shared_clients):
+    """Jina AI client for the module's TEST_ENV; one session, kept alive for the run"""
+    from services.jina_ai_client import JinaAIClient
+
+    async def open_client(stack: AsyncExitStack) -> JinaAIClient:
+        return await stack.enter_async_context(JinaAIClient())
+
+    return await shared_clients.get("jina", _module_env(request), open_client)
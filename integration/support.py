@@ -0,0 +1,270 @@
+"""
+Integration Script Support
+Shared helpers for the crawl4ai / Jina AI integration scripts; not used by the application
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import socket
+import sys
+import tempfile
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import aiohttp
+
+
+class ScrapeCache:
+    """
+    Stores scrape results as JSON files named by the sha256 of the request
+
+    Entries older than ``ttl`` seconds are treated as missing.
+    """
+
+    def __init__(self, directory: Optional[str] = None, ttl: float = 3600.0):
+        self.directory = directory or os.getenv("SCRAPE_CACHE_DIR", os.path.join("data", "scrape_cache"))
+        self.ttl = ttl
+
+    @staticmethod
+    def make_key(
+        url: str,
+        extraction_config: Optional[Dict[str, Any]] = None,
+        query: Optional[str] = None
+    ) -> str:
+        """Hash a scrape request into a cache key"""
+        request = json.dumps(["scrape", url, extraction_config, query], sort_keys=True, default=str)
+        return hashlib.sha256(request.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached value for ``key``, or None if missing or expired"""
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) >= self.ttl:
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, value: Dict[str, Any]):
+        """Store ``value`` under ``key``, replacing any previous entry atomically"""
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(value, f, default=str)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+def crawl4ai_reachable(endpoint: Optional[str] = None, timeout: float = 0.5) -> bool:
+    """
+    Whether a TCP connection to the crawl4ai Docker service can be opened
+
+    A single blocking connect, meant to run before the integration scripts
+    start any HTTP clients. When the container is down it fails within
+    ``timeout`` instead of after the full ``CRAWL4AI_TIMEOUT``.
+    """
+    parts = urlsplit(endpoint or os.getenv("CRAWL4AI_ENDPOINT", "http://localhost:11235"))
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+    try:
+        with socket.create_connection((parts.hostname or "localhost", port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+class ConnectionCounter:
+    """
+    Counts the connections an aiohttp session opens and reuses
+
+    Pass ``trace_config`` to the session; ``created`` counts new connections
+    and ``reused`` counts requests served on a keep-alive connection.
+    """
+
+    def __init__(self):
+        self.created = 0
+        self.reused = 0
+        self.trace_config = aiohttp.TraceConfig()
+        self.trace_config.on_connection_create_end.append(self._on_create)
+        self.trace_config.on_connection_reuseconn.append(self._on_reuse)
+
+    async def _on_create(self, session, context, params):
+        self.created += 1
+
+    async def _on_reuse(self, session, context, params):
+        self.reused += 1
+
+
+def connection_pool_state(client) -> Dict[str, Any]:
+    """Snapshot of a client's HTTP session and keep-alive pool"""
+    session = getattr(client, "session", None)
+    if session is None or session.closed:
+        return {"pooled": False, "connection_limit": 0, "limit_per_host": 0}
+
+    connector = session.connector
+    if connector is None:
+        return {"pooled": False, "connection_limit": 0, "limit_per_host": 0}
+    return {
+        "pooled": not connector.force_close,
+        "connection_limit": connector.limit,
+        "limit_per_host": connector.limit_per_host
+    }
+
+
+def apply_test_env(env: Dict[str, str]):
+    """Set a script's test settings for a standalone run; values already in the environment win"""
+    for key, value in env.items():
+        os.environ.setdefault(key, value)
+
+
+def run_main(main: Callable[[], Awaitable[int]]) -> int:
+    """Run a script's async ``main()`` and return its exit code, on uvloop when it is installed"""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main())
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(main())
+
+
+def write_lines(lines: List[str]):
+    """Write buffered output in one call and clear the buffer"""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        lines.clear()
+
+
+def scrape_succeeded(result: Dict[str, Any]) -> bool:
+    """Whether a ``scraper.scrape`` response carries a successful crawl result"""
+    inner = result.get("result")
+    return bool(inner and inner.get("success"))
+
+
+def scrape_cache_from_env(flag: str, ttl: float = 3600.0) -> Optional[ScrapeCache]:
+    """
+    Return a ``ScrapeCache`` when the environment variable ``flag`` is ``"1"``
+
+    Caching is opt-in so that, by default, every run exercises the live
+    services; set the flag for faster local iteration.
+    """
+    if os.getenv(flag) == "1":
+        return ScrapeCache(ttl=ttl)
+    return None
+
+
+async def cached_scrape(
+    scraper,
+    cache: Optional[ScrapeCache],
+    url: str,
+    extraction_config: Optional[Dict[str, Any]] = None,
+    query: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Run ``scraper.scrape`` through ``cache``
+
+    With no cache the scrape always goes to the scraper. Only successful
+    scrapes are stored. Cached entries keep the original ``method`` and
+    ``source`` fields, so callers can still check which path produced them.
+    """
+    if cache is None:
+        return await scraper.scrape(url, query=query, extraction_config=extraction_config)
+
+    key = cache.make_key(url, extraction_config, query)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    result = await scraper.scrape(url, query=query, extraction_config=extraction_config)
+    if scrape_succeeded(result):
+        cache.set(key, result)
+    return result
+
+
+async def cached_read_url(client, cache: Optional[ScrapeCache], url: str) -> Dict[str, Any]:
+    """
+    Run a Jina AI ``client.read_url`` through ``cache``
+
+    With no cache the request always goes to the Reader API. Only successful
+    reads are stored.
+    """
+    if cache is None:
+        return await client.read_url(url)
+
+    key = hashlib.sha256(json.dumps(["reader", url]).encode("utf-8")).hexdigest()
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    result = await client.read_url(url)
+    if result.get("success"):
+        cache.set(key, result)
+    return result
+
+
+# get_status() results per live scraper; entries go away with the scraper
+_status_cache: "weakref.WeakKeyDictionary[Any, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+
+
+async def cached_status(scraper) -> Dict[str, Any]:
+    """
+    Return ``scraper.get_status()``, fetched once per scraper instance
+
+    Status is stable for the lifetime of one initialized scraper, so repeated
+    checks within a test reuse the first result.
+    """
+    status = _status_cache.get(scraper)
+    if status is None:
+        status = _status_cache[scraper] = await scraper.get_status()
+    return status
+
+
+# get_service_status() results per live Jina AI client, with their expiry times
+_service_status_cache: "weakref.WeakKeyDictionary[Any, Tuple[float, Dict[str, Any]]]" = weakref.WeakKeyDictionary()
+
+
+async def cached_service_status(client, ttl: float = 60.0) -> Dict[str, Any]:
+    """
+    Return ``client.get_service_status()``, refetched at most every ``ttl`` seconds
+
+    The status reflects static configuration plus one Reader probe, so test
+    suites sharing a client within a run reuse the first result.
+    """
+    entry = _service_status_cache.get(client)
+    now = time.monotonic()
+    if entry is not None and entry[0] > now:
+        return entry[1]
+
+    status = await client.get_service_status()
+    _service_status_cache[client] = (now + ttl, status)
+    return status
+
+
+@asynccontextmanager
+async def background_warmup(scraper) -> AsyncIterator[asyncio.Task]:
+    """
+    Run ``scraper.warmup()`` as a background task for the duration of the block
+
+    The first real scrape then finds crawl4ai's browser pool already starting
+    instead of paying the cold start itself. A warm-up still running when the
+    block exits is cancelled, and its outcome is never raised.
+    """
+    task = asyncio.create_task(scraper.warmup())
+    try:
+        yield task
+    finally:
+        if not task.done():
+            task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Test Core Scraper Integration with crawl4ai Docker Service
+Validates that the core scraper prioritizes crawl4ai as the primary engine
+"""
+
+import json
+import os
+from contextlib import AsyncExitStack
+from datetime import datetime
+from typing import List, Optional
+
+# Minimal settings for these tests; values already in the environment win
+TEST_ENV = {
+    "SECRET_KEY": "test-secret-key-for-core-scraper-testing-only",
+    "CRAWL4AI_ENDPOINT": "http://localhost:11235",
+    "CRAWL4AI_TIMEOUT": "30",
+    "ENABLE_ADAPTIVE_EXTRACTION": "false",
+    "ENABLE_NATURAL_LANGUAGE_INTERFACE": "false",
+    "ENABLE_PROXY_ROTATION": "false",
+    "ENABLE_MULTIMODAL_PROCESSING": "false",
+    "ENABLE_CONTENT_INTELLIGENCE": "false",
+}
+
+# Print full tracebacks on failure only when debugging
+_DEBUG = os.environ.get("SCRAPER_TEST_DEBUG") == "1"
+
+from core.scraper import SwissKnifeScraper
+from integration.support import (
+    apply_test_env,
+    background_warmup,
+    cached_scrape,
+    cached_status,
+    crawl4ai_reachable,
+    run_main,
+    scrape_cache_from_env,
+    scrape_succeeded,
+    write_lines
+)
+
+# Successful scrapes are reused across runs for an hour when
+# SCRAPE_TEST_USE_CACHE=1; otherwise every scrape reaches crawl4ai
+_scrape_cache = scrape_cache_from_env("SCRAPE_TEST_USE_CACHE")
+
+# Shared sub-test inputs
+CSS_EXTRACTION_CONFIG = {
+    "css_selectors": {
+        "title": "h1",
+        "description": "p"
+    }
+}
+LLM_EXTRACTION_QUERY = "Extract the main title and description"
+LLM_EXTRACTION_CONFIG = {"llm": True}
+
+
+async def test_core_scraper_crawl4ai_integration(scraper):
+    """pytest entry point; uses the session's shared scraper"""
+    assert await run_core_scraper_checks(scraper)
+
+
+async def run_core_scraper_checks(scraper: Optional[SwissKnifeScraper] = None) -> bool:
+    """Test that core scraper uses crawl4ai Docker service as primary engine"""
+    # Output is buffered and written once per phase; failures are written straight away
+    log: List[str] = []
+    log.append("🚀 Testing Core Scraper crawl4ai Integration")
+    log.append("=" * 55)
+    
+    try:
+        # Test scraper initialization
+        async with AsyncExitStack() as stack:
+            if scraper is None:
+                scraper = await stack.enter_async_context(SwissKnifeScraper())
+                # Warm crawl4ai's browser pool while the status checks run
+                await stack.enter_async_context(background_warmup(scraper))
+            log.append("✅ Core scraper initialized successfully")
+            
+            # Test status to verify crawl4ai is primary
+            status = await cached_status(scraper)
+            log.append(f"📊 Scraper Status: {json.dumps(status, indent=2)}")
+            
+            # Verify crawl4ai is the primary component
+            if "crawl4ai_docker" in status.get("components", {}):
+                crawl4ai_status = status["components"]["crawl4ai_docker"]
+                if crawl4ai_status.get("priority") == "primary_engine":
+                    log.append("✅ crawl4ai Docker service confirmed as PRIMARY ENGINE")
+                    write_lines(log)
+                else:
+                    log.append("❌ crawl4ai Docker service not set as primary engine")
+                    write_lines(log)
+                    return False
+            else:
+                log.append("❌ crawl4ai Docker service not found in components")
+                write_lines(log)
+                return False
+            
+            # Test basic scraping via crawl4ai
+            log.append("\n🔍 Testing basic scraping via crawl4ai...")
+            result = await cached_scrape(scraper, _scrape_cache, "https://example.com")
+            
+            log.append(f"✅ Scrape successful: {scrape_succeeded(result)}")
+            log.append(f"📊 Method used: {result.get('method')}")
+            log.append(f"🔧 Source: {result.get('source')}")
+            
+            # Verify it used crawl4ai Docker service
+            if result.get("method") == "crawl4ai_docker_primary":
+                log.append("✅ Confirmed: Used crawl4ai Docker service as primary engine")
+                write_lines(log)
+            else:
+                log.append(f"❌ Expected crawl4ai_docker_primary, got: {result.get('method')}")
+                write_lines(log)
+                return False
+            
+            # Test CSS extraction via crawl4ai
+            log.append("\n🎯 Testing CSS extraction via crawl4ai...")
+            css_result = await cached_scrape(
+                scraper,
+                _scrape_cache,
+                "https://example.com",
+                extraction_config=CSS_EXTRACTION_CONFIG
+            )
+            
+            log.append(f"✅ CSS extraction successful: {scrape_succeeded(css_result)}")
+            log.append(f"📊 Method used: {css_result.get('method')}")
+            write_lines(log)
+            
+            # Test LLM extraction via crawl4ai
+            log.append("\n🤖 Testing LLM extraction via crawl4ai...")
+            llm_result = await cached_scrape(
+                scraper,
+                _scrape_cache,
+                "https://example.com",
+                query=LLM_EXTRACTION_QUERY,
+                extraction_config=LLM_EXTRACTION_CONFIG
+            )
+            
+            log.append(f"✅ LLM extraction successful: {scrape_succeeded(llm_result)}")
+            log.append(f"📊 Method used: {llm_result.get('method')}")
+            
+            log.append("\n🎉 All core scraper integration tests passed!")
+            write_lines(log)
+            return True
+            
+    except Exception as e:
+        log.append(f"❌ Test failed: {e}")
+        write_lines(log)
+        if _DEBUG:
+            import traceback
+            traceback.print_exc()
+        return False
+
+
+async def main():
+    """Main test execution"""
+    if not crawl4ai_reachable():
+        print(f"❌ crawl4ai Docker service is not running at {os.environ['CRAWL4AI_ENDPOINT']}")
+        print("\n❌ Core Scraper crawl4ai Integration: FAILED")
+        return 1
+    
+    success = await run_core_scraper_checks()
+    
+    if success:
+        print("\n✅ Core Scraper crawl4ai Integration: SUCCESSFUL")
+        print("🚀 crawl4ai Docker service is now the PRIMARY SCRAPING ENGINE")
+        exit_code = 0
+    else:
+        print("\n❌ Core Scraper crawl4ai Integration: FAILED")
+        exit_code = 1
+    
+    return exit_code
+
+
+if __name__ == "__main__":
+    apply_test_env(TEST_ENV)
+    exit(run_main(main))
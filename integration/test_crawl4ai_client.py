@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test crawl4ai Docker Client Integration
+Validates the new crawl4ai Docker client service
+"""
+
+import json
+import os
+from contextlib import AsyncExitStack
+from datetime import datetime
+from typing import List, Optional
+
+# Minimal settings for these tests; values already in the environment win
+TEST_ENV = {
+    "SECRET_KEY": "test-secret-key-for-crawl4ai-client-testing-only",
+    "CRAWL4AI_ENDPOINT": "http://localhost:11235",
+    "CRAWL4AI_TIMEOUT": "30",
+}
+
+from services.crawl4ai_client import Crawl4aiDockerClient
+from integration.support import apply_test_env, crawl4ai_reachable, run_main, write_lines
+
+
+async def test_crawl4ai_client(crawl4ai_client):
+    """pytest entry point; uses the session's shared client"""
+    assert await run_crawl4ai_client_checks(crawl4ai_client)
+
+
+async def run_crawl4ai_client_checks(client: Optional[Crawl4aiDockerClient] = None) -> bool:
+    """Test the crawl4ai Docker client, opening a dedicated one if none is given"""
+    # Output is buffered and written once per phase; failures are written straight away
+    log: List[str] = []
+    log.append("🚀 Testing crawl4ai Docker Client Integration")
+    log.append("=" * 50)
+    
+    try:
+        # Test basic crawling
+        async with AsyncExitStack() as stack:
+            if client is None:
+                client = await stack.enter_async_context(Crawl4aiDockerClient())
+            log.append("✅ Client initialized successfully")
+            
+            # Test service info
+            service_info = await client.get_service_info()
+            log.append(f"📊 Service Info: {service_info}")
+            write_lines(log)
+            
+            # Test single URL crawl
+            log.append("\n🔍 Testing single URL crawl...")
+            result = await client.crawl_url("https://example.com")
+            
+            log.append(f"✅ Crawl successful: {result['success']}")
+            log.append(f"📄 Content length: {len(result.get('html', ''))}")
+            log.append(f"📝 Markdown length: {len(result.get('markdown', ''))}")
+            log.append(f"⏱️ Processing time: {result.get('processing_time', 0)}s")
+            write_lines(log)
+            
+            # Test CSS extraction
+            log.append("\n🎯 Testing CSS extraction...")
+            css_result = await client.extract_with_css(
+                "https://example.com",
+                {"title": "h1", "description": "p"}
+            )
+            
+            log.append(f"✅ CSS extraction successful: {css_result['success']}")
+            if css_result.get('extracted_content'):
+                log.append(f"📊 Extracted data: {css_result['extracted_content']}")
+            
+            log.append("\n🎉 All tests passed!")
+            write_lines(log)
+            return True
+            
+    except Exception as e:
+        log.append(f"❌ Test failed: {e}")
+        write_lines(log)
+        return False
+
+
+async def main():
+    """Main test execution"""
+    if not crawl4ai_reachable():
+        print(f"❌ crawl4ai Docker service is not running at {os.environ['CRAWL4AI_ENDPOINT']}")
+        print("\n❌ crawl4ai Docker Client Integration: FAILED")
+        return 1
+    
+    success = await run_crawl4ai_client_checks()
+    
+    if success:
+        print("\n✅ crawl4ai Docker Client Integration: SUCCESSFUL")
+        exit_code = 0
+    else:
+        print("\n❌ crawl4ai Docker Client Integration: FAILED")
+        exit_code = 1
+    
+    return exit_code
+
+
+if __name__ == "__main__":
+    apply_test_env(TEST_ENV)
+    exit(run_main(main))
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Simple Jina AI Configuration Test
+Tests Jina AI integration with proper environment setup
+"""
+
+import asyncio
+import json
+from contextlib import AsyncExitStack
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Faster JSON output when orjson is installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# Required settings for these tests; values already in the environment win
+TEST_ENV = {
+    "SECRET_KEY": "test-secret-key-for-jina-ai-config-testing",
+    "JINA_API_KEY": "test-api-key",
+    "JINA_READER_ENDPOINT": "https://r.jina.ai",
+    "JINA_SEARCH_ENDPOINT": "https://s.jina.ai",
+}
+
+from services.jina_ai_client import JinaAIClient
+from integration.support import apply_test_env, cached_read_url, cached_service_status, run_main, scrape_cache_from_env, write_lines
+
+# Reader responses are reused across local runs for six hours when
+# JINA_TEST_USE_CACHE=1; otherwise every run hits the Reader API
+_reader_cache = scrape_cache_from_env("JINA_TEST_USE_CACHE", ttl=6 * 3600)
+
+# Environment files checked for a Jina AI API key
+CONFIG_FILES = [".env", ".env.docker"]
+
+# Test statuses counted as passing in the overall assessment
+PASSING_STATUSES = frozenset({"pass", "expected_auth_error"})
+
+
+def _check_config_file(path: str) -> Dict[str, Any]:
+    """Report whether ``path`` exists and sets JINA_API_KEY; blocking, run off the loop"""
+    try:
+        content = Path(path).read_text()
+    except FileNotFoundError:
+        return {"exists": False}
+    return {"exists": True, "has_jina_config": "JINA_API_KEY" in content}
+
+
+async def test_jina_ai_configuration(jina_client):
+    """pytest entry point; uses the session's shared client"""
+    results = await run_jina_ai_configuration_checks(jina_client)
+    assert results["configuration_status"] in ["excellent", "good"]
+
+
+async def run_jina_ai_configuration_checks(jina_client: Optional[JinaAIClient] = None) -> Dict[str, Any]:
+    """Test Jina AI configuration and integration, opening a dedicated client if none is given"""
+    # Output is buffered and written once per phase; failures are written straight away
+    log: List[str] = []
+    log.append("🚀 Testing Jina AI Configuration")
+    log.append("=" * 40)
+    
+    results = {
+        "timestamp": datetime.now().isoformat(),
+        "configuration_status": "unknown",
+        "tests": {}
+    }
+    
+    try:
+        # Test 1: Client Initialization
+        log.append("🔧 Testing Jina AI client initialization...")
+        async with AsyncExitStack() as stack:
+            if jina_client is None:
+                jina_client = await stack.enter_async_context(JinaAIClient())
+            log.append("✅ Jina AI client initialized successfully")
+            write_lines(log)
+            results["tests"]["client_initialization"] = {"status": "pass"}
+            
+            # Tests 2-4: the status and Reader calls and the configuration file
+            # reads are independent, so they are dispatched together (file reads
+            # on worker threads) and classified afterwards
+            status, reader_result, *config_checks = await asyncio.gather(
+                cached_service_status(jina_client),
+                cached_read_url(jina_client, _reader_cache, "https://example.com"),
+                *[asyncio.to_thread(_check_config_file, path) for path in CONFIG_FILES],
+                return_exceptions=True
+            )
+            
+            # Test 2: Service Status
+            log.append("\n📊 Testing service status...")
+            if isinstance(status, Exception):
+                log.append(f"❌ Service status test failed: {status}")
+                results["tests"]["service_status"] = {"status": "error", "error": str(status)}
+            else:
+                log.append(f"✅ Service status retrieved")
+                log.append(f"📊 API Key Configured: {status.get('api_key_configured', False)}")
+                log.append(f"🔗 Endpoints: {len(status.get('endpoints', {}))}")
+                
+                results["tests"]["service_status"] = {
+                    "status": "pass",
+                    "api_key_configured": status.get("api_key_configured", False),
+                    "endpoints_count": len(status.get("endpoints", {}))
+                }
+            
+            # Test 3: Reader API (Public endpoint test)
+            log.append("\n📖 Testing Jina AI Reader API...")
+            if isinstance(reader_result, Exception):
+                error_msg = str(reader_result)
+                if "401" in error_msg or "AuthenticationFailedError" in error_msg:
+                    log.append("⚠️ Reader API requires valid API key (expected with test key)")
+                    results["tests"]["reader_api"] = {
+                        "status": "expected_auth_error",
+                        "note": "Requires valid API key"
+                    }
+                else:
+                    log.append(f"❌ Reader API test failed: {reader_result}")
+                    results["tests"]["reader_api"] = {"status": "error", "error": error_msg}
+            elif reader_result.get("success"):
+                log.append("✅ Reader API working correctly")
+                log.append(f"📄 Content length: {len(reader_result.get('content', ''))}")
+                results["tests"]["reader_api"] = {
+                    "status": "pass",
+                    "content_length": len(reader_result.get("content", ""))
+                }
+            else:
+                log.append("⚠️ Reader API returned unsuccessful result")
+                results["tests"]["reader_api"] = {"status": "partial"}
+            
+            # Test 4: Configuration Files Check
+            log.append("\n📁 Checking configuration files...")
+            config_status = {}
+            
+            for config_file, file_status in zip(CONFIG_FILES, config_checks):
+                if isinstance(file_status, Exception):
+                    raise file_status
+                config_status[config_file] = file_status
+                if file_status["exists"]:
+                    log.append(f"✅ {config_file}: exists, Jina config: {file_status['has_jina_config']}")
+                else:
+                    log.append(f"⚠️ {config_file}: not found")
+            
+            results["tests"]["configuration_files"] = config_status
+            
+            # Overall assessment
+            passed_tests = 0
+            total_tests = 0
+            for test in results["tests"].values():
+                if isinstance(test, dict):
+                    total_tests += 1
+                    if test.get("status") in PASSING_STATUSES:
+                        passed_tests += 1
+            
+            if passed_tests >= total_tests * 0.8:
+                results["configuration_status"] = "excellent"
+            elif passed_tests >= total_tests * 0.6:
+                results["configuration_status"] = "good"
+            else:
+                results["configuration_status"] = "needs_improvement"
+            
+            log.append(f"\n📊 Configuration Status: {results['configuration_status'].upper()}")
+            log.append(f"📈 Tests Status: {passed_tests}/{total_tests}")
+            write_lines(log)
+            
+    except Exception as e:
+        log.append(f"❌ Configuration test failed: {e}")
+        write_lines(log)
+        results["configuration_status"] = "failed"
+        results["error"] = str(e)
+    
+    return results
+
+
+# Static setup guide written alongside the test results
+SETUP_GUIDE_FILE = "JINA_AI_SETUP_GUIDE.md"
+
+SETUP_GUIDE_CONTENT = """# Jina AI Configuration Guide
+
+## Step 1: Get Jina AI API Key
+
+1. Visit: https://jina.ai/
+2. Sign up for a free account
+3. Navigate to the API Keys section in your dashboard
+4. Generate a new API key
+5. Copy the API key (it will look like: jina_xxxxxxxxxxxxxxxxxxxx)
+
+## Step 2: Configure Environment Variables
+
+Add the following to your `.env` file:
+
+```bash
+# Jina AI Configuration
+JINA_API_KEY=your_actual_jina_api_key_here
+JINA_READER_ENDPOINT=https://r.jina.ai
+JINA_SEARCH_ENDPOINT=https://s.jina.ai
+JINA_EMBEDDINGS_ENDPOINT=https://api.jina.ai/v1/embeddings
+JINA_RERANKER_ENDPOINT=https://api.jina.ai/v1/rerank
+```
+
+## Step 3: Test Configuration
+
+Run the configuration test:
+```bash
+python -m integration.test_jina_ai_config_simple
+```
+
+## Step 4: Verify Integration
+
+Once configured, the Smart Scraper AI will use Jina AI for:
+- PDF document processing (via Reader API)
+- Web content analysis (via Reader API)
+- Text embeddings (via Embeddings API)
+- Document reranking (via Reranker API)
+- Web search capabilities (via Search API)
+
+## API Usage Limits
+
+- Free tier: 1,000 requests per month
+- Paid tiers available for higher usage
+- Check current limits at: https://jina.ai/pricing
+
+## Troubleshooting
+
+### Common Issues:
+1. **401 Authentication Error**: Invalid or missing API key
+2. **Rate Limiting**: Exceeded free tier limits
+3. **Network Issues**: Check internet connectivity
+
+### Solutions:
+1. Verify API key is correctly set in environment
+2. Check API usage in Jina AI dashboard
+3. Ensure proper network connectivity
+
+## Integration Status
+
+The Smart Scraper AI is now configured to use:
+- ✅ crawl4ai Docker service (Primary Scraping Engine)
+- ✅ Jina AI APIs (Core AI Processing Engine)
+
+This provides the complete intelligent web scraping stack as originally designed.
+"""
+_SETUP_GUIDE_BYTES = SETUP_GUIDE_CONTENT.encode("utf-8")
+
+
+async def create_jina_ai_setup_guide():
+    """Create a setup guide for Jina AI configuration"""
+    print("\n📝 Creating Jina AI Setup Guide...")
+    
+    # The guide is static, so the file is only rewritten when its bytes differ
+    guide_path = Path(SETUP_GUIDE_FILE)
+    try:
+        up_to_date = guide_path.read_bytes() == _SETUP_GUIDE_BYTES
+    except FileNotFoundError:
+        up_to_date = False
+    
+    if up_to_date:
+        print(f"✅ Setup guide up to date: {SETUP_GUIDE_FILE}")
+    else:
+        guide_path.write_bytes(_SETUP_GUIDE_BYTES)
+        print(f"✅ Setup guide created: {SETUP_GUIDE_FILE}")
+
+
+async def main():
+    """Main execution"""
+    print("🚀 Jina AI Configuration Test Suite")
+    print("=" * 50)
+    
+    # Run configuration test
+    results = await run_jina_ai_configuration_checks()
+    
+    # Save results, serialized in one call and written as bytes
+    if ORJSON_AVAILABLE:
+        Path("jina_ai_config_test_results.json").write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        Path("jina_ai_config_test_results.json").write_bytes(json.dumps(results, indent=2).encode("utf-8"))
+    
+    # Create setup guide
+    await create_jina_ai_setup_guide()
+    
+    print("\n" + "=" * 50)
+    print("📊 JINA AI CONFIGURATION TEST SUMMARY")
+    print("=" * 50)
+    print(f"🎯 Configuration Status: {results['configuration_status'].upper()}")
+    
+    if results["configuration_status"] in ["excellent", "good"]:
+        print("✅ Jina AI integration is properly configured")
+        print("🚀 Ready for production use with valid API key")
+        print("📖 See JINA_AI_SETUP_GUIDE.md for API key setup instructions")
+        return 0
+    else:
+        print("⚠️ Jina AI integration needs configuration")
+        print("📖 See JINA_AI_SETUP_GUIDE.md for setup instructions")
+        return 1
+
+
+if __name__ == "__main__":
+    apply_test_env(TEST_ENV)
+    exit(run_main(main))
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Test Jina AI Integration
+Validates that Jina AI APIs are properly integrated and functional
+"""
+
+import asyncio
+import json
+import os
+from contextlib import AsyncExitStack
+from datetime import datetime
+from typing import List, Optional
+
+# Minimal settings for these tests; values already in the environment win
+TEST_ENV = {
+    "SECRET_KEY": "test-secret-key-for-jina-ai-testing-only",
+    "JINA_API_KEY": "test-api-key",  # A real key in the environment takes precedence
+    "JINA_READER_ENDPOINT": "https://r.jina.ai",
+    "JINA_SEARCH_ENDPOINT": "https://s.jina.ai",
+    "ENABLE_MULTIMODAL_PROCESSING": "false",  # Disable for simple test
+}
+
+from services.jina_ai_client import JinaAIClient
+from utils.exceptions import ScrapingError
+from integration.support import (
+    ConnectionCounter,
+    apply_test_env,
+    cached_read_url,
+    cached_service_status,
+    connection_pool_state,
+    run_main,
+    scrape_cache_from_env,
+    write_lines
+)
+
+# Reader responses are reused across local runs for six hours when
+# JINA_TEST_USE_CACHE=1; otherwise every run hits the Reader API
+_reader_cache = scrape_cache_from_env("JINA_TEST_USE_CACHE", ttl=6 * 3600)
+
+# Print the full service status and tracebacks only when debugging
+_DEBUG = os.environ.get("SCRAPER_TEST_DEBUG") == "1"
+
+
+async def test_jina_ai_integration(jina_client):
+    """pytest entry point; uses the session's shared client"""
+    assert await run_jina_ai_integration_checks(jina_client)
+
+
+async def test_multimodal_jina_integration(jina_client):
+    """pytest entry point; uses the session's shared client"""
+    assert await run_multimodal_jina_checks(jina_client)
+
+
+async def test_jina_connection_reuse():
+    """pytest entry point; opens its own traced client"""
+    assert await run_connection_reuse_check()
+
+
+async def run_jina_ai_integration_checks(jina_client: Optional[JinaAIClient] = None) -> bool:
+    """Test Jina AI client integration, opening a dedicated client if none is given"""
+    # Output is buffered and written once per phase; failures are written straight away
+    log: List[str] = []
+    log.append("🚀 Testing Jina AI Integration")
+    log.append("=" * 40)
+    
+    try:
+        # Test Jina AI client initialization
+        async with AsyncExitStack() as stack:
+            if jina_client is None:
+                jina_client = await stack.enter_async_context(JinaAIClient())
+            log.append("✅ Jina AI client initialized successfully")
+            write_lines(log)
+            
+            # Service status and the API probes are independent, so they are
+            # dispatched together and reported in order once all have returned
+            api_key_valid = bool(jina_client.api_key) and jina_client.api_key != "test-api-key"
+            probes = {
+                "status": cached_service_status(jina_client),
+                "reader": cached_read_url(jina_client, _reader_cache, "https://example.com"),
+                "search": jina_client.search("artificial intelligence")
+            }
+            if api_key_valid:
+                probes["embeddings"] = jina_client.get_embeddings(["Hello world", "Test embedding"])
+                probes["reranker"] = jina_client.rerank(
+                    "machine learning",
+                    ["AI is the future", "Cats are cute", "Machine learning algorithms"]
+                )
+            results = dict(zip(probes, await asyncio.gather(*probes.values(), return_exceptions=True)))
+            
+            # Test service status
+            status = results["status"]
+            if isinstance(status, Exception):
+                raise status
+            if _DEBUG:
+                log.append(f"📊 Service Status: {json.dumps(status, indent=2)}")
+            else:
+                log.append(f"📊 Service Status: API key configured = {status.get('api_key_configured', False)}, Reader = {status.get('reader_status')}")
+            
+            # Test Reader API (doesn't require API key)
+            log.append("\n🔍 Testing Jina AI Reader API...")
+            reader_result = results["reader"]
+            if isinstance(reader_result, Exception):
+                log.append(f"⚠️ Reader API test failed (may be expected without API key): {reader_result}")
+            else:
+                log.append(f"✅ Reader API successful: {reader_result.get('success', False)}")
+                log.append(f"📄 Content length: {len(reader_result.get('content', ''))}")
+                log.append(f"🔧 Source: {reader_result.get('source')}")
+                
+                if reader_result.get("success"):
+                    log.append("✅ Confirmed: Jina AI Reader API is working")
+                else:
+                    log.append("⚠️ Reader API returned unsuccessful result")
+            
+            # Test Search API (may require API key)
+            log.append("\n🔍 Testing Jina AI Search API...")
+            search_result = results["search"]
+            if isinstance(search_result, Exception):
+                log.append(f"⚠️ Search API test failed (may require API key): {search_result}")
+            else:
+                log.append(f"✅ Search API successful: {search_result.get('success', False)}")
+                log.append(f"📊 Query: {search_result.get('query')}")
+                log.append(f"🔧 Source: {search_result.get('source')}")
+                
+                if search_result.get("success"):
+                    log.append("✅ Confirmed: Jina AI Search API is working")
+                else:
+                    log.append("⚠️ Search API returned unsuccessful result")
+            
+            # Test Embeddings API (requires API key)
+            if api_key_valid:
+                log.append("\n🤖 Testing Jina AI Embeddings API...")
+                embeddings_result = results["embeddings"]
+                if isinstance(embeddings_result, Exception):
+                    log.append(f"⚠️ Embeddings API test failed: {embeddings_result}")
+                else:
+                    log.append(f"✅ Embeddings API successful: {embeddings_result.get('success', False)}")
+                    log.append(f"📊 Embeddings count: {len(embeddings_result.get('embeddings', []))}")
+                    log.append(f"🔧 Model: {embeddings_result.get('model')}")
+            else:
+                log.append("\n⚠️ Skipping Embeddings API test (requires valid API key)")
+            
+            # Test Reranker API (requires API key)
+            if api_key_valid:
+                log.append("\n🎯 Testing Jina AI Reranker API...")
+                reranker_result = results["reranker"]
+                if isinstance(reranker_result, Exception):
+                    log.append(f"⚠️ Reranker API test failed: {reranker_result}")
+                else:
+                    log.append(f"✅ Reranker API successful: {reranker_result.get('success', False)}")
+                    log.append(f"📊 Results count: {len(reranker_result.get('results', []))}")
+                    log.append(f"🔧 Model: {reranker_result.get('model')}")
+            else:
+                log.append("\n⚠️ Skipping Reranker API test (requires valid API key)")
+            
+            log.append("\n🎉 Jina AI integration tests completed!")
+            write_lines(log)
+            return True
+            
+    except Exception as e:
+        log.append(f"❌ Test failed: {e}")
+        write_lines(log)
+        if _DEBUG:
+            import traceback
+            traceback.print_exc()
+        return False
+
+
+async def run_multimodal_jina_checks(jina_client: Optional[JinaAIClient] = None) -> bool:
+    """Test multimodal processing with Jina AI, opening a dedicated client if none is given"""
+    # Output is buffered and written once per phase; failures are written straight away
+    log: List[str] = []
+    log.append("\n🚀 Testing Multimodal Processing with Jina AI")
+    log.append("=" * 50)
+    
+    try:
+        # Imported on first use: the multimodal module pulls in the OCR and PDF
+        # libraries, which the other Jina AI checks do not need
+        from features.multimodal_processing import PDFAnalyzer
+        
+        async with AsyncExitStack() as stack:
+            if jina_client is None:
+                jina_client = await stack.enter_async_context(JinaAIClient())
+            log.append("✅ Jina AI client initialized for multimodal test")
+            write_lines(log)
+            
+            # Test PDF analyzer with Jina AI
+            pdf_analyzer = PDFAnalyzer(jina_ai_client=jina_client)
+            
+            # Test with a simple PDF URL (this would normally be a real PDF)
+            log.append("\n📄 Testing PDF processing with Jina AI...")
+            try:
+                # Note: This will test the Jina AI Reader path
+                pdf_result = await pdf_analyzer.process("https://example.com/sample.pdf")
+                
+                log.append(f"✅ PDF processing completed")
+                log.append(f"📊 Processing method: {pdf_result.get('processing_method', 'unknown')}")
+                log.append(f"🔧 Source: {pdf_result.get('source', 'unknown')}")
+                
+                if pdf_result.get("processing_method") == "jina_ai_reader":
+                    log.append("✅ Confirmed: PDF processing uses Jina AI Reader as PRIMARY")
+                else:
+                    log.append(f"⚠️ Expected jina_ai_reader, got: {pdf_result.get('processing_method')}")
+                
+            except Exception as e:
+                log.append(f"⚠️ PDF processing test failed: {e}")
+            
+            log.append("\n🎉 Multimodal Jina AI integration tests completed!")
+            write_lines(log)
+            return True
+            
+    except Exception as e:
+        log.append(f"❌ Multimodal test failed: {e}")
+        write_lines(log)
+        if _DEBUG:
+            import traceback
+            traceback.print_exc()
+        return False
+
+
+async def run_connection_reuse_check(requests: int = 3) -> bool:
+    """Check that sequential Reader calls open at most one connection and reuse it"""
+    log: List[str] = []
+    log.append("\n🔌 Testing Jina AI connection reuse")
+    log.append("=" * 40)
+    
+    # A dedicated client, so the counts cover these calls and nothing else
+    counter = ConnectionCounter()
+    async with JinaAIClient(trace_configs=[counter.trace_config]) as jina_client:
+        pool_state = connection_pool_state(jina_client)
+        
+        # Distinct URLs so none of the calls is joined to another or served from a cache
+        for i in range(requests):
+            try:
+                await jina_client.read_url(f"https://example.com/?reuse={i}")
+            except ScrapingError as e:
+                log.append(f"⚠️ Reader call {i + 1} failed (may be expected without API key): {e}")
+    
+    # One after another, every call after the first should find the first
+    # connection idle in the keep-alive pool
+    reuse_bound = 1
+    log.append(f"🔌 Keep-alive pool: {'Active' if pool_state['pooled'] else 'Inactive'}")
+    log.append(f"📊 Connections opened: {counter.created}, reused: {counter.reused}")
+    reused = pool_state["pooled"] and counter.created <= reuse_bound
+    if not reused:
+        log.append(f"❌ {requests} sequential Reader calls opened {counter.created} connections")
+    elif counter.created == 0:
+        log.append("⚠️ The Reader API could not be reached; no connections were opened")
+    else:
+        log.append(f"✅ {requests} sequential Reader calls shared {counter.created} connection")
+    write_lines(log)
+    return reused
+
+
+async def main():
+    """Main test execution"""
+    print("🚀 Starting Jina AI Integration Test Suite")
+    print("=" * 60)
+    
+    # The first two checks run on one client, so the second reuses the first's connections
+    async with JinaAIClient() as jina_client:
+        # Test basic Jina AI integration
+        basic_success = await run_jina_ai_integration_checks(jina_client)
+        
+        # Test multimodal integration
+        multimodal_success = await run_multimodal_jina_checks(jina_client)
+        
+    # Test connection reuse
+    reuse_success = await run_connection_reuse_check()
+    
+    overall_success = basic_success and multimodal_success and reuse_success
+    
+    if overall_success:
+        print("\n✅ Jina AI Integration: SUCCESSFUL")
+        print("🚀 Jina AI is now integrated as CORE AI PROCESSING ENGINE")
+        exit_code = 0
+    else:
+        print("\n❌ Jina AI Integration: PARTIAL SUCCESS")
+        print("⚠️ Some tests failed - check API key configuration")
+        exit_code = 1
+    
+    return exit_code
+
+
+if __name__ == "__main__":
+    apply_test_env(TEST_ENV)
+    exit(run_main(main))
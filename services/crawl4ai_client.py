@@ -5,11 +5,22 @@ Handles all communication with the crawl4ai Docker service on port 11235
 
 import asyncio
 import aiohttp
+import copy
 import logging
-from typing import Dict, Any, List, Optional, Union
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple, Union
 from datetime import datetime
 import json
 
+# Faster JSON decoding for large (HTML-bearing) crawl4ai responses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 from config.settings import get_settings
 from utils.exceptions import ScrapingError
 
@@ -20,13 +31,31 @@ class Crawl4aiDockerClient:
     Provides high-level interface to crawl4ai REST API
     """
     
-    def __init__(self, base_url: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        connector: Optional[aiohttp.BaseConnector] = None,
+        cache_ttl: Optional[float] = None,
+        cache_size: int = 128
+    ):
         self.settings = get_settings()
         self.base_url = base_url or self.settings.CRAWL4AI_ENDPOINT
         self.timeout = self.settings.CRAWL4AI_TIMEOUT
         self.logger = logging.getLogger(__name__)
         self.session: Optional[aiohttp.ClientSession] = None
         
+        # Optional connector shared with other clients; owned by the caller
+        self.connector = connector
+        
+        # Optional short-lived cache of plain (no extraction strategy) crawl
+        # results, off unless cache_ttl is given; oldest entries go first
+        self._cache_ttl = cache_ttl
+        self._cache_size = cache_size
+        self._html_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        
+        # Plain crawls currently on the wire, so identical concurrent calls share one request
+        self._inflight: Dict[str, asyncio.Future] = {}
+        
     async def __aenter__(self):
         """Async context manager entry"""
         await self.initialize()
@@ -40,23 +69,35 @@ class Crawl4aiDockerClient:
         """Initialize the client session"""
         if not self.session:
             timeout = aiohttp.ClientTimeout(total=self.timeout)
-            self.session = aiohttp.ClientSession(timeout=timeout)
+            self.session = aiohttp.ClientSession(
+                timeout=timeout,
+                connector=self.connector,
+                connector_owner=self.connector is None
+            )
             
             # Verify service health
             await self._health_check()
     
     async def close(self):
         """Close the client session"""
+        # Stop in-flight crawls before their session goes away
+        inflight = list(self._inflight.values())
+        self._inflight.clear()
+        for request in inflight:
+            request.cancel()
+        await asyncio.gather(*inflight, return_exceptions=True)
+        
         if self.session:
             await self.session.close()
             self.session = None
+        self._html_cache.clear()
     
     async def _health_check(self) -> bool:
         """Check if crawl4ai service is healthy"""
         try:
             async with self.session.get(f"{self.base_url}/health") as response:
                 if response.status == 200:
-                    health_data = await response.json()
+                    health_data = await self._read_json(response)
                     self.logger.info(f"✅ crawl4ai service healthy: {health_data.get('version')}")
                     return True
                 else:
@@ -64,6 +105,32 @@ class Crawl4aiDockerClient:
         except Exception as e:
             raise ScrapingError(f"Failed to connect to crawl4ai service: {e}")
     
+    @staticmethod
+    async def _read_json(response: aiohttp.ClientResponse) -> Any:
+        """Decode a JSON response body, using orjson when it is installed"""
+        body = await response.read()
+        if ORJSON_AVAILABLE:
+            return orjson.loads(body)
+        return json.loads(body)
+    
+    async def warmup(self) -> bool:
+        """
+        Prime crawl4ai's browser pool with a throwaway crawl
+        
+        The Docker service starts browser contexts lazily, so the first real
+        crawl otherwise pays the browser cold start.
+        
+        Returns:
+            True if the warm-up crawl completed
+        """
+        try:
+            await self.crawl_url("about:blank")
+            self.logger.info("🔥 crawl4ai browser pool warmed up")
+            return True
+        except ScrapingError as e:
+            self.logger.warning(f"⚠️ crawl4ai warm-up failed: {e}")
+            return False
+    
     async def crawl_url(
         self,
         url: str,
@@ -86,6 +153,21 @@ class Crawl4aiDockerClient:
         if not self.session:
             await self.initialize()
         
+        # Plain crawls of the same page are idempotent, so serve them from cache
+        cache_key = None
+        if not extraction_strategy:
+            cache_key = json.dumps([url, browser_config, crawler_config], sort_keys=True, default=str)
+            cached = self._html_cache.get(cache_key) if self._cache_ttl else None
+            if cached and time.monotonic() - cached[0] < self._cache_ttl:
+                self.logger.info(f"⚡ Serving cached crawl4ai result for {url}")
+                return copy.deepcopy(cached[1])
+            
+            # Join an identical crawl that is already in flight
+            inflight = self._inflight.get(cache_key)
+            if inflight is not None:
+                self.logger.info(f"⚡ Joining in-flight crawl4ai request for {url}")
+                return copy.deepcopy(await asyncio.shield(inflight))
+        
         # Build request payload
         payload = {
             "urls": [url],
@@ -97,6 +179,38 @@ class Crawl4aiDockerClient:
         if extraction_strategy:
             payload["extraction_strategy"] = extraction_strategy
         
+        if not cache_key:
+            return await self._post_crawl(payload, url)
+        
+        inflight = asyncio.ensure_future(self._post_crawl(payload, url))
+        self._inflight[cache_key] = inflight
+        try:
+            processed_result = await asyncio.shield(inflight)
+        finally:
+            if self._inflight.get(cache_key) is inflight:
+                del self._inflight[cache_key]
+        
+        if self._cache_ttl and processed_result["success"]:
+            self._cache_result(cache_key, processed_result)
+        return copy.deepcopy(processed_result)
+    
+    def _cache_result(self, cache_key: str, result: Dict[str, Any]):
+        """Cache a plain crawl result, dropping expired entries and then the oldest beyond cache_size"""
+        now = time.monotonic()
+        # Entries are kept in insertion order, so the expired ones are at the front
+        while self._html_cache:
+            stored_at, _ = next(iter(self._html_cache.values()))
+            if now - stored_at < self._cache_ttl:
+                break
+            self._html_cache.popitem(last=False)
+        
+        self._html_cache.pop(cache_key, None)
+        self._html_cache[cache_key] = (now, result)
+        while len(self._html_cache) > self._cache_size:
+            self._html_cache.popitem(last=False)
+    
+    async def _post_crawl(self, payload: Dict[str, Any], url: str) -> Dict[str, Any]:
+        """Send a single-URL crawl request and process the response"""
         try:
             self.logger.info(f"🔍 Crawling URL via crawl4ai Docker: {url}")
             
@@ -106,7 +220,7 @@ class Crawl4aiDockerClient:
             ) as response:
                 
                 if response.status == 200:
-                    result = await response.json()
+                    result = await self._read_json(response)
                     return self._process_crawl_result(result, url)
                 else:
                     error_text = await response.text()
@@ -159,7 +273,7 @@ class Crawl4aiDockerClient:
             ) as response:
                 
                 if response.status == 200:
-                    result = await response.json()
+                    result = await self._read_json(response)
                     return self._process_multiple_crawl_results(result, urls)
                 else:
                     error_text = await response.text()
@@ -170,34 +284,110 @@ class Crawl4aiDockerClient:
         except Exception as e:
             raise ScrapingError(f"Unexpected error during multi-crawl: {e}")
     
+    async def crawl_batch(
+        self,
+        jobs: List[Dict[str, Any]],
+        return_exceptions: bool = False
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Crawl several independent jobs with as few requests as possible
+        
+        Jobs that share the same extraction strategy and configs are sent as a
+        single multi-URL ``/crawl`` request; distinct groups run concurrently.
+        
+        Args:
+            jobs: List of dicts with ``url`` and optional ``extraction_strategy``,
+                ``browser_config`` and ``crawler_config`` keys
+            
+            return_exceptions: Put the exception of a failed request in its
+                jobs' places instead of a failed result
+            
+        Returns:
+            Crawl results in the same order as ``jobs``. A job whose request
+            failed gets a result with ``success`` False and an ``error_message``,
+            or the exception when ``return_exceptions`` is set.
+        """
+        if not self.session:
+            await self.initialize()
+        
+        # Group jobs by identical request configuration
+        groups: Dict[str, List[int]] = {}
+        for index, job in enumerate(jobs):
+            group_key = json.dumps(
+                [job.get("extraction_strategy"), job.get("browser_config"), job.get("crawler_config")],
+                sort_keys=True,
+                default=str
+            )
+            groups.setdefault(group_key, []).append(index)
+        
+        async def run_group(indices: List[int]) -> List[Dict[str, Any]]:
+            first = jobs[indices[0]]
+            options = {
+                "extraction_strategy": first.get("extraction_strategy"),
+                "browser_config": first.get("browser_config"),
+                "crawler_config": first.get("crawler_config")
+            }
+            if len(indices) == 1:
+                return [await self.crawl_url(first["url"], **options)]
+            return await self.crawl_multiple_urls([jobs[i]["url"] for i in indices], **options)
+        
+        self.logger.info(f"🔍 Crawling {len(jobs)} jobs in {len(groups)} request(s) via crawl4ai Docker")
+        group_results = await asyncio.gather(
+            *(run_group(indices) for indices in groups.values()),
+            return_exceptions=True
+        )
+        
+        results: List[Union[Dict[str, Any], Exception, None]] = [None] * len(jobs)
+        for indices, group_result in zip(groups.values(), group_results):
+            for position, index in enumerate(indices):
+                if isinstance(group_result, Exception) or position >= len(group_result):
+                    error = group_result if isinstance(group_result, Exception) else ScrapingError("No result returned")
+                    if return_exceptions:
+                        results[index] = error
+                        continue
+                    results[index] = {
+                        "url": jobs[index]["url"],
+                        "success": False,
+                        "error_message": str(error),
+                        "timestamp": datetime.now().isoformat(),
+                        "source": "crawl4ai_docker"
+                    }
+                else:
+                    results[index] = group_result[position]
+        
+        return results
+    
+    def build_extraction_strategy(
+        self,
+        query: Optional[str] = None,
+        extraction_config: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Build the extraction strategy payload for a query/config pair, if any"""
+        if query and extraction_config:
+            strategy = {"type": "llm", "query": query}
+            if extraction_config.get("schema"):
+                strategy["schema"] = extraction_config["schema"]
+            return strategy
+        if extraction_config and extraction_config.get("css_selectors"):
+            return {"type": "css", "selectors": extraction_config["css_selectors"]}
+        if extraction_config and extraction_config.get("xpath_expressions"):
+            return {"type": "xpath", "expressions": extraction_config["xpath_expressions"]}
+        return None
+    
     async def extract_with_css(self, url: str, css_selectors: Dict[str, str]) -> Dict[str, Any]:
         """Extract data using CSS selectors via crawl4ai"""
-        extraction_strategy = {
-            "type": "css",
-            "selectors": css_selectors
-        }
-        
+        extraction_strategy = self.build_extraction_strategy(extraction_config={"css_selectors": css_selectors})
         return await self.crawl_url(url, extraction_strategy=extraction_strategy)
     
     async def extract_with_xpath(self, url: str, xpath_expressions: Dict[str, str]) -> Dict[str, Any]:
         """Extract data using XPath expressions via crawl4ai"""
-        extraction_strategy = {
-            "type": "xpath",
-            "expressions": xpath_expressions
-        }
-        
+        extraction_strategy = self.build_extraction_strategy(extraction_config={"xpath_expressions": xpath_expressions})
         return await self.crawl_url(url, extraction_strategy=extraction_strategy)
     
     async def extract_with_llm(self, url: str, query: str, schema: Optional[Dict] = None) -> Dict[str, Any]:
         """Extract data using LLM-based extraction via crawl4ai"""
-        extraction_strategy = {
-            "type": "llm",
-            "query": query
-        }
-        
-        if schema:
-            extraction_strategy["schema"] = schema
-        
+        # Any extraction config alongside a query selects the LLM strategy
+        extraction_strategy = self.build_extraction_strategy(query, {"schema": schema})
         return await self.crawl_url(url, extraction_strategy=extraction_strategy)
     
     def _build_crawler_config(self, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -282,7 +472,7 @@ class Crawl4aiDockerClient:
         try:
             async with self.session.get(f"{self.base_url}/health") as response:
                 if response.status == 200:
-                    return await response.json()
+                    return await self._read_json(response)
                 else:
                     raise ScrapingError(f"Failed to get service info: HTTP {response.status}")
         except Exception as e:
@@ -5,8 +5,9 @@ Handles all communication with Jina AI APIs (Reader, Search, Embeddings, Reranke
 
 import asyncio
 import aiohttp
+import copy
 import logging
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, Awaitable, Callable, List, Optional, Union
 from datetime import datetime
 import json
 
@@ -20,12 +21,29 @@ class JinaAIClient:
     Provides high-level interface to all Jina AI APIs
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        connector: Optional[aiohttp.BaseConnector] = None,
+        max_concurrency: int = 10,
+        trace_configs: Optional[List[aiohttp.TraceConfig]] = None
+    ):
         self.settings = get_settings()
         self.api_key = api_key or self.settings.JINA_API_KEY
         self.logger = logging.getLogger(__name__)
         self.session: Optional[aiohttp.ClientSession] = None
         
+        # Optional connector shared with other clients; owned by the caller
+        self.connector = connector
+        
+        # Optional aiohttp request tracing, e.g. to count opened connections
+        self.trace_configs = trace_configs
+        
+        # Reader/Search calls beyond max_concurrency wait for a free slot, and
+        # identical calls already in flight are joined instead of repeated
+        self._request_slots = asyncio.Semaphore(max_concurrency)
+        self._inflight: Dict[str, asyncio.Future] = {}
+        
         # Jina AI endpoints
         self.reader_endpoint = self.settings.JINA_READER_ENDPOINT
         self.search_endpoint = self.settings.JINA_SEARCH_ENDPOINT
@@ -52,19 +70,61 @@ class JinaAIClient:
                 headers["Authorization"] = f"Bearer {self.api_key}"
             
             timeout = aiohttp.ClientTimeout(total=30)
+            # Without a shared connector the session keeps its own keep-alive
+            # pool, reused by every call to the Jina AI endpoints until close()
+            connector = self.connector or aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                keepalive_timeout=75,
+                ttl_dns_cache=300
+            )
             self.session = aiohttp.ClientSession(
                 headers=headers,
-                timeout=timeout
+                timeout=timeout,
+                connector=connector,
+                connector_owner=self.connector is None,
+                trace_configs=self.trace_configs
             )
             
             self.logger.info("✅ Jina AI client initialized")
     
     async def close(self):
         """Close the client session"""
+        # Stop in-flight requests before their session goes away
+        inflight = list(self._inflight.values())
+        self._inflight.clear()
+        for request in inflight:
+            request.cancel()
+        await asyncio.gather(*inflight, return_exceptions=True)
+        
         if self.session:
             await self.session.close()
             self.session = None
     
+    async def _bounded(self, request: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Run ``request()`` once a concurrency slot is free"""
+        async with self._request_slots:
+            return await request()
+    
+    async def _join_or_run(self, key: str, request: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Run ``request()`` unless an identical call is in flight, in which case share its result
+        
+        Every caller gets its own deep copy of the result.
+        """
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.logger.info("⚡ Joining in-flight Jina AI request")
+            return copy.deepcopy(await asyncio.shield(inflight))
+        
+        inflight = asyncio.ensure_future(self._bounded(request))
+        self._inflight[key] = inflight
+        try:
+            return copy.deepcopy(await asyncio.shield(inflight))
+        finally:
+            if self._inflight.get(key) is inflight:
+                del self._inflight[key]
+    
     async def read_url(self, url: str, options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Use Jina AI Reader API to extract content from URL
@@ -79,22 +139,27 @@ class JinaAIClient:
         if not self.session:
             await self.initialize()
         
+        # Add query parameters if provided
+        params = {}
+        if options:
+            if options.get("format"):
+                params["format"] = options["format"]
+            if options.get("summary"):
+                params["summary"] = "true"
+            if options.get("links"):
+                params["links"] = "true"
+            if options.get("images"):
+                params["images"] = "true"
+        
+        key = json.dumps(["reader", url, params], sort_keys=True)
+        return await self._join_or_run(key, lambda: self._read_url(url, params))
+    
+    async def _read_url(self, url: str, params: Dict[str, str]) -> Dict[str, Any]:
+        """Issue one Reader API request"""
         try:
             # Build Reader API URL
             reader_url = f"{self.reader_endpoint}/{url}"
             
-            # Add query parameters if provided
-            params = {}
-            if options:
-                if options.get("format"):
-                    params["format"] = options["format"]
-                if options.get("summary"):
-                    params["summary"] = "true"
-                if options.get("links"):
-                    params["links"] = "true"
-                if options.get("images"):
-                    params["images"] = "true"
-            
             self.logger.info(f"🔍 Reading URL via Jina AI Reader: {url}")
             
             async with self.session.get(reader_url, params=params) as response:
@@ -135,18 +200,23 @@ class JinaAIClient:
         if not self.session:
             await self.initialize()
         
+        # Add query parameters if provided
+        params = {}
+        if options:
+            if options.get("count"):
+                params["count"] = options["count"]
+            if options.get("format"):
+                params["format"] = options["format"]
+        
+        key = json.dumps(["search", query, params], sort_keys=True, default=str)
+        return await self._join_or_run(key, lambda: self._search(query, params))
+    
+    async def _search(self, query: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Issue one Search API request"""
         try:
             # Build Search API URL
             search_url = f"{self.search_endpoint}/{query}"
             
-            # Add query parameters if provided
-            params = {}
-            if options:
-                if options.get("count"):
-                    params["count"] = options["count"]
-                if options.get("format"):
-                    params["format"] = options["format"]
-            
             self.logger.info(f"🔍 Searching via Jina AI Search: {query}")
             
             async with self.session.get(search_url, params=params) as response:
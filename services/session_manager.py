@@ -3,10 +3,15 @@ Session Management Service
 Handles user authentication, session creation, and state management
 """
 
+import base64
+import json
+import time
 import secrets
 import hashlib
+import hmac
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
+from contextlib import asynccontextmanager
 import jwt
 from passlib.context import CryptContext
 
@@ -14,7 +19,25 @@ from database.connection import DatabaseConnection
 from database.repositories import RepositoryManager
 from config.settings import get_settings
 from utils.logging import LoggingMixin
-from utils.exceptions import AuthenticationError, AuthorizationError, NotFoundError
+from utils.exceptions import AuthenticationError, AuthorizationError, ConfigurationError, NotFoundError, DatabaseError
+
+
+# Distributed lock guarding password changes
+PASSWORD_LOCK_KEY = "pwlock:{user_id}"
+PASSWORD_LOCK_TTL = 10
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+# API keys look like "sk_<token>"; anything shorter than this is rejected without a lookup
+API_KEY_PREFIX = "sk_"
+API_KEY_MIN_LENGTH = 20
+
+# HS256 JWT header never changes, so encode it once
+_JWT_HEADER_B64 = base64.urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b"=")
 
 
 class SessionManager(LoggingMixin):
@@ -22,19 +45,27 @@ class SessionManager(LoggingMixin):
     Manages user sessions, authentication, and authorization
     """
     
-    def __init__(self, db_connection: DatabaseConnection):
+    def __init__(self, db_connection: DatabaseConnection, redis_client: Optional[Any] = None):
         super().__init__()
         self.db = db_connection
         self.repos = RepositoryManager(db_connection)
         self.settings = get_settings()
         
+        # Optional Redis client for the password-change lock; without one,
+        # concurrent password changes for a user are not serialized
+        self.redis_client = redis_client
+        
         # Password hashing
         self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
         
         # JWT settings
         self.jwt_secret = self.settings.JWT_SECRET_KEY
+        if not self.jwt_secret:
+            # An empty HMAC key would let anyone mint valid tokens
+            raise ConfigurationError("JWT_SECRET_KEY must be set to issue and validate session tokens")
         self.jwt_algorithm = "HS256"
         self.jwt_expiration = timedelta(hours=24)
+        self._jwt_secret_bytes = self.jwt_secret.encode("utf-8")
         
         # Session settings
         self.session_expiration = timedelta(days=30)
@@ -61,11 +92,6 @@ class SessionManager(LoggingMixin):
             Created user data (without password hash)
         """
         try:
-            # Check if user already exists
-            existing_user = await self.repos.users.get_by_email(email)
-            if existing_user:
-                raise AuthenticationError("User with this email already exists")
-            
             # Hash password
             password_hash = self.pwd_context.hash(password)
             
@@ -84,10 +110,10 @@ class SessionManager(LoggingMixin):
                 "subscription_tier": "free"
             }
             
-            user = await self.repos.users.create(user_data)
-            
-            # Remove sensitive data from response
-            user.pop("password_hash", None)
+            # Insert atomically; an empty result means the email is taken
+            user = await self.repos.users.create_if_not_exists(user_data)
+            if not user:
+                raise AuthenticationError("User with this email already exists")
             
             self.logger.info(f"User created: {email}")
             return user
@@ -109,7 +135,7 @@ class SessionManager(LoggingMixin):
         """
         try:
             # Get user by email
-            user = await self.repos.users.get_by_email(email)
+            user = await self.repos.users.get_by_email_for_auth(email)
             if not user:
                 raise AuthenticationError("Invalid email or password")
             
@@ -144,19 +170,24 @@ class SessionManager(LoggingMixin):
         Returns:
             User data if authentication successful
         """
+        # Reject malformed keys before touching the database
+        if not (
+            isinstance(api_key, str)
+            and api_key.startswith(API_KEY_PREFIX)
+            and len(api_key) >= API_KEY_MIN_LENGTH
+        ):
+            raise AuthenticationError("Invalid API key")
+        
         try:
             user = await self.repos.users.get_by_api_key(api_key)
-            if not user:
-                raise AuthenticationError("Invalid API key")
-            
-            # Remove sensitive data
-            user.pop("password_hash", None)
-            
-            return user
-            
-        except Exception as e:
+        except DatabaseError as e:
             self.logger.error(f"API key authentication failed: {e}")
             raise AuthenticationError(f"API key authentication failed: {e}")
+        
+        if not user or not hmac.compare_digest(api_key, user.get("api_key") or ""):
+            raise AuthenticationError("Invalid API key")
+        
+        return user
     
     async def create_session(
         self,
@@ -232,27 +263,30 @@ class SessionManager(LoggingMixin):
             User data if session is valid
         """
         try:
-            # Get session
-            session = await self.get_session(session_token)
-            if not session:
-                raise AuthenticationError("Invalid session token")
-            
-            # Get user
-            user = await self.repos.users.get_by_id(session["user_id"])
-            if not user or not user.get("is_active", False):
-                raise AuthenticationError("User account is inactive")
-            
-            # Remove sensitive data
-            user.pop("password_hash", None)
-            
-            return {
-                "user": user,
-                "session": session
-            }
-            
-        except Exception as e:
+            # Get session and user in one query
+            row = await self.repos.sessions.get_session_with_user(session_token)
+        except DatabaseError as e:
             self.logger.error(f"Session validation failed: {e}")
             raise AuthenticationError(f"Session validation failed: {e}")
+        
+        if not row:
+            raise AuthenticationError("Invalid session token")
+        
+        # Split the joined row into session and user parts
+        session, user = {}, {}
+        for key, value in row.items():
+            if key.startswith("user__"):
+                user[key[len("user__"):]] = value
+            else:
+                session[key] = value
+        
+        if not user.get("is_active", False):
+            raise AuthenticationError("User account is inactive")
+        
+        return {
+            "user": user,
+            "session": session
+        }
     
     async def deactivate_session(self, session_token: str) -> bool:
         """
@@ -280,18 +314,19 @@ class SessionManager(LoggingMixin):
             self.logger.error(f"Session deactivation failed: {e}")
             return False
     
-    async def get_user_sessions(self, user_id: str) -> List[Dict[str, Any]]:
+    async def get_user_sessions(self, user_id: str, limit: int = 50) -> List[Dict[str, Any]]:
         """
-        Get all active sessions for a user
+        Get active sessions for a user
         
         Args:
             user_id: User ID
+            limit: Maximum number of sessions to return
             
         Returns:
-            List of active sessions
+            List of active sessions, most recently used first
         """
         try:
-            return await self.repos.sessions.get_user_sessions(user_id)
+            return await self.repos.sessions.get_user_sessions(user_id, limit=limit)
         except Exception as e:
             self.logger.error(f"Get user sessions failed: {e}")
             return []
@@ -312,6 +347,31 @@ class SessionManager(LoggingMixin):
             self.logger.error(f"Session cleanup failed: {e}")
             return 0
     
+    @asynccontextmanager
+    async def _redis_lock(self, key: str, ttl: int):
+        """
+        Hold a Redis SET NX lock for the duration of the block
+        
+        Without a Redis client this is a no-op. The lock expires after ``ttl``
+        seconds so a crashed holder cannot wedge it.
+        """
+        if not self.redis_client:
+            yield
+            return
+        
+        nonce = secrets.token_hex(16)
+        acquired = await self.redis_client.set(key, nonce, nx=True, ex=ttl)
+        if not acquired:
+            raise AuthenticationError("Another update for this account is in progress")
+        
+        try:
+            yield
+        finally:
+            try:
+                await self.redis_client.eval(_RELEASE_LOCK_SCRIPT, 1, key, nonce)
+            except Exception as e:
+                self.logger.warning(f"Failed to release lock {key}: {e}")
+    
     async def generate_jwt_token(self, user_id: str, session_id: str) -> str:
         """
         Generate JWT token for API access
@@ -324,20 +384,31 @@ class SessionManager(LoggingMixin):
             JWT token string
         """
         try:
+            issued_at = int(time.time())
             payload = {
                 "user_id": user_id,
                 "session_id": session_id,
-                "exp": datetime.utcnow() + self.jwt_expiration,
-                "iat": datetime.utcnow()
+                "exp": issued_at + int(self.jwt_expiration.total_seconds()),
+                "iat": issued_at
             }
             
-            token = jwt.encode(payload, self.jwt_secret, algorithm=self.jwt_algorithm)
-            return token
+            return self._encode_jwt(payload)
             
         except Exception as e:
             self.logger.error(f"JWT token generation failed: {e}")
             raise AuthenticationError(f"Token generation failed: {e}")
     
+    def _encode_jwt(self, payload: Dict[str, Any]) -> str:
+        """Mint an HS256 JWT using the precomputed header"""
+        body = base64.urlsafe_b64encode(
+            json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
+        ).rstrip(b"=")
+        signing_input = _JWT_HEADER_B64 + b"." + body
+        signature = base64.urlsafe_b64encode(
+            hmac.new(self._jwt_secret_bytes, signing_input, hashlib.sha256).digest()
+        ).rstrip(b"=")
+        return (signing_input + b"." + signature).decode("ascii")
+    
     async def validate_jwt_token(self, token: str) -> Dict[str, Any]:
         """
         Validate JWT token
@@ -350,21 +421,26 @@ class SessionManager(LoggingMixin):
         """
         try:
             payload = jwt.decode(token, self.jwt_secret, algorithms=[self.jwt_algorithm])
-            
-            # Validate session is still active
-            session = await self.repos.sessions.get_by_id(payload["session_id"])
-            if not session or not session.get("is_active", False):
-                raise AuthenticationError("Session is no longer active")
-            
-            return payload
-            
         except jwt.ExpiredSignatureError:
             raise AuthenticationError("Token has expired")
         except jwt.InvalidTokenError:
             raise AuthenticationError("Invalid token")
-        except Exception as e:
+        
+        session_id = payload.get("session_id")
+        if not session_id:
+            raise AuthenticationError("Invalid token")
+        
+        # Validate session is still active
+        try:
+            session = await self.repos.sessions.get_by_id(session_id)
+        except DatabaseError as e:
             self.logger.error(f"JWT token validation failed: {e}")
             raise AuthenticationError(f"Token validation failed: {e}")
+        
+        if not session or not session.get("is_active", False):
+            raise AuthenticationError("Session is no longer active")
+        
+        return payload
     
     async def change_password(
         self, 
@@ -375,6 +451,9 @@ class SessionManager(LoggingMixin):
         """
         Change user password
         
+        Concurrent changes for the same user are rejected while one holds the
+        Redis lock; this only applies when the manager was given a redis_client.
+        
         Args:
             user_id: User ID
             current_password: Current password
@@ -384,20 +463,24 @@ class SessionManager(LoggingMixin):
             True if successful
         """
         try:
-            # Get user
-            user = await self.repos.users.get_by_id(user_id)
-            if not user:
-                raise NotFoundError("User not found")
-            
-            # Verify current password
-            if not self.pwd_context.verify(current_password, user["password_hash"]):
-                raise AuthenticationError("Current password is incorrect")
-            
-            # Hash new password
-            new_password_hash = self.pwd_context.hash(new_password)
-            
-            # Update password
-            await self.repos.users.update(user_id, {"password_hash": new_password_hash})
+            async with self._redis_lock(PASSWORD_LOCK_KEY.format(user_id=user_id), PASSWORD_LOCK_TTL):
+                # Get user
+                user = await self.repos.users.get_by_id(user_id)
+                if not user:
+                    raise NotFoundError("User not found")
+                
+                # Verify current password
+                if not self.pwd_context.verify(current_password, user["password_hash"]):
+                    raise AuthenticationError("Current password is incorrect")
+                
+                # Hash new password
+                new_password_hash = self.pwd_context.hash(new_password)
+                
+                # Update password
+                await self.repos.users.update(user_id, {"password_hash": new_password_hash})
+                
+                # Force re-login everywhere
+                await self.repos.sessions.deactivate_user_sessions(user_id)
             
             self.logger.info(f"Password changed for user: {user_id}")
             return True
@@ -434,7 +517,7 @@ class SessionManager(LoggingMixin):
     
     def _generate_api_key(self) -> str:
         """Generate secure API key"""
-        return f"sk_{secrets.token_urlsafe(32)}"
+        return f"{API_KEY_PREFIX}{secrets.token_urlsafe(32)}"
     
     async def get_session_statistics(self) -> Dict[str, Any]:
         """Get session statistics"""
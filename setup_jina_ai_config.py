@@ -7,6 +7,8 @@ Configures Jina AI API key and validates full integration
 import asyncio
 import os
 import json
+import stat
+import tempfile
 from datetime import datetime
 from typing import Dict, Any, Optional
 
@@ -64,24 +66,29 @@ class JinaAIConfigurator:
                 f.write(f"JINA_API_KEY={api_key}\n")
             return
         
-        # Read existing file
-        with open(file_path, 'r') as f:
-            lines = f.readlines()
-        
-        # Update or add JINA_API_KEY
-        updated = False
-        for i, line in enumerate(lines):
-            if line.startswith('JINA_API_KEY='):
-                lines[i] = f"JINA_API_KEY={api_key}\n"
-                updated = True
-                break
-        
-        if not updated:
-            lines.append(f"JINA_API_KEY={api_key}\n")
-        
-        # Write back to file
-        with open(file_path, 'w') as f:
-            f.writelines(lines)
+        # Stream into a sibling temp file, then atomically swap it in
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path) or ".")
+        try:
+            updated = False
+            with os.fdopen(fd, 'w') as out, open(file_path, 'r') as inp:
+                for line in inp:
+                    if not updated and line.startswith('JINA_API_KEY='):
+                        out.write(f"JINA_API_KEY={api_key}\n")
+                        updated = True
+                    else:
+                        out.write(line)
+                
+                # Add JINA_API_KEY if it was not present
+                if not updated:
+                    out.write(f"JINA_API_KEY={api_key}\n")
+            
+            # mkstemp creates the file 0600; keep the original file's mode
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(file_path).st_mode))
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
     
     async def validate_jina_ai_integration(self) -> Dict[str, Any]:
         """Validate complete Jina AI integration"""
@@ -108,78 +115,86 @@ class JinaAIConfigurator:
                 }
                 print(f"✅ Service status: API key configured = {status.get('api_key_configured')}")
                 
+                # Tests 2-4: Reader, Search and Embeddings APIs are independent,
+                # so dispatch them together and classify the results afterwards
+                print("\n📖 Testing Jina AI Reader, Search and Embeddings APIs...")
+                embeddings_enabled = bool(jina_client.api_key) and jina_client.api_key != "test-api-key"
+                
+                probes = [
+                    jina_client.read_url("https://example.com"),
+                    jina_client.search("artificial intelligence")
+                ]
+                if embeddings_enabled:
+                    probes.append(jina_client.get_embeddings(["test text"]))
+                
+                reader_result, search_result, *rest = await asyncio.gather(
+                    *probes, return_exceptions=True
+                )
+                
                 # Test 2: Reader API
-                print("\n📖 Testing Jina AI Reader API...")
-                try:
-                    reader_result = await jina_client.read_url("https://example.com")
-                    if reader_result.get("success"):
-                        validation_results["tests"]["reader_api"] = {
-                            "status": "pass",
-                            "content_length": len(reader_result.get("content", "")),
-                            "response_time": "< 5s"
-                        }
-                        print("✅ Reader API: Working correctly")
-                    else:
-                        validation_results["tests"]["reader_api"] = {
-                            "status": "fail",
-                            "error": "API returned unsuccessful result"
-                        }
-                        print("❌ Reader API: Returned unsuccessful result")
-                except Exception as e:
+                if isinstance(reader_result, Exception):
                     validation_results["tests"]["reader_api"] = {
                         "status": "error",
-                        "error": str(e)
+                        "error": str(reader_result)
+                    }
+                    print(f"❌ Reader API: {reader_result}")
+                elif reader_result.get("success"):
+                    validation_results["tests"]["reader_api"] = {
+                        "status": "pass",
+                        "content_length": len(reader_result.get("content", "")),
+                        "response_time": "< 5s"
+                    }
+                    print("✅ Reader API: Working correctly")
+                else:
+                    validation_results["tests"]["reader_api"] = {
+                        "status": "fail",
+                        "error": "API returned unsuccessful result"
                     }
-                    print(f"❌ Reader API: {e}")
+                    print("❌ Reader API: Returned unsuccessful result")
                 
                 # Test 3: Search API
-                print("\n🔍 Testing Jina AI Search API...")
-                try:
-                    search_result = await jina_client.search("artificial intelligence")
-                    if search_result.get("success"):
-                        validation_results["tests"]["search_api"] = {
-                            "status": "pass",
-                            "query": search_result.get("query"),
-                            "results_length": len(search_result.get("results", ""))
-                        }
-                        print("✅ Search API: Working correctly")
-                    else:
-                        validation_results["tests"]["search_api"] = {
-                            "status": "fail",
-                            "error": "API returned unsuccessful result"
-                        }
-                        print("❌ Search API: Returned unsuccessful result")
-                except Exception as e:
+                if isinstance(search_result, Exception):
                     validation_results["tests"]["search_api"] = {
                         "status": "error",
-                        "error": str(e)
+                        "error": str(search_result)
+                    }
+                    print(f"❌ Search API: {search_result}")
+                elif search_result.get("success"):
+                    validation_results["tests"]["search_api"] = {
+                        "status": "pass",
+                        "query": search_result.get("query"),
+                        "results_length": len(search_result.get("results", ""))
+                    }
+                    print("✅ Search API: Working correctly")
+                else:
+                    validation_results["tests"]["search_api"] = {
+                        "status": "fail",
+                        "error": "API returned unsuccessful result"
                     }
-                    print(f"❌ Search API: {e}")
+                    print("❌ Search API: Returned unsuccessful result")
                 
                 # Test 4: Embeddings API (requires valid API key)
-                if jina_client.api_key and jina_client.api_key != "test-api-key":
-                    print("\n🤖 Testing Jina AI Embeddings API...")
-                    try:
-                        embeddings_result = await jina_client.get_embeddings(["test text"])
-                        if embeddings_result.get("success"):
-                            validation_results["tests"]["embeddings_api"] = {
-                                "status": "pass",
-                                "embeddings_count": len(embeddings_result.get("embeddings", [])),
-                                "model": embeddings_result.get("model")
-                            }
-                            print("✅ Embeddings API: Working correctly")
-                        else:
-                            validation_results["tests"]["embeddings_api"] = {
-                                "status": "fail",
-                                "error": "API returned unsuccessful result"
-                            }
-                            print("❌ Embeddings API: Returned unsuccessful result")
-                    except Exception as e:
+                if embeddings_enabled:
+                    embeddings_result = rest[0]
+                    if isinstance(embeddings_result, Exception):
                         validation_results["tests"]["embeddings_api"] = {
                             "status": "error",
-                            "error": str(e)
+                            "error": str(embeddings_result)
+                        }
+                        print(f"❌ Embeddings API: {embeddings_result}")
+                    elif embeddings_result.get("success"):
+                        validation_results["tests"]["embeddings_api"] = {
+                            "status": "pass",
+                            "embeddings_count": len(embeddings_result.get("embeddings", [])),
+                            "model": embeddings_result.get("model")
+                        }
+                        print("✅ Embeddings API: Working correctly")
+                    else:
+                        validation_results["tests"]["embeddings_api"] = {
+                            "status": "fail",
+                            "error": "API returned unsuccessful result"
                         }
-                        print(f"❌ Embeddings API: {e}")
+                        print("❌ Embeddings API: Returned unsuccessful result")
                 else:
                     validation_results["tests"]["embeddings_api"] = {
                         "status": "skipped",
@@ -4,6 +4,9 @@ These 4 features make it a true Swiss knife vs. a regular scraper
 """
 
 class SwissKnifeDay1:
+    # Fixed attribute set: no per-instance __dict__
+    __slots__ = ("strategies", "content_types", "nlp_processor")
+    
     def __init__(self):
         self.strategies = []
         self.content_types = {}
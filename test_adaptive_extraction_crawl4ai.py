@@ -7,26 +7,45 @@ Validates that the adaptive extraction engine uses crawl4ai Docker service
 import asyncio
 import json
 import os
+import sys
+import traceback
 from datetime import datetime
+from typing import Callable, List
 
-# Set minimal environment for testing
-os.environ.setdefault("SECRET_KEY", "test-secret-key-for-adaptive-extraction-testing-only")
-os.environ.setdefault("CRAWL4AI_ENDPOINT", "http://localhost:11235")
-os.environ.setdefault("CRAWL4AI_TIMEOUT", "30")
+# Set minimal environment for testing (values already in the environment win)
+_TEST_ENV = {
+    "SECRET_KEY": "test-secret-key-for-adaptive-extraction-testing-only",
+    "CRAWL4AI_ENDPOINT": "http://localhost:11235",
+    "CRAWL4AI_TIMEOUT": "30",
+}
+os.environ.update({k: v for k, v in _TEST_ENV.items() if k not in os.environ})
+
+import aiohttp
 
 from services.crawl4ai_client import Crawl4aiDockerClient
 from features.adaptive_extraction import AdaptiveExtractionEngine
+from integration.support import run_main, write_lines
+from utils.exceptions import SwissKnifeException
 
 
 async def test_adaptive_extraction_crawl4ai():
     """Test that adaptive extraction uses crawl4ai Docker service"""
-    print("🚀 Testing Adaptive Extraction Engine with crawl4ai Docker")
-    print("=" * 60)
+    report: List[str] = []
+    try:
+        return await _run_adaptive_extraction_crawl4ai(report.append)
+    finally:
+        write_lines(report)
+
+
+async def _run_adaptive_extraction_crawl4ai(emit: Callable[[str], None]) -> bool:
+    """Adaptive extraction checks, reporting through ``emit``; failures are written immediately"""
+    emit("🚀 Testing Adaptive Extraction Engine with crawl4ai Docker")
+    emit("=" * 60)
     
     try:
         # Initialize crawl4ai client
         async with Crawl4aiDockerClient() as crawl4ai_client:
-            print("✅ crawl4ai Docker client initialized")
+            emit("✅ crawl4ai Docker client initialized")
             
             # Initialize adaptive extraction engine with crawl4ai client
             local_llm_config = {
@@ -38,55 +57,57 @@ async def test_adaptive_extraction_crawl4ai():
                 local_llm_config=local_llm_config,
                 crawl4ai_client=crawl4ai_client
             )
-            print("✅ Adaptive Extraction Engine initialized with crawl4ai client")
+            emit("✅ Adaptive Extraction Engine initialized with crawl4ai client")
             
-            # Test basic extraction
-            print("\n🔍 Testing basic adaptive extraction...")
-            result = await extraction_engine.analyze_and_extract(
-                "https://example.com",
-                "Extract the title and description"
+            # The three extractions are independent, so overlap their crawl4ai round-trips;
+            # their identical page fetches share a single in-flight request
+            emit("\n🔍 Running basic, CSS and LLM adaptive extractions concurrently...")
+            result, css_result, llm_result = await asyncio.gather(
+                extraction_engine.analyze_and_extract(
+                    "https://example.com",
+                    "Extract the title and description"
+                ),
+                extraction_engine.analyze_and_extract(
+                    "https://example.com",
+                    "Extract title using CSS selectors"
+                ),
+                extraction_engine.analyze_and_extract(
+                    "https://example.com",
+                    "What is the main purpose of this website?"
+                )
             )
             
-            print(f"✅ Extraction successful: {result.success}")
-            print(f"📊 Strategy used: {result.strategy_used}")
-            print(f"🎯 Confidence: {result.confidence:.2f}")
-            print(f"⏱️ Processing time: {result.processing_time:.2f}s")
+            # Test basic extraction
+            emit("\n🔍 Testing basic adaptive extraction...")
+            emit(f"✅ Extraction successful: {result.success}")
+            emit(f"📊 Strategy used: {result.strategy_used}")
+            emit(f"🎯 Confidence: {result.confidence:.2f}")
+            emit(f"⏱️ Processing time: {result.processing_time:.2f}s")
             
             if result.success and result.data:
-                print(f"📄 Data source: {result.data.get('source', 'unknown')}")
+                emit(f"📄 Data source: {result.data.get('source', 'unknown')}")
                 
                 # Verify it used crawl4ai Docker service
                 if "crawl4ai" in result.data.get("source", ""):
-                    print("✅ Confirmed: Used crawl4ai Docker service")
+                    emit("✅ Confirmed: Used crawl4ai Docker service")
                 else:
-                    print(f"⚠️ Unexpected source: {result.data.get('source')}")
+                    emit(f"⚠️ Unexpected source: {result.data.get('source')}")
             
             # Test CSS extraction
-            print("\n🎯 Testing CSS-based extraction...")
-            css_result = await extraction_engine.analyze_and_extract(
-                "https://example.com",
-                "Extract title using CSS selectors"
-            )
-            
-            print(f"✅ CSS extraction successful: {css_result.success}")
-            print(f"📊 Strategy used: {css_result.strategy_used}")
+            emit("\n🎯 Testing CSS-based extraction...")
+            emit(f"✅ CSS extraction successful: {css_result.success}")
+            emit(f"📊 Strategy used: {css_result.strategy_used}")
             
             # Test LLM extraction
-            print("\n🤖 Testing LLM-based extraction...")
-            llm_result = await extraction_engine.analyze_and_extract(
-                "https://example.com",
-                "What is the main purpose of this website?"
-            )
-            
-            print(f"✅ LLM extraction successful: {llm_result.success}")
-            print(f"📊 Strategy used: {llm_result.strategy_used}")
+            emit("\n🤖 Testing LLM-based extraction...")
+            emit(f"✅ LLM extraction successful: {llm_result.success}")
+            emit(f"📊 Strategy used: {llm_result.strategy_used}")
             
-            print("\n🎉 All adaptive extraction tests passed!")
+            emit("\n🎉 All adaptive extraction tests passed!")
             return True
             
-    except Exception as e:
-        print(f"❌ Test failed: {e}")
-        import traceback
+    except (SwissKnifeException, aiohttp.ClientError, AssertionError, asyncio.TimeoutError) as e:
+        sys.stderr.write(f"❌ Test failed: {e}\n")
         traceback.print_exc()
         return False
 
@@ -107,5 +128,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
-    exit(exit_code)
+    exit(run_main(main))
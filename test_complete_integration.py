@@ -6,278 +6,425 @@ Validates that crawl4ai Docker service and Jina AI are working as PRIMARY techno
 
 import asyncio
 import json
+import mmap
 import os
+import sys
+import traceback
 from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
 
-# Set minimal environment for testing
-os.environ.setdefault("SECRET_KEY", "test-secret-key-for-complete-integration-testing")
-os.environ.setdefault("CRAWL4AI_ENDPOINT", "http://localhost:11235")
-os.environ.setdefault("CRAWL4AI_TIMEOUT", "30")
-os.environ.setdefault("JINA_API_KEY", "test-api-key")
-os.environ.setdefault("ENABLE_ADAPTIVE_EXTRACTION", "true")
-os.environ.setdefault("ENABLE_MULTIMODAL_PROCESSING", "true")
-os.environ.setdefault("ENABLE_NATURAL_LANGUAGE_INTERFACE", "false")
-os.environ.setdefault("ENABLE_PROXY_ROTATION", "false")
-os.environ.setdefault("ENABLE_CONTENT_INTELLIGENCE", "false")
+# Set minimal environment for testing (values already in the environment win)
+_TEST_ENV = {
+    "SECRET_KEY": "test-secret-key-for-complete-integration-testing",
+    "CRAWL4AI_ENDPOINT": "http://localhost:11235",
+    "CRAWL4AI_TIMEOUT": "30",
+    "JINA_API_KEY": "test-api-key",
+    "ENABLE_ADAPTIVE_EXTRACTION": "true",
+    "ENABLE_MULTIMODAL_PROCESSING": "true",
+    "ENABLE_NATURAL_LANGUAGE_INTERFACE": "false",
+    "ENABLE_PROXY_ROTATION": "false",
+    "ENABLE_CONTENT_INTELLIGENCE": "false",
+}
+os.environ.update({k: v for k, v in _TEST_ENV.items() if k not in os.environ})
 
-from core.scraper import SwissKnifeScraper
+import aiohttp
+
+from core.scraper import SwissKnifeScraper, ScrapeJob
+from services.jina_ai_client import JinaAIClient
+from utils.exceptions import SwissKnifeException
+from integration.support import run_main, scrape_succeeded, write_lines
+
+# One connection pool for every HTTP call this module makes directly
+_shared_http_session: Optional[aiohttp.ClientSession] = None
+
+# PDF fixture for the multimodal check; the check is skipped when it is unreachable
+_MULTIMODAL_PDF_URL = "https://example.com/test.pdf"
+
+# Lazily created Jina AI client and its status, reused for the whole run
+_jina_client: Optional[JinaAIClient] = None
+_jina_status: Optional[Dict[str, Any]] = None
+_jina_lock = asyncio.Lock()
+
+
+def _shared_session() -> aiohttp.ClientSession:
+    """Return the module-wide HTTP session, creating it inside the running loop"""
+    global _shared_http_session
+    if _shared_http_session is None or _shared_http_session.closed:
+        connector = aiohttp.TCPConnector(limit=100, keepalive_timeout=30, ttl_dns_cache=300)
+        _shared_http_session = aiohttp.ClientSession(connector=connector)
+    return _shared_http_session
+
+
+async def _url_available(url: str, timeout: float = 1.0) -> bool:
+    """Cheap HEAD probe so checks against missing fixtures skip instead of timing out"""
+    try:
+        async with _shared_session().head(
+            url, timeout=aiohttp.ClientTimeout(total=timeout), allow_redirects=True
+        ) as response:
+            return response.status == 200
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        return False
+
+
+async def _jina() -> JinaAIClient:
+    """Return the module-wide Jina AI client, initializing it on first use"""
+    global _jina_client
+    async with _jina_lock:
+        if _jina_client is None:
+            client = JinaAIClient(connector=_shared_session().connector)
+            await client.initialize()
+            _jina_client = client
+    return _jina_client
+
+
+async def _jina_service_status() -> Dict[str, Any]:
+    """Return Jina AI service status, fetched once per process"""
+    global _jina_status
+    client = await _jina()
+    async with _jina_lock:
+        if _jina_status is None:
+            _jina_status = await client.get_service_status()
+    return _jina_status
+
+
+async def _close_shared_clients():
+    """Close the module-wide Jina AI client, HTTP session and connector"""
+    global _shared_http_session, _jina_client, _jina_status
+    if _jina_client is not None:
+        await _jina_client.close()
+        _jina_client = None
+        _jina_status = None
+    if _shared_http_session is not None:
+        await _shared_http_session.close()
+        _shared_http_session = None
+
+
+def _report_to(report: List[str]) -> Callable[[str], None]:
+    """Build an ``emit`` that buffers into ``report``; failures also go to stderr immediately"""
+    def emit(message: str):
+        report.append(message)
+        if message.lstrip().startswith("❌"):
+            sys.stderr.write(message + "\n")
+            sys.stderr.flush()
+    return emit
 
 
 async def test_complete_integration():
     """Test complete integration with crawl4ai and Jina AI as primary technologies"""
-    print("🚀 Complete Integration Test Suite")
-    print("=" * 50)
-    print("Testing: crawl4ai Docker + Jina AI as PRIMARY technologies")
-    print("=" * 50)
+    report: List[str] = []
+    try:
+        return await _run_complete_integration(_report_to(report))
+    finally:
+        write_lines(report)
+
+
+async def _run_complete_integration(emit: Callable[[str], None]) -> bool:
+    """Complete integration checks, reporting through ``emit``"""
+    emit("🚀 Complete Integration Test Suite")
+    emit("=" * 50)
+    emit("Testing: crawl4ai Docker + Jina AI as PRIMARY technologies")
+    emit("=" * 50)
     
     try:
         # Test complete scraper initialization
         async with SwissKnifeScraper() as scraper:
-            print("✅ SwissKnife Scraper initialized successfully")
+            emit("✅ SwissKnife Scraper initialized successfully")
+            
+            # Prime crawl4ai's browser pool so the timed scrapes below hit a hot browser
+            if await scraper.warmup():
+                emit("🔥 crawl4ai browser pool warmed up")
             
             # Test comprehensive status
-            print("\n📊 Testing comprehensive system status...")
-            status = await scraper.get_status()
+            emit("\n📊 Testing comprehensive system status...")
+            status = await scraper.get_status() or {}
             
-            print(f"🔧 System Status: {status.get('status')}")
-            print(f"⏱️ Uptime: {status.get('uptime_seconds', 0):.2f}s")
-            print(f"📈 Active Sessions: {status.get('active_sessions', 0)}")
+            emit(f"🔧 System Status: {status.get('status')}")
+            emit(f"⏱️ Uptime: {status.get('uptime_seconds', 0):.2f}s")
+            emit(f"📈 Active Sessions: {status.get('active_sessions', 0)}")
             
             # Verify PRIMARY technologies are present and healthy
-            components = status.get("components", {})
+            components = status.get("components") or {}
+            crawl4ai_status = components.get("crawl4ai_docker")
+            jina_ai_status = components.get("jina_ai")
             
             # Check crawl4ai Docker service (PRIMARY SCRAPING ENGINE)
-            if "crawl4ai_docker" in components:
-                crawl4ai_status = components["crawl4ai_docker"]
-                print(f"\n🚀 crawl4ai Docker Status: {crawl4ai_status.get('status')}")
-                print(f"🎯 Priority: {crawl4ai_status.get('priority')}")
+            if crawl4ai_status is not None:
+                emit(f"\n🚀 crawl4ai Docker Status: {crawl4ai_status.get('status')}")
+                emit(f"🎯 Priority: {crawl4ai_status.get('priority')}")
                 
                 if crawl4ai_status.get("priority") == "primary_scraping_engine":
-                    print("✅ CONFIRMED: crawl4ai Docker is PRIMARY SCRAPING ENGINE")
+                    emit("✅ CONFIRMED: crawl4ai Docker is PRIMARY SCRAPING ENGINE")
                 else:
-                    print("❌ ERROR: crawl4ai Docker not set as primary scraping engine")
+                    emit("❌ ERROR: crawl4ai Docker not set as primary scraping engine")
                     return False
             else:
-                print("❌ ERROR: crawl4ai Docker service not found in components")
+                emit("❌ ERROR: crawl4ai Docker service not found in components")
                 return False
             
             # Check Jina AI service (CORE AI PROCESSING ENGINE)
-            if "jina_ai" in components:
-                jina_ai_status = components["jina_ai"]
-                print(f"\n🤖 Jina AI Status: {jina_ai_status.get('status')}")
-                print(f"🎯 Priority: {jina_ai_status.get('priority')}")
+            if jina_ai_status is not None:
+                emit(f"\n🤖 Jina AI Status: {jina_ai_status.get('status')}")
+                emit(f"🎯 Priority: {jina_ai_status.get('priority')}")
                 
                 if jina_ai_status.get("priority") == "core_ai_processing_engine":
-                    print("✅ CONFIRMED: Jina AI is CORE AI PROCESSING ENGINE")
+                    emit("✅ CONFIRMED: Jina AI is CORE AI PROCESSING ENGINE")
                 else:
-                    print("❌ ERROR: Jina AI not set as core AI processing engine")
+                    emit("❌ ERROR: Jina AI not set as core AI processing engine")
                     return False
             else:
-                print("❌ ERROR: Jina AI service not found in components")
+                emit("❌ ERROR: Jina AI service not found in components")
                 return False
             
-            # Test PRIMARY scraping via crawl4ai Docker
-            print("\n🔍 Testing PRIMARY scraping via crawl4ai Docker...")
-            scrape_result = await scraper.scrape("https://example.com")
+            # Batch the plain, CSS and LLM scrapes into as few crawl4ai Docker requests as possible,
+            # and overlap them with the independent adaptive extraction
+            emit("\n🔍 Running PRIMARY, CSS, LLM and adaptive extractions via crawl4ai Docker concurrently...")
+            
+            async def adaptive_extraction():
+                if not scraper.extraction_engine:
+                    return None
+                return await scraper.extraction_engine.analyze_and_extract(
+                    "https://example.com",
+                    "Find the main heading and any price information"
+                )
             
-            print(f"✅ Scrape successful: {scrape_result.get('result', {}).get('success', False)}")
-            print(f"📊 Method used: {scrape_result.get('method')}")
-            print(f"🔧 Source: {scrape_result.get('source')}")
+            (scrape_result, css_result, llm_result), adaptive_result = await asyncio.gather(
+                scraper.scrape_batch([
+                    ScrapeJob("https://example.com"),
+                    ScrapeJob(
+                        "https://example.com",
+                        extraction_config={"css_selectors": {"title": "h1", "description": "p"}}
+                    ),
+                    ScrapeJob(
+                        "https://example.com",
+                        query="Extract the main title and description from this webpage"
+                    )
+                ]),
+                adaptive_extraction()
+            )
+            
+            # Test PRIMARY scraping via crawl4ai Docker
+            emit("\n🔍 Testing PRIMARY scraping via crawl4ai Docker...")
+            emit(f"✅ Scrape successful: {scrape_succeeded(scrape_result)}")
+            emit(f"📊 Method used: {scrape_result.get('method')}")
+            emit(f"🔧 Source: {scrape_result.get('source')}")
             
             # Verify it used crawl4ai Docker as primary
             if scrape_result.get("method") == "crawl4ai_docker_primary":
-                print("✅ CONFIRMED: Used crawl4ai Docker service as PRIMARY scraping method")
+                emit("✅ CONFIRMED: Used crawl4ai Docker service as PRIMARY scraping method")
             else:
-                print(f"❌ ERROR: Expected crawl4ai_docker_primary, got: {scrape_result.get('method')}")
+                emit(f"❌ ERROR: Expected crawl4ai_docker_primary, got: {scrape_result.get('method')}")
                 return False
             
             # Test CSS extraction via crawl4ai Docker
-            print("\n🎯 Testing CSS extraction via crawl4ai Docker...")
-            css_result = await scraper.scrape(
-                "https://example.com",
-                extraction_config={"css_selectors": {"title": "h1", "description": "p"}}
-            )
-            
-            print(f"✅ CSS extraction successful: {css_result.get('result', {}).get('success', False)}")
-            print(f"📊 Method used: {css_result.get('method')}")
+            emit("\n🎯 Testing CSS extraction via crawl4ai Docker...")
+            emit(f"✅ CSS extraction successful: {scrape_succeeded(css_result)}")
+            emit(f"📊 Method used: {css_result.get('method')}")
             
             if css_result.get("method") == "crawl4ai_docker_primary":
-                print("✅ CONFIRMED: CSS extraction uses crawl4ai Docker as PRIMARY")
+                emit("✅ CONFIRMED: CSS extraction uses crawl4ai Docker as PRIMARY")
             else:
-                print(f"⚠️ CSS extraction method: {css_result.get('method')}")
+                emit(f"⚠️ CSS extraction method: {css_result.get('method')}")
             
             # Test LLM extraction via crawl4ai Docker
-            print("\n🤖 Testing LLM extraction via crawl4ai Docker...")
-            llm_result = await scraper.scrape(
-                "https://example.com",
-                query="Extract the main title and description from this webpage"
-            )
-            
-            print(f"✅ LLM extraction successful: {llm_result.get('result', {}).get('success', False)}")
-            print(f"📊 Method used: {llm_result.get('method')}")
+            emit("\n🤖 Testing LLM extraction via crawl4ai Docker...")
+            emit(f"✅ LLM extraction successful: {scrape_succeeded(llm_result)}")
+            emit(f"📊 Method used: {llm_result.get('method')}")
             
             if llm_result.get("method") == "crawl4ai_docker_primary":
-                print("✅ CONFIRMED: LLM extraction uses crawl4ai Docker as PRIMARY")
+                emit("✅ CONFIRMED: LLM extraction uses crawl4ai Docker as PRIMARY")
             else:
-                print(f"⚠️ LLM extraction method: {llm_result.get('method')}")
+                emit(f"⚠️ LLM extraction method: {llm_result.get('method')}")
             
             # Test adaptive extraction with crawl4ai integration
-            if scraper.extraction_engine:
-                print("\n🎯 Testing Adaptive Extraction with crawl4ai integration...")
-                adaptive_result = await scraper.extraction_engine.analyze_and_extract(
-                    "https://example.com",
-                    "Find the main heading and any price information"
-                )
-                
-                print(f"✅ Adaptive extraction successful: {adaptive_result.success}")
-                print(f"📊 Strategy used: {adaptive_result.strategy_used}")
-                print(f"🎯 Confidence: {adaptive_result.confidence:.2f}")
+            if adaptive_result is not None:
+                emit("\n🎯 Testing Adaptive Extraction with crawl4ai integration...")
+                emit(f"✅ Adaptive extraction successful: {adaptive_result.success}")
+                emit(f"📊 Strategy used: {adaptive_result.strategy_used}")
+                emit(f"🎯 Confidence: {adaptive_result.confidence:.2f}")
                 
                 if adaptive_result.success and adaptive_result.data:
                     data_source = adaptive_result.data.get("source", "")
                     if "crawl4ai" in data_source:
-                        print("✅ CONFIRMED: Adaptive extraction uses crawl4ai Docker")
+                        emit("✅ CONFIRMED: Adaptive extraction uses crawl4ai Docker")
                     else:
-                        print(f"⚠️ Adaptive extraction source: {data_source}")
+                        emit(f"⚠️ Adaptive extraction source: {data_source}")
             
             # Test multimodal processing with Jina AI integration
             if scraper.multimodal_processor:
-                print("\n📄 Testing Multimodal Processing with Jina AI integration...")
-                try:
-                    # This will test the Jina AI integration path
-                    multimodal_result = await scraper.multimodal_processor.process_content(
-                        "https://example.com/test.pdf",
-                        "pdf"
-                    )
-                    
-                    print(f"✅ Multimodal processing completed")
-                    print(f"📊 Processing method: {multimodal_result.get('processing_method', 'unknown')}")
+                emit("\n📄 Testing Multimodal Processing with Jina AI integration...")
+                if not await _url_available(_MULTIMODAL_PDF_URL):
+                    emit(f"⏭️ Skipping multimodal PDF test (fixture not reachable: {_MULTIMODAL_PDF_URL})")
+                else:
+                    try:
+                        # This will test the Jina AI integration path
+                        multimodal_result = await scraper.multimodal_processor.process_content(
+                            _MULTIMODAL_PDF_URL,
+                            "pdf"
+                        )
+                        
+                        emit(f"✅ Multimodal processing completed")
+                        emit(f"📊 Processing method: {multimodal_result.get('processing_method', 'unknown')}")
+                        
+                        if multimodal_result.get("processing_method") == "jina_ai_reader":
+                            emit("✅ CONFIRMED: Multimodal processing uses Jina AI as PRIMARY")
+                        else:
+                            emit(f"⚠️ Multimodal processing method: {multimodal_result.get('processing_method')}")
                     
-                    if multimodal_result.get("processing_method") == "jina_ai_reader":
-                        print("✅ CONFIRMED: Multimodal processing uses Jina AI as PRIMARY")
-                    else:
-                        print(f"⚠️ Multimodal processing method: {multimodal_result.get('processing_method')}")
-                
-                except Exception as e:
-                    print(f"⚠️ Multimodal processing test failed (expected with test data): {e}")
+                    except Exception as e:
+                        emit(f"⚠️ Multimodal processing test failed: {e}")
             
-            print("\n🎉 All integration tests completed successfully!")
+            emit("\n🎉 All integration tests completed successfully!")
             return True
             
-    except Exception as e:
-        print(f"❌ Integration test failed: {e}")
-        import traceback
+    except (SwissKnifeException, aiohttp.ClientError, AssertionError, asyncio.TimeoutError) as e:
+        emit(f"❌ Integration test failed: {e}")
         traceback.print_exc()
         return False
 
 
 async def test_architectural_compliance():
     """Test architectural compliance with original project brief"""
-    print("\n🏗️ Testing Architectural Compliance")
-    print("=" * 40)
+    report: List[str] = []
+    try:
+        return await _run_architectural_compliance(_report_to(report))
+    finally:
+        write_lines(report)
+
+
+async def _probe_crawl4ai_service(emit: Callable[[str], None]) -> int:
+    """crawl4ai Docker service availability (40 points)"""
+    emit("🔍 Testing crawl4ai Docker service availability...")
+    try:
+        async with _shared_session().get("http://localhost:11235/health", timeout=5) as response:
+            if response.status == 200:
+                health_data = await response.json()
+                emit(f"✅ crawl4ai Docker service healthy: {health_data.get('version')}")
+                return 40
+            emit(f"❌ crawl4ai Docker service unhealthy: HTTP {response.status}")
+    except Exception as e:
+        emit(f"❌ crawl4ai Docker service not accessible: {e}")
+    return 0
+
+
+async def _probe_jina_ai(emit: Callable[[str], None]) -> int:
+    """Jina AI integration (30 points, 15 without an API key)"""
+    emit("\n🔍 Testing Jina AI integration...")
+    try:
+        status = await _jina_service_status()
+        if status.get("api_key_configured"):
+            emit("✅ Jina AI client properly configured")
+            return 30
+        emit("⚠️ Jina AI client configured but no API key")
+        return 15
+    except Exception as e:
+        emit(f"❌ Jina AI integration failed: {e}")
+    return 0
+
+
+async def _probe_docker_architecture(emit: Callable[[str], None]) -> int:
+    """crawl4ai service declared in docker-compose.yml (30 points)"""
+    emit("\n🔍 Testing Docker architecture...")
+    if not os.path.exists("docker-compose.yml"):
+        emit("❌ docker-compose.yml not found")
+        return 0
+    emit("✅ docker-compose.yml exists")
+    
+    # Check for crawl4ai service in docker-compose (byte scan, no decode)
+    has_crawl4ai_service = False
+    with open("docker-compose.yml", "rb") as f:
+        if os.fstat(f.fileno()).st_size > 0:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                has_crawl4ai_service = mm.find(b"crawl4ai:") != -1
+    
+    if has_crawl4ai_service:
+        emit("✅ crawl4ai service found in docker-compose.yml")
+        return 30
+    emit("❌ crawl4ai service not found in docker-compose.yml")
+    return 0
+
+
+async def _run_architectural_compliance(emit: Callable[[str], None]) -> bool:
+    """Architectural compliance checks, reporting through ``emit``"""
+    emit("\n🏗️ Testing Architectural Compliance")
+    emit("=" * 40)
     
-    compliance_score = 0
     max_score = 100
+    probes = (_probe_crawl4ai_service, _probe_jina_ai, _probe_docker_architecture)
     
     try:
-        # Test crawl4ai Docker service availability
-        print("🔍 Testing crawl4ai Docker service availability...")
-        import aiohttp
-        
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get("http://localhost:11235/health", timeout=5) as response:
-                    if response.status == 200:
-                        health_data = await response.json()
-                        print(f"✅ crawl4ai Docker service healthy: {health_data.get('version')}")
-                        compliance_score += 40
-                    else:
-                        print(f"❌ crawl4ai Docker service unhealthy: HTTP {response.status}")
-            except Exception as e:
-                print(f"❌ crawl4ai Docker service not accessible: {e}")
+        # The probes are independent, so run them together and report in a fixed order
+        probe_reports: List[List[str]] = [[] for _ in probes]
+        scores = await asyncio.gather(*(
+            probe(probe_report.append)
+            for probe, probe_report in zip(probes, probe_reports)
+        ))
+        for probe_report in probe_reports:
+            for line in probe_report:
+                emit(line)
+        compliance_score = sum(scores)
         
-        # Test Jina AI integration
-        print("\n🔍 Testing Jina AI integration...")
-        from services.jina_ai_client import JinaAIClient
-        
-        try:
-            async with JinaAIClient() as jina_client:
-                status = await jina_client.get_service_status()
-                if status.get("api_key_configured"):
-                    print("✅ Jina AI client properly configured")
-                    compliance_score += 30
-                else:
-                    print("⚠️ Jina AI client configured but no API key")
-                    compliance_score += 15
-        except Exception as e:
-            print(f"❌ Jina AI integration failed: {e}")
-        
-        # Test Docker architecture
-        print("\n🔍 Testing Docker architecture...")
-        if os.path.exists("docker-compose.yml"):
-            print("✅ docker-compose.yml exists")
-            
-            # Check for crawl4ai service in docker-compose
-            with open("docker-compose.yml", "r") as f:
-                compose_content = f.read()
-                if "crawl4ai:" in compose_content:
-                    print("✅ crawl4ai service found in docker-compose.yml")
-                    compliance_score += 30
-                else:
-                    print("❌ crawl4ai service not found in docker-compose.yml")
-        else:
-            print("❌ docker-compose.yml not found")
-        
-        print(f"\n📊 Architectural Compliance Score: {compliance_score}/{max_score}")
+        emit(f"\n📊 Architectural Compliance Score: {compliance_score}/{max_score}")
         
         if compliance_score >= 80:
-            print("✅ EXCELLENT: High architectural compliance")
+            emit("✅ EXCELLENT: High architectural compliance")
             return True
         elif compliance_score >= 60:
-            print("⚠️ GOOD: Acceptable architectural compliance")
+            emit("⚠️ GOOD: Acceptable architectural compliance")
             return True
         else:
-            print("❌ POOR: Low architectural compliance")
+            emit("❌ POOR: Low architectural compliance")
             return False
             
     except Exception as e:
-        print(f"❌ Compliance test failed: {e}")
+        emit(f"❌ Compliance test failed: {e}")
         return False
 
 
 async def main():
     """Main test execution"""
-    print("🚀 Starting Complete Integration Test Suite")
-    print("=" * 60)
-    print("Validating: crawl4ai Docker + Jina AI as PRIMARY technologies")
-    print("=" * 60)
+    write_lines([
+        "🚀 Starting Complete Integration Test Suite",
+        "=" * 60,
+        "Validating: crawl4ai Docker + Jina AI as PRIMARY technologies",
+        "=" * 60
+    ])
     
-    # Test complete integration
-    integration_success = await test_complete_integration()
-    
-    # Test architectural compliance
-    compliance_success = await test_architectural_compliance()
+    # Integration and compliance checks share no state, so run them together;
+    # each buffers its own report so the output does not interleave
+    try:
+        integration_success, compliance_success = await asyncio.gather(
+            test_complete_integration(),
+            test_architectural_compliance()
+        )
+    finally:
+        await _close_shared_clients()
     
     overall_success = integration_success and compliance_success
     
-    print("\n" + "=" * 60)
-    print("📊 FINAL INTEGRATION TEST RESULTS")
-    print("=" * 60)
+    summary = [
+        "\n" + "=" * 60,
+        "📊 FINAL INTEGRATION TEST RESULTS",
+        "=" * 60
+    ]
     
     if overall_success:
-        print("✅ COMPLETE INTEGRATION: SUCCESSFUL")
-        print("🚀 crawl4ai Docker service: PRIMARY SCRAPING ENGINE")
-        print("🤖 Jina AI: CORE AI PROCESSING ENGINE")
-        print("🏗️ Architecture: COMPLIANT with original project brief")
+        summary += [
+            "✅ COMPLETE INTEGRATION: SUCCESSFUL",
+            "🚀 crawl4ai Docker service: PRIMARY SCRAPING ENGINE",
+            "🤖 Jina AI: CORE AI PROCESSING ENGINE",
+            "🏗️ Architecture: COMPLIANT with original project brief"
+        ]
         exit_code = 0
     else:
-        print("❌ COMPLETE INTEGRATION: ISSUES DETECTED")
-        print("⚠️ Review test output for specific issues")
+        summary += [
+            "❌ COMPLETE INTEGRATION: ISSUES DETECTED",
+            "⚠️ Review test output for specific issues"
+        ]
         exit_code = 1
     
+    write_lines(summary)
     return exit_code
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
-    exit(exit_code)
+    exit(run_main(main))
@@ -5,12 +5,29 @@ Comprehensive validation of the complete Smart Scraper AI optimized pipeline
 """
 
 import asyncio
+import logging
 import os
 import json
+import queue
+import sys
 import time
 import statistics
+from collections import Counter
+from contextlib import AsyncExitStack, contextmanager
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Any, Tuple
+from logging.handlers import QueueHandler, QueueListener
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Faster JSON output when orjson is installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
 
 # Set environment for comprehensive testing
 os.environ.setdefault("SECRET_KEY", "test-secret-key-for-end-to-end-pipeline-testing")
@@ -22,12 +39,136 @@ os.environ.setdefault("ENABLE_NATURAL_LANGUAGE_INTERFACE", "false")
 os.environ.setdefault("ENABLE_PROXY_ROTATION", "false")
 os.environ.setdefault("ENABLE_CONTENT_INTELLIGENCE", "false")
 
-from core.scraper import SwissKnifeScraper
+from integration.support import connection_pool_state, run_main, scrape_succeeded
+
+if TYPE_CHECKING:
+    # The scraper stack is imported when the suite opens a scraper, so a failed
+    # environment check or import error surfaces without loading it
+    from core.scraper import SwissKnifeScraper
+
+# Scrapes kept in flight at once by the throughput benchmark and by each scenario
+THROUGHPUT_CONCURRENCY = 10
+SCENARIO_CONCURRENCY = 8
+
+# Raw latency samples are kept out of the JSON results, which hold only the summary
+LATENCY_SAMPLES_FILE = "latency_samples.npy"
+
+# Extraction config per scenario extraction type, shared by every scrape
+EXTRACTION_CONFIGS: Dict[str, Optional[Dict[str, Any]]] = {
+    "basic": None,
+    "css": {"css_selectors": {"title": "h1", "content": "p"}},
+    "xpath": {"xpath_expressions": {"title": "//h1/text()"}}
+}
+
+# Progress goes through a queue to a listener thread, so terminal writes never
+# hold the event loop while another task is inside a timed() block
+logger = logging.getLogger("e2e")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+logger.addHandler(QueueHandler(_log_queue))
+
+
+@contextmanager
+def log_listener() -> Iterator[None]:
+    """Write queued progress to stdout from a background thread; flushes on exit"""
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = QueueListener(_log_queue, handler)
+    listener.start()
+    try:
+        yield
+    finally:
+        listener.stop()
+
+
+@dataclass(slots=True)
+class Timing:
+    """Elapsed seconds of a ``timed()`` block, set when the block exits"""
+    elapsed: float = 0.0
+
+
+@contextmanager
+def timed() -> Iterator[Timing]:
+    """Time the enclosed block with ``time.perf_counter``; works around awaits too"""
+    timing = Timing()
+    start = time.perf_counter()
+    try:
+        yield timing
+    finally:
+        timing.elapsed = time.perf_counter() - start
+
+
+async def _run_with_workers(
+    func: Callable[[Any], Awaitable[Any]],
+    items: Sequence[Any],
+    concurrency: int
+) -> List[Any]:
+    """
+    Apply ``func`` to every item using a fixed pool of worker tasks
+    
+    Workers pull items from a queue, so only ``concurrency`` calls exist at
+    any time however many items there are. Results come back in item order;
+    a call that raised leaves its exception in its slot.
+    """
+    work: asyncio.Queue = asyncio.Queue()
+    for index, item in enumerate(items):
+        work.put_nowait((index, item))
+    results: List[Any] = [None] * len(items)
+    
+    async def worker():
+        while True:
+            try:
+                index, item = work.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                results[index] = await func(item)
+            except Exception as e:
+                results[index] = e
+    
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, len(items)))))
+    return results
 
 
 class EndToEndPipelineTester:
     """Comprehensive end-to-end pipeline testing"""
     
+    # Real-world test scenarios; constant, so shared by every tester
+    TEST_SCENARIOS = {
+        "basic_web_scraping": {
+            "urls": (
+                "https://example.com",
+                "https://httpbin.org/html",
+                "https://httpbin.org/json"
+            ),
+            "extraction_types": ("basic", "css", "xpath"),
+            "expected_success_rate": 0.9
+        },
+        "content_extraction": {
+            "urls": (
+                "https://news.ycombinator.com",
+                "https://github.com",
+                "https://stackoverflow.com"
+            ),
+            "queries": (
+                "Extract the main headlines and links",
+                "Find repository information and descriptions",
+                "Get question titles and vote counts"
+            ),
+            "expected_success_rate": 0.8
+        },
+        "multimodal_processing": {
+            "urls": (
+                "https://example.com/sample.pdf",
+                "https://httpbin.org/image/png",
+                "https://httpbin.org/xml"
+            ),
+            "content_types": ("pdf", "image", "xml"),
+            "expected_success_rate": 0.7
+        }
+    }
+    
     def __init__(self):
         self.test_results = {
             "test_suite_start": datetime.now().isoformat(),
@@ -37,46 +178,11 @@ class EndToEndPipelineTester:
             "stress_tests": {},
             "overall_metrics": {}
         }
-        
-        # Real-world test scenarios
-        self.test_scenarios = {
-            "basic_web_scraping": {
-                "urls": [
-                    "https://example.com",
-                    "https://httpbin.org/html",
-                    "https://httpbin.org/json"
-                ],
-                "extraction_types": ["basic", "css", "xpath"],
-                "expected_success_rate": 0.9
-            },
-            "content_extraction": {
-                "urls": [
-                    "https://news.ycombinator.com",
-                    "https://github.com",
-                    "https://stackoverflow.com"
-                ],
-                "queries": [
-                    "Extract the main headlines and links",
-                    "Find repository information and descriptions",
-                    "Get question titles and vote counts"
-                ],
-                "expected_success_rate": 0.8
-            },
-            "multimodal_processing": {
-                "urls": [
-                    "https://example.com/sample.pdf",
-                    "https://httpbin.org/image/png",
-                    "https://httpbin.org/xml"
-                ],
-                "content_types": ["pdf", "image", "xml"],
-                "expected_success_rate": 0.7
-            }
-        }
     
-    async def test_complete_pipeline_flow(self) -> Dict[str, Any]:
-        """Test the complete pipeline flow from request to response"""
-        print("🚀 Testing Complete Pipeline Flow")
-        print("=" * 50)
+    async def test_complete_pipeline_flow(self, scraper: "SwissKnifeScraper", init_time: float) -> Dict[str, Any]:
+        """Test the complete pipeline flow from request to response on the shared scraper"""
+        logger.info("🚀 Testing Complete Pipeline Flow")
+        logger.info("=" * 50)
         
         pipeline_results = {
             "initialization": {},
@@ -86,91 +192,97 @@ class EndToEndPipelineTester:
         }
         
         try:
-            # Test 1: System Initialization
-            print("🔧 Testing system initialization...")
-            start_time = time.time()
+            # Test 1: System Initialization (timed when the shared scraper was opened)
+            logger.info("🔧 Testing system initialization...")
+            pipeline_results["initialization"] = {
+                "success": True,
+                "initialization_time": init_time,
+                "components_loaded": True
+            }
+            logger.info(f"✅ System initialized in {init_time:.2f}s")
+            
+            # The status check and the first scrape are independent, so they
+            # run together; their results are reported in order below
+            test_url = "https://example.com"
+            
+            async def timed_scrape() -> Tuple[Dict[str, Any], float]:
+                with timed() as timing:
+                    scraped = await scraper.scrape(test_url)
+                return scraped, timing.elapsed
+            
+            status, (result, processing_time) = await asyncio.gather(
+                scraper.get_status(),
+                timed_scrape()
+            )
+            
+            # Test 2: Component Integration Validation
+            logger.info("\n📊 Testing component integration...")
+            components = status.get("components", {})
+            
+            required_components = [
+                "crawl4ai_docker",
+                "jina_ai", 
+                "performance_optimizer"
+            ]
+            
+            integration_status = {}
+            for component in required_components:
+                if component in components:
+                    comp_status = components[component].get("status")
+                    integration_status[component] = comp_status in ["healthy", "active"]
+                    logger.info(f"  ✅ {component}: {comp_status}")
+                else:
+                    integration_status[component] = False
+                    logger.info(f"  ❌ {component}: missing")
+            
+            pipeline_results["component_integration"] = {
+                "all_components_active": all(integration_status.values()),
+                "component_status": integration_status,
+                "total_components": len(components)
+            }
+            
+            # Test 3: Request Processing Pipeline
+            logger.info("\n🔍 Testing request processing pipeline...")
+            pipeline_results["request_processing"] = {
+                "success": result.get("result", {}).get("success", False),
+                "processing_time": processing_time,
+                "method_used": result.get("method"),
+                "optimization_active": "optimized" in result.get("method", ""),
+                "response_structure_valid": all(key in result for key in ["url", "result", "method", "timestamp"])
+            }
+            
+            logger.info(f"  ✅ Request processed in {processing_time:.2f}s")
+            logger.info(f"  📊 Method: {result.get('method')}")
+            logger.info(f"  ⚡ Optimization: {'Active' if 'optimized' in result.get('method', '') else 'Inactive'}")
+            
+            # Test 3b: Connection pooling on the crawl4ai client
+            pool_state = connection_pool_state(getattr(scraper, "crawl4ai_client", None))
+            pipeline_results["connection_pooling"] = pool_state
+            logger.info(f"  🔌 Keep-alive pool: {'Active' if pool_state['pooled'] else 'Inactive'}")
+            
+            # Test 4: Response Generation and Validation
+            logger.info("\n📤 Testing response generation...")
+            response_validation = {
+                "has_url": bool(result.get("url")),
+                "has_result": bool(result.get("result")),
+                "has_method": bool(result.get("method")),
+                "has_timestamp": bool(result.get("timestamp")),
+                "result_has_content": bool(result.get("result", {}).get("html") or result.get("result", {}).get("markdown")),
+                "performance_metrics_included": "response_time" in result
+            }
+            
+            valid_fields = sum(response_validation.values())
+            pipeline_results["response_generation"] = {
+                "response_complete": valid_fields == len(response_validation),
+                "validation_details": response_validation,
+                "content_length": len(result.get("result", {}).get("html", "")),
+                "metadata_present": bool(result.get("result", {}).get("metadata"))
+            }
+            
+            logger.info(f"  ✅ Response validation: {valid_fields}/{len(response_validation)} fields valid")
             
-            async with SwissKnifeScraper() as scraper:
-                init_time = time.time() - start_time
-                
-                pipeline_results["initialization"] = {
-                    "success": True,
-                    "initialization_time": init_time,
-                    "components_loaded": True
-                }
-                print(f"✅ System initialized in {init_time:.2f}s")
-                
-                # Test 2: Component Integration Validation
-                print("\n📊 Testing component integration...")
-                status = await scraper.get_status()
-                components = status.get("components", {})
-                
-                required_components = [
-                    "crawl4ai_docker",
-                    "jina_ai", 
-                    "performance_optimizer"
-                ]
-                
-                integration_status = {}
-                for component in required_components:
-                    if component in components:
-                        comp_status = components[component].get("status")
-                        integration_status[component] = comp_status in ["healthy", "active"]
-                        print(f"  ✅ {component}: {comp_status}")
-                    else:
-                        integration_status[component] = False
-                        print(f"  ❌ {component}: missing")
-                
-                pipeline_results["component_integration"] = {
-                    "all_components_active": all(integration_status.values()),
-                    "component_status": integration_status,
-                    "total_components": len(components)
-                }
-                
-                # Test 3: Request Processing Pipeline
-                print("\n🔍 Testing request processing pipeline...")
-                test_url = "https://example.com"
-                
-                # Test basic request processing
-                start_time = time.time()
-                result = await scraper.scrape(test_url)
-                processing_time = time.time() - start_time
-                
-                pipeline_results["request_processing"] = {
-                    "success": result.get("result", {}).get("success", False),
-                    "processing_time": processing_time,
-                    "method_used": result.get("method"),
-                    "optimization_active": "optimized" in result.get("method", ""),
-                    "response_structure_valid": all(key in result for key in ["url", "result", "method", "timestamp"])
-                }
-                
-                print(f"  ✅ Request processed in {processing_time:.2f}s")
-                print(f"  📊 Method: {result.get('method')}")
-                print(f"  ⚡ Optimization: {'Active' if 'optimized' in result.get('method', '') else 'Inactive'}")
-                
-                # Test 4: Response Generation and Validation
-                print("\n📤 Testing response generation...")
-                response_validation = {
-                    "has_url": bool(result.get("url")),
-                    "has_result": bool(result.get("result")),
-                    "has_method": bool(result.get("method")),
-                    "has_timestamp": bool(result.get("timestamp")),
-                    "result_has_content": bool(result.get("result", {}).get("html") or result.get("result", {}).get("markdown")),
-                    "performance_metrics_included": "response_time" in result
-                }
-                
-                pipeline_results["response_generation"] = {
-                    "response_complete": all(response_validation.values()),
-                    "validation_details": response_validation,
-                    "content_length": len(result.get("result", {}).get("html", "")),
-                    "metadata_present": bool(result.get("result", {}).get("metadata"))
-                }
-                
-                valid_fields = sum(response_validation.values())
-                print(f"  ✅ Response validation: {valid_fields}/{len(response_validation)} fields valid")
-                
         except Exception as e:
-            print(f"❌ Pipeline flow test failed: {e}")
+            logger.info(f"❌ Pipeline flow test failed: {e}")
             pipeline_results["error"] = str(e)
             return pipeline_results
         
@@ -188,190 +300,249 @@ class EndToEndPipelineTester:
             "health_breakdown": pipeline_health
         }
         
-        print(f"\n📊 Pipeline Health Score: {pipeline_results['overall_health']['health_score']:.1f}%")
+        logger.info(f"\n📊 Pipeline Health Score: {pipeline_results['overall_health']['health_score']:.1f}%")
         
         return pipeline_results
     
-    async def test_real_world_scenarios(self) -> Dict[str, Any]:
+    async def test_real_world_scenarios(self, scraper: "SwissKnifeScraper") -> Dict[str, Any]:
         """Test real-world scraping scenarios"""
-        print("\n🌍 Testing Real-World Scenarios")
-        print("=" * 40)
+        logger.info("\n🌍 Testing Real-World Scenarios")
+        logger.info("=" * 40)
         
         scenario_results = {}
         
-        async with SwissKnifeScraper() as scraper:
-            for scenario_name, scenario_config in self.test_scenarios.items():
-                print(f"\n📋 Testing scenario: {scenario_name}")
-                
-                scenario_start = time.time()
-                scenario_data = {
-                    "tests_run": 0,
-                    "tests_passed": 0,
-                    "response_times": [],
-                    "methods_used": [],
-                    "errors": []
-                }
-                
-                # Test URLs in scenario
-                urls = scenario_config.get("urls", [])
-                queries = scenario_config.get("queries", [None] * len(urls))
-                extraction_types = scenario_config.get("extraction_types", ["basic"] * len(urls))
-                
-                for i, url in enumerate(urls):
-                    try:
-                        query = queries[i] if i < len(queries) else None
-                        extraction_type = extraction_types[i] if i < len(extraction_types) else "basic"
-                        
-                        print(f"  🔍 Testing {url} ({extraction_type})")
-                        
-                        start_time = time.time()
-                        
-                        # Configure extraction based on type
-                        extraction_config = None
-                        if extraction_type == "css":
-                            extraction_config = {"css_selectors": {"title": "h1", "content": "p"}}
-                        elif extraction_type == "xpath":
-                            extraction_config = {"xpath_expressions": {"title": "//h1/text()"}}
-                        
-                        result = await scraper.scrape(url, query=query, extraction_config=extraction_config)
-                        response_time = time.time() - start_time
-                        
-                        scenario_data["tests_run"] += 1
-                        scenario_data["response_times"].append(response_time)
-                        scenario_data["methods_used"].append(result.get("method", "unknown"))
-                        
-                        success = result.get("result", {}).get("success", False)
-                        if success:
-                            scenario_data["tests_passed"] += 1
-                            print(f"    ✅ Success in {response_time:.2f}s")
-                        else:
-                            print(f"    ⚠️ Failed in {response_time:.2f}s")
-                        
-                    except Exception as e:
-                        scenario_data["errors"].append(str(e))
-                        print(f"    ❌ Error: {e}")
-                
-                # Calculate scenario metrics
-                scenario_time = time.time() - scenario_start
-                success_rate = scenario_data["tests_passed"] / scenario_data["tests_run"] if scenario_data["tests_run"] > 0 else 0
-                avg_response_time = statistics.mean(scenario_data["response_times"]) if scenario_data["response_times"] else 0
-                
-                scenario_results[scenario_name] = {
-                    "success_rate": success_rate,
-                    "expected_success_rate": scenario_config.get("expected_success_rate", 0.8),
-                    "meets_expectations": success_rate >= scenario_config.get("expected_success_rate", 0.8),
-                    "total_time": scenario_time,
-                    "average_response_time": avg_response_time,
-                    "tests_run": scenario_data["tests_run"],
-                    "tests_passed": scenario_data["tests_passed"],
-                    "methods_distribution": {method: scenario_data["methods_used"].count(method) for method in set(scenario_data["methods_used"])},
-                    "error_count": len(scenario_data["errors"])
-                }
-                
-                print(f"  📊 Success rate: {success_rate:.1%} (expected: {scenario_config.get('expected_success_rate', 0.8):.1%})")
-                print(f"  ⏱️ Average response time: {avg_response_time:.2f}s")
-                print(f"  {'✅' if scenario_results[scenario_name]['meets_expectations'] else '⚠️'} Expectations: {'Met' if scenario_results[scenario_name]['meets_expectations'] else 'Not Met'}")
-        
-        return scenario_results
-    
-    async def performance_benchmark_testing(self) -> Dict[str, Any]:
-        """Comprehensive performance benchmarking"""
-        print("\n⚡ Performance Benchmark Testing")
-        print("=" * 40)
-        
-        benchmark_results = {
-            "throughput_test": {},
-            "latency_test": {},
-            "concurrent_requests": {},
-            "cache_performance": {}
-        }
-        
-        async with SwissKnifeScraper() as scraper:
-            # Test 1: Throughput Testing
-            print("📈 Testing throughput...")
-            throughput_urls = ["https://example.com"] * 20
+        for scenario_name, scenario_config in self.TEST_SCENARIOS.items():
+            logger.info(f"\n📋 Testing scenario: {scenario_name}")
             
-            start_time = time.time()
-            throughput_results = []
+            scenario_data = {
+                "tests_run": 0,
+                "tests_passed": 0,
+                "response_times": [],
+                "methods_used": [],
+                "errors": []
+            }
             
-            for url in throughput_urls:
-                result = await scraper.scrape(url)
-                throughput_results.append(result.get("result", {}).get("success", False))
+            # Test URLs in scenario
+            urls = scenario_config.get("urls", [])
+            queries = scenario_config.get("queries", [None] * len(urls))
+            extraction_types = scenario_config.get("extraction_types", ["basic"] * len(urls))
             
-            throughput_time = time.time() - start_time
-            successful_requests = sum(throughput_results)
+            # The scenario's URLs are independent, so they are fetched together
+            jobs = [
+                (
+                    url,
+                    queries[i] if i < len(queries) else None,
+                    extraction_types[i] if i < len(extraction_types) else "basic"
+                )
+                for i, url in enumerate(urls)
+            ]
+            with timed() as scenario_timing:
+                outcomes = await _run_with_workers(
+                    lambda job: self._run_scenario_url(scraper, *job),
+                    jobs,
+                    SCENARIO_CONCURRENCY
+                )
             
-            benchmark_results["throughput_test"] = {
-                "total_requests": len(throughput_urls),
-                "successful_requests": successful_requests,
-                "total_time": throughput_time,
-                "requests_per_second": len(throughput_urls) / throughput_time,
-                "success_rate": successful_requests / len(throughput_urls)
-            }
+            for response_time, method, success, error in outcomes:
+                if error is not None:
+                    scenario_data["errors"].append(error)
+                    continue
+                scenario_data["tests_run"] += 1
+                scenario_data["response_times"].append(response_time)
+                scenario_data["methods_used"].append(method)
+                if success:
+                    scenario_data["tests_passed"] += 1
             
-            print(f"  📊 Throughput: {benchmark_results['throughput_test']['requests_per_second']:.2f} req/s")
-            print(f"  ✅ Success rate: {benchmark_results['throughput_test']['success_rate']:.1%}")
+            # Calculate scenario metrics
+            scenario_time = scenario_timing.elapsed
+            success_rate = scenario_data["tests_passed"] / scenario_data["tests_run"] if scenario_data["tests_run"] > 0 else 0
+            response_times = np.asarray(scenario_data["response_times"], dtype=np.float64)
+            avg_response_time = float(response_times.mean()) if response_times.size else 0
             
-            # Test 2: Latency Testing
-            print("\n⏱️ Testing latency distribution...")
-            latency_tests = 10
-            latencies = []
+            scenario_results[scenario_name] = {
+                "success_rate": success_rate,
+                "expected_success_rate": scenario_config.get("expected_success_rate", 0.8),
+                "meets_expectations": success_rate >= scenario_config.get("expected_success_rate", 0.8),
+                "total_time": scenario_time,
+                "average_response_time": avg_response_time,
+                "tests_run": scenario_data["tests_run"],
+                "tests_passed": scenario_data["tests_passed"],
+                "methods_distribution": dict(Counter(scenario_data["methods_used"])),
+                "error_count": len(scenario_data["errors"])
+            }
             
-            for i in range(latency_tests):
-                start_time = time.time()
-                await scraper.scrape("https://httpbin.org/delay/1")
-                latency = time.time() - start_time
-                latencies.append(latency)
+            logger.info(f"  📊 Success rate: {success_rate:.1%} (expected: {scenario_config.get('expected_success_rate', 0.8):.1%})")
+            logger.info(f"  ⏱️ Average response time: {avg_response_time:.2f}s")
+            logger.info(f"  {'✅' if scenario_results[scenario_name]['meets_expectations'] else '⚠️'} Expectations: {'Met' if scenario_results[scenario_name]['meets_expectations'] else 'Not Met'}")
+    
+        return scenario_results
+    
+    @staticmethod
+    async def _measure_throughput(scraper: "SwissKnifeScraper", urls: List[str]) -> Tuple[int, float]:
+        """Scrape ``urls`` through the worker pool; returns (successful requests, elapsed seconds)"""
+        # Requests overlap on the loop, bounded so the benchmark measures
+        # pipeline capacity rather than task scheduling
+        with timed() as timing:
+            results = await _run_with_workers(scraper.scrape, urls, THROUGHPUT_CONCURRENCY)
+        
+        successful_requests = 0
+        for result in results:
+            if isinstance(result, dict) and scrape_succeeded(result):
+                successful_requests += 1
+        return successful_requests, timing.elapsed
+    
+    async def _run_scenario_url(
+        self,
+        scraper: "SwissKnifeScraper",
+        url: str,
+        query: Optional[str],
+        extraction_type: str
+    ) -> Tuple[float, str, bool, Optional[str]]:
+        """Scrape one scenario URL; returns (response_time, method, success, error)"""
+        try:
+            logger.info(f"  🔍 Testing {url} ({extraction_type})")
             
-            benchmark_results["latency_test"] = {
-                "min_latency": min(latencies),
-                "max_latency": max(latencies),
-                "avg_latency": statistics.mean(latencies),
-                "median_latency": statistics.median(latencies),
-                "p95_latency": sorted(latencies)[int(0.95 * len(latencies))],
-                "latency_std": statistics.stdev(latencies) if len(latencies) > 1 else 0
-            }
+            # Configure extraction based on type
+            extraction_config = EXTRACTION_CONFIGS.get(extraction_type)
             
-            print(f"  📊 Average latency: {benchmark_results['latency_test']['avg_latency']:.2f}s")
-            print(f"  📊 P95 latency: {benchmark_results['latency_test']['p95_latency']:.2f}s")
+            with timed() as timing:
+                result = await scraper.scrape(url, query=query, extraction_config=extraction_config)
+            response_time = timing.elapsed
             
-            # Test 3: Cache Performance
-            print("\n💾 Testing cache performance...")
-            cache_test_url = "https://example.com"
+            success = scrape_succeeded(result)
+            if success:
+                logger.info(f"    ✅ {url} succeeded in {response_time:.2f}s")
+            else:
+                logger.info(f"    ⚠️ {url} failed in {response_time:.2f}s")
+            return response_time, result.get("method", "unknown"), success, None
             
-            # First request (cache miss)
-            start_time = time.time()
+        except Exception as e:
+            logger.info(f"    ❌ {url} error: {e}")
+            return 0.0, "unknown", False, str(e)
+    
+    async def performance_benchmark_testing(self, scraper: "SwissKnifeScraper") -> Dict[str, Any]:
+        """Comprehensive performance benchmarking"""
+        logger.info("\n⚡ Performance Benchmark Testing")
+        logger.info("=" * 40)
+        
+        benchmark_results = {
+            "throughput_test": {},
+            "latency_test": {},
+            "concurrent_requests": {},
+            "cache_performance": {}
+        }
+        
+        # Test 1: Throughput Testing
+        logger.info("📈 Testing throughput...")
+        # Distinct URLs measure uncached throughput. The same URL repeated is
+        # dispatched concurrently, so the crawl4ai client folds the copies into
+        # the request already in flight; that figure measures coalescing, not
+        # cache hits (the client's response cache is off here)
+        cold_urls = [f"https://httpbin.org/uuid?n={i}" for i in range(20)]
+        duplicate_urls = ["https://example.com"] * 20
+        
+        cold_successes, cold_time = await self._measure_throughput(scraper, cold_urls)
+        duplicate_successes, duplicate_time = await self._measure_throughput(scraper, duplicate_urls)
+        
+        benchmark_results["throughput_test"] = {
+            "total_requests": len(cold_urls),
+            "successful_requests": cold_successes,
+            "total_time": cold_time,
+            "requests_per_second": len(cold_urls) / cold_time,
+            "success_rate": cold_successes / len(cold_urls),
+            "requests_per_second_cold": len(cold_urls) / cold_time,
+            "requests_per_second_coalesced": len(duplicate_urls) / duplicate_time,
+            "coalesced_success_rate": duplicate_successes / len(duplicate_urls)
+        }
+        
+        logger.info(f"  📊 Throughput (uncached): {benchmark_results['throughput_test']['requests_per_second_cold']:.2f} req/s")
+        logger.info(f"  📊 Throughput (coalesced duplicate requests): {benchmark_results['throughput_test']['requests_per_second_coalesced']:.2f} req/s")
+        logger.info(f"  ✅ Success rate: {benchmark_results['throughput_test']['success_rate']:.1%}")
+        
+        # Test 2: Latency Testing
+        logger.info("\n⏱️ Testing latency distribution...")
+        latency_tests = 10
+        
+        async def timed_scrape(url: str) -> float:
+            with timed() as timing:
+                await scraper.scrape(url)
+            return timing.elapsed
+        
+        # Samples are taken concurrently, so this is the latency distribution
+        # under contention; each URL is distinct so the client does not fold
+        # them into one in-flight request
+        latencies = list(await asyncio.gather(*(
+            timed_scrape(f"https://httpbin.org/delay/1?sample={i}")
+            for i in range(latency_tests)
+        )))
+        
+        # Linear-interpolated percentile, the same as statistics' "inclusive" method
+        latency_array = np.asarray(latencies, dtype=np.float64)
+        benchmark_results["latency_test"] = {
+            "min_latency": float(latency_array.min()),
+            "max_latency": float(latency_array.max()),
+            "avg_latency": float(latency_array.mean()),
+            "median_latency": float(np.median(latency_array)),
+            "p95_latency": float(np.percentile(latency_array, 95)),
+            "latency_std": float(latency_array.std(ddof=1)) if latency_array.size > 1 else 0,
+            "raw_samples_file": LATENCY_SAMPLES_FILE
+        }
+        np.save(LATENCY_SAMPLES_FILE, latency_array.astype(np.float32))
+        
+        logger.info(f"  📊 Average latency: {benchmark_results['latency_test']['avg_latency']:.2f}s")
+        logger.info(f"  📊 P95 latency: {benchmark_results['latency_test']['p95_latency']:.2f}s")
+        
+        # Test 3: Cache Performance
+        logger.info("\n💾 Testing cache performance...")
+        # A URL no earlier test scraped, so the first request is a real miss
+        cache_test_url = "https://example.com/?cache-test"
+        
+        # Warm DNS, TLS and the crawl4ai path for the host with a sibling URL,
+        # which leaves the test URL uncached; the timing difference below is
+        # then down to the cache alone
+        await scraper.scrape("https://example.com/?cache-warmup")
+        
+        # First request (cache miss)
+        with timed() as timing:
             first_result = await scraper.scrape(cache_test_url)
-            first_time = time.time() - start_time
-            
-            # Second request (potential cache hit)
-            start_time = time.time()
+        first_time = timing.elapsed
+        
+        # Second request (potential cache hit)
+        with timed() as timing:
             second_result = await scraper.scrape(cache_test_url)
-            second_time = time.time() - start_time
-            
-            cache_improvement = (first_time - second_time) / first_time * 100 if first_time > 0 else 0
-            
-            benchmark_results["cache_performance"] = {
-                "first_request_time": first_time,
-                "second_request_time": second_time,
-                "cache_improvement_percent": cache_improvement,
-                "cache_hit_detected": second_time < first_time * 0.5
-            }
-            
-            print(f"  📊 Cache improvement: {cache_improvement:.1f}%")
-            print(f"  🎯 Cache hit detected: {benchmark_results['cache_performance']['cache_hit_detected']}")
+        second_time = timing.elapsed
+        
+        cache_improvement = (first_time - second_time) / first_time * 100 if first_time > 0 else 0
+        
+        benchmark_results["cache_performance"] = {
+            "first_request_time": first_time,
+            "second_request_time": second_time,
+            "cache_improvement_percent": cache_improvement,
+            "cache_hit_detected": second_time < first_time * 0.5
+        }
         
+        logger.info(f"  📊 Cache improvement: {cache_improvement:.1f}%")
+        logger.info(f"  🎯 Cache hit detected: {benchmark_results['cache_performance']['cache_hit_detected']}")
+    
         return benchmark_results
     
     async def run_comprehensive_end_to_end_tests(self) -> Dict[str, Any]:
         """Run all end-to-end tests"""
-        print("🚀 Starting Comprehensive End-to-End Testing")
-        print("=" * 60)
+        logger.info("🚀 Starting Comprehensive End-to-End Testing")
+        logger.info("=" * 60)
         
-        # Run all test suites
-        self.test_results["pipeline_tests"] = await self.test_complete_pipeline_flow()
-        self.test_results["real_world_scenarios"] = await self.test_real_world_scenarios()
-        self.test_results["performance_benchmarks"] = await self.performance_benchmark_testing()
+        # Run all test suites on one scraper, so its clients, connection pools
+        # and caches carry over from one suite to the next
+        from core.scraper import SwissKnifeScraper
+        
+        async with AsyncExitStack() as stack:
+            with timed() as timing:
+                scraper = await stack.enter_async_context(SwissKnifeScraper())
+            init_time = timing.elapsed
+            
+            self.test_results["pipeline_tests"] = await self.test_complete_pipeline_flow(scraper, init_time)
+            self.test_results["real_world_scenarios"] = await self.test_real_world_scenarios(scraper)
+            self.test_results["performance_benchmarks"] = await self.performance_benchmark_testing(scraper)
         
         # Calculate overall metrics
         pipeline_health = self.test_results["pipeline_tests"].get("overall_health", {}).get("health_score", 0)
@@ -427,11 +598,11 @@ class EndToEndPipelineTester:
 
 async def generate_comprehensive_report(test_results: Dict[str, Any]):
     """Generate comprehensive end-to-end testing report"""
-    print("\n📊 Generating Comprehensive End-to-End Report...")
+    logger.info("\n📊 Generating Comprehensive End-to-End Report...")
     
     overall_metrics = test_results.get("overall_metrics", {})
     
-    report = f"""# Smart Scraper AI - End-to-End Testing Report
+    parts: List[str] = [f"""# Smart Scraper AI - End-to-End Testing Report
 
 **Generated:** {overall_metrics.get('test_completion_time', 'Unknown')}
 **Overall Grade:** {overall_metrics.get('overall_grade', 'Unknown')}
@@ -451,46 +622,46 @@ The Smart Scraper AI system has undergone comprehensive end-to-end testing to va
 ## Pipeline Flow Validation
 
 ### System Initialization
-"""
+"""]
     
     pipeline_tests = test_results.get("pipeline_tests", {})
     init_results = pipeline_tests.get("initialization", {})
     
-    report += f"""
+    parts.append(f"""
 - **Initialization Time:** {init_results.get('initialization_time', 0):.2f} seconds
 - **Components Loaded:** {'✅ Yes' if init_results.get('components_loaded') else '❌ No'}
 - **Status:** {'✅ Success' if init_results.get('success') else '❌ Failed'}
 
 ### Component Integration
-"""
+""")
     
     integration_results = pipeline_tests.get("component_integration", {})
     component_status = integration_results.get("component_status", {})
     
     for component, status in component_status.items():
-        report += f"- **{component.replace('_', ' ').title()}:** {'✅ Active' if status else '❌ Inactive'}\n"
+        parts.append(f"- **{component.replace('_', ' ').title()}:** {'✅ Active' if status else '❌ Inactive'}\n")
     
-    report += f"""
+    parts.append(f"""
 - **All Components Active:** {'✅ Yes' if integration_results.get('all_components_active') else '❌ No'}
 - **Total Components:** {integration_results.get('total_components', 0)}
 
 ### Request Processing
-"""
+""")
     
     processing_results = pipeline_tests.get("request_processing", {})
     
-    report += f"""
+    parts.append(f"""
 - **Processing Success:** {'✅ Yes' if processing_results.get('success') else '❌ No'}
 - **Processing Time:** {processing_results.get('processing_time', 0):.2f} seconds
 - **Method Used:** {processing_results.get('method_used', 'Unknown')}
 - **Optimization Active:** {'✅ Yes' if processing_results.get('optimization_active') else '❌ No'}
 
 ## Real-World Scenario Testing
-"""
+""")
     
     scenarios = test_results.get("real_world_scenarios", {})
     for scenario_name, scenario_data in scenarios.items():
-        report += f"""
+        parts.append(f"""
 ### {scenario_name.replace('_', ' ').title()}
 - **Success Rate:** {scenario_data.get('success_rate', 0):.1%}
 - **Expected Rate:** {scenario_data.get('expected_success_rate', 0):.1%}
@@ -498,40 +669,41 @@ The Smart Scraper AI system has undergone comprehensive end-to-end testing to va
 - **Average Response Time:** {scenario_data.get('average_response_time', 0):.2f}s
 - **Tests Run:** {scenario_data.get('tests_run', 0)}
 - **Tests Passed:** {scenario_data.get('tests_passed', 0)}
-"""
+""")
     
-    report += f"""
+    parts.append(f"""
 ## Performance Benchmarks
 
 ### Throughput Testing
-"""
+""")
     
     benchmarks = test_results.get("performance_benchmarks", {})
     throughput_test = benchmarks.get("throughput_test", {})
     
-    report += f"""
+    parts.append(f"""
 - **Total Requests:** {throughput_test.get('total_requests', 0)}
 - **Successful Requests:** {throughput_test.get('successful_requests', 0)}
 - **Requests per Second:** {throughput_test.get('requests_per_second', 0):.2f}
+- **Requests per Second (coalesced duplicate requests):** {throughput_test.get('requests_per_second_coalesced', 0):.2f}
 - **Success Rate:** {throughput_test.get('success_rate', 0):.1%}
 
 ### Latency Analysis
-"""
+""")
     
     latency_test = benchmarks.get("latency_test", {})
     
-    report += f"""
+    parts.append(f"""
 - **Average Latency:** {latency_test.get('avg_latency', 0):.2f}s
 - **Median Latency:** {latency_test.get('median_latency', 0):.2f}s
 - **P95 Latency:** {latency_test.get('p95_latency', 0):.2f}s
 - **Min/Max Latency:** {latency_test.get('min_latency', 0):.2f}s / {latency_test.get('max_latency', 0):.2f}s
 
 ### Cache Performance
-"""
+""")
     
     cache_perf = benchmarks.get("cache_performance", {})
     
-    report += f"""
+    parts.append(f"""
 - **First Request Time:** {cache_perf.get('first_request_time', 0):.2f}s
 - **Second Request Time:** {cache_perf.get('second_request_time', 0):.2f}s
 - **Performance Improvement:** {cache_perf.get('cache_improvement_percent', 0):.1f}%
@@ -568,59 +740,63 @@ The system has successfully passed comprehensive end-to-end testing and demonstr
 4. **User Acceptance Testing** - Conduct final UAT with real user scenarios
 
 **The Smart Scraper AI project has achieved complete end-to-end validation and is production-ready.**
-"""
+""")
     
     with open("END_TO_END_TESTING_REPORT.md", "w", encoding="utf-8") as f:
-        f.write(report)
+        f.write("".join(parts))
     
-    print("✅ Comprehensive report created: END_TO_END_TESTING_REPORT.md")
+    logger.info("✅ Comprehensive report created: END_TO_END_TESTING_REPORT.md")
 
 
 async def main():
     """Main test execution"""
-    print("🚀 Smart Scraper AI - End-to-End Testing Suite")
-    print("=" * 70)
-    
-    tester = EndToEndPipelineTester()
-    
-    # Run comprehensive tests
-    test_results = await tester.run_comprehensive_end_to_end_tests()
-    
-    # Generate comprehensive report
-    await generate_comprehensive_report(test_results)
-    
-    # Save detailed results
-    with open("end_to_end_test_results.json", "w") as f:
-        json.dump(test_results, f, indent=2, default=str)
-    
-    # Print final summary
-    overall_metrics = test_results.get("overall_metrics", {})
-    
-    print("\n" + "=" * 70)
-    print("📊 END-TO-END TESTING FINAL SUMMARY")
-    print("=" * 70)
-    print(f"🎯 Overall Grade: {overall_metrics.get('overall_grade', 'Unknown')}")
-    print(f"📈 Pipeline Health: {overall_metrics.get('pipeline_health_score', 0):.1f}%")
-    print(f"🌍 Scenario Success: {overall_metrics.get('average_scenario_success_rate', 0):.1%}")
-    print(f"⚡ Throughput: {overall_metrics.get('throughput_rps', 0):.2f} req/s")
-    print(f"⏱️ Average Latency: {overall_metrics.get('average_latency_seconds', 0):.2f}s")
-    
-    grade = overall_metrics.get('overall_grade', '')
-    if 'A' in grade:
-        print("\n✅ END-TO-END TESTING: EXCELLENT SUCCESS")
-        print("🚀 Smart Scraper AI is PRODUCTION READY")
-        print("🎉 Complete optimized pipeline validated and operational")
-        return 0
-    elif 'B' in grade or 'C' in grade:
-        print("\n⚠️ END-TO-END TESTING: GOOD SUCCESS")
-        print("📊 Smart Scraper AI is ready with minor optimizations needed")
-        return 0
-    else:
-        print("\n❌ END-TO-END TESTING: NEEDS IMPROVEMENT")
-        print("📖 Review detailed report for optimization recommendations")
-        return 1
+    with log_listener():
+        logger.info("🚀 Smart Scraper AI - End-to-End Testing Suite")
+        logger.info("=" * 70)
+        
+        tester = EndToEndPipelineTester()
+        
+        # Run comprehensive tests
+        test_results = await tester.run_comprehensive_end_to_end_tests()
+        
+        # Generate comprehensive report
+        await generate_comprehensive_report(test_results)
+        
+        # Save detailed results
+        if ORJSON_AVAILABLE:
+            with open("end_to_end_test_results.json", "wb") as f:
+                f.write(orjson.dumps(test_results, option=orjson.OPT_INDENT_2, default=str))
+        else:
+            with open("end_to_end_test_results.json", "w") as f:
+                json.dump(test_results, f, indent=2, default=str)
+        
+        # Print final summary
+        overall_metrics = test_results.get("overall_metrics", {})
+        
+        logger.info("\n" + "=" * 70)
+        logger.info("📊 END-TO-END TESTING FINAL SUMMARY")
+        logger.info("=" * 70)
+        logger.info(f"🎯 Overall Grade: {overall_metrics.get('overall_grade', 'Unknown')}")
+        logger.info(f"📈 Pipeline Health: {overall_metrics.get('pipeline_health_score', 0):.1f}%")
+        logger.info(f"🌍 Scenario Success: {overall_metrics.get('average_scenario_success_rate', 0):.1%}")
+        logger.info(f"⚡ Throughput: {overall_metrics.get('throughput_rps', 0):.2f} req/s")
+        logger.info(f"⏱️ Average Latency: {overall_metrics.get('average_latency_seconds', 0):.2f}s")
+        
+        grade = overall_metrics.get('overall_grade', '')
+        if 'A' in grade:
+            logger.info("\n✅ END-TO-END TESTING: EXCELLENT SUCCESS")
+            logger.info("🚀 Smart Scraper AI is PRODUCTION READY")
+            logger.info("🎉 Complete optimized pipeline validated and operational")
+            return 0
+        elif 'B' in grade or 'C' in grade:
+            logger.info("\n⚠️ END-TO-END TESTING: GOOD SUCCESS")
+            logger.info("📊 Smart Scraper AI is ready with minor optimizations needed")
+            return 0
+        else:
+            logger.info("\n❌ END-TO-END TESTING: NEEDS IMPROVEMENT")
+            logger.info("📖 Review detailed report for optimization recommendations")
+            return 1
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
-    exit(exit_code)
+    exit(run_main(main))
@@ -1,238 +0,0 @@
-#!/usr/bin/env python3
-"""
-Simple Jina AI Configuration Test
-Tests Jina AI integration with proper environment setup
-"""
-
-import asyncio
-import os
-import json
-from datetime import datetime
-
-# Set required environment variables
-os.environ.setdefault("SECRET_KEY", "test-secret-key-for-jina-ai-config-testing")
-os.environ.setdefault("JINA_API_KEY", "test-api-key")
-os.environ.setdefault("JINA_READER_ENDPOINT", "https://r.jina.ai")
-os.environ.setdefault("JINA_SEARCH_ENDPOINT", "https://s.jina.ai")
-
-from services.jina_ai_client import JinaAIClient
-
-
-async def test_jina_ai_configuration():
-    """Test Jina AI configuration and integration"""
-    print("🚀 Testing Jina AI Configuration")
-    print("=" * 40)
-    
-    results = {
-        "timestamp": datetime.now().isoformat(),
-        "configuration_status": "unknown",
-        "tests": {}
-    }
-    
-    try:
-        # Test 1: Client Initialization
-        print("🔧 Testing Jina AI client initialization...")
-        async with JinaAIClient() as jina_client:
-            print("✅ Jina AI client initialized successfully")
-            results["tests"]["client_initialization"] = {"status": "pass"}
-            
-            # Test 2: Service Status
-            print("\n📊 Testing service status...")
-            try:
-                status = await jina_client.get_service_status()
-                print(f"✅ Service status retrieved")
-                print(f"📊 API Key Configured: {status.get('api_key_configured', False)}")
-                print(f"🔗 Endpoints: {len(status.get('endpoints', {}))}")
-                
-                results["tests"]["service_status"] = {
-                    "status": "pass",
-                    "api_key_configured": status.get("api_key_configured", False),
-                    "endpoints_count": len(status.get("endpoints", {}))
-                }
-            except Exception as e:
-                print(f"❌ Service status test failed: {e}")
-                results["tests"]["service_status"] = {"status": "error", "error": str(e)}
-            
-            # Test 3: Reader API (Public endpoint test)
-            print("\n📖 Testing Jina AI Reader API...")
-            try:
-                # Test with a simple URL
-                reader_result = await jina_client.read_url("https://example.com")
-                
-                if reader_result.get("success"):
-                    print("✅ Reader API working correctly")
-                    print(f"📄 Content length: {len(reader_result.get('content', ''))}")
-                    results["tests"]["reader_api"] = {
-                        "status": "pass",
-                        "content_length": len(reader_result.get("content", ""))
-                    }
-                else:
-                    print("⚠️ Reader API returned unsuccessful result")
-                    results["tests"]["reader_api"] = {"status": "partial"}
-                    
-            except Exception as e:
-                error_msg = str(e)
-                if "401" in error_msg or "AuthenticationFailedError" in error_msg:
-                    print("⚠️ Reader API requires valid API key (expected with test key)")
-                    results["tests"]["reader_api"] = {
-                        "status": "expected_auth_error",
-                        "note": "Requires valid API key"
-                    }
-                else:
-                    print(f"❌ Reader API test failed: {e}")
-                    results["tests"]["reader_api"] = {"status": "error", "error": str(e)}
-            
-            # Test 4: Configuration Files Check
-            print("\n📁 Checking configuration files...")
-            config_files = [".env", ".env.docker"]
-            config_status = {}
-            
-            for config_file in config_files:
-                if os.path.exists(config_file):
-                    with open(config_file, 'r') as f:
-                        content = f.read()
-                        has_jina_config = "JINA_API_KEY" in content
-                        config_status[config_file] = {
-                            "exists": True,
-                            "has_jina_config": has_jina_config
-                        }
-                        print(f"✅ {config_file}: exists, Jina config: {has_jina_config}")
-                else:
-                    config_status[config_file] = {"exists": False}
-                    print(f"⚠️ {config_file}: not found")
-            
-            results["tests"]["configuration_files"] = config_status
-            
-            # Overall assessment
-            passed_tests = sum(1 for test in results["tests"].values() 
-                             if isinstance(test, dict) and test.get("status") in ["pass", "expected_auth_error"])
-            total_tests = len([t for t in results["tests"].values() if isinstance(t, dict)])
-            
-            if passed_tests >= total_tests * 0.8:
-                results["configuration_status"] = "excellent"
-            elif passed_tests >= total_tests * 0.6:
-                results["configuration_status"] = "good"
-            else:
-                results["configuration_status"] = "needs_improvement"
-            
-            print(f"\n📊 Configuration Status: {results['configuration_status'].upper()}")
-            print(f"📈 Tests Status: {passed_tests}/{total_tests}")
-            
-    except Exception as e:
-        print(f"❌ Configuration test failed: {e}")
-        results["configuration_status"] = "failed"
-        results["error"] = str(e)
-    
-    return results
-
-
-async def create_jina_ai_setup_guide():
-    """Create a setup guide for Jina AI configuration"""
-    print("\n📝 Creating Jina AI Setup Guide...")
-    
-    guide_content = """# Jina AI Configuration Guide
-
-## Step 1: Get Jina AI API Key
-
-1. Visit: https://jina.ai/
-2. Sign up for a free account
-3. Navigate to the API Keys section in your dashboard
-4. Generate a new API key
-5. Copy the API key (it will look like: jina_xxxxxxxxxxxxxxxxxxxx)
-
-## Step 2: Configure Environment Variables
-
-Add the following to your `.env` file:
-
-```bash
-# Jina AI Configuration
-JINA_API_KEY=your_actual_jina_api_key_here
-JINA_READER_ENDPOINT=https://r.jina.ai
-JINA_SEARCH_ENDPOINT=https://s.jina.ai
-JINA_EMBEDDINGS_ENDPOINT=https://api.jina.ai/v1/embeddings
-JINA_RERANKER_ENDPOINT=https://api.jina.ai/v1/rerank
-```
-
-## Step 3: Test Configuration
-
-Run the configuration test:
-```bash
-python test_jina_ai_config_simple.py
-```
-
-## Step 4: Verify Integration
-
-Once configured, the Smart Scraper AI will use Jina AI for:
-- PDF document processing (via Reader API)
-- Web content analysis (via Reader API)
-- Text embeddings (via Embeddings API)
-- Document reranking (via Reranker API)
-- Web search capabilities (via Search API)
-
-## API Usage Limits
-
-- Free tier: 1,000 requests per month
-- Paid tiers available for higher usage
-- Check current limits at: https://jina.ai/pricing
-
-## Troubleshooting
-
-### Common Issues:
-1. **401 Authentication Error**: Invalid or missing API key
-2. **Rate Limiting**: Exceeded free tier limits
-3. **Network Issues**: Check internet connectivity
-
-### Solutions:
-1. Verify API key is correctly set in environment
-2. Check API usage in Jina AI dashboard
-3. Ensure proper network connectivity
-
-## Integration Status
-
-The Smart Scraper AI is now configured to use:
-- ✅ crawl4ai Docker service (Primary Scraping Engine)
-- ✅ Jina AI APIs (Core AI Processing Engine)
-
-This provides the complete intelligent web scraping stack as originally designed.
-"""
-    
-    with open("JINA_AI_SETUP_GUIDE.md", "w", encoding="utf-8") as f:
-        f.write(guide_content)
-    
-    print("✅ Setup guide created: JINA_AI_SETUP_GUIDE.md")
-
-
-async def main():
-    """Main execution"""
-    print("🚀 Jina AI Configuration Test Suite")
-    print("=" * 50)
-    
-    # Run configuration test
-    results = await test_jina_ai_configuration()
-    
-    # Save results
-    with open("jina_ai_config_test_results.json", "w") as f:
-        json.dump(results, f, indent=2)
-    
-    # Create setup guide
-    await create_jina_ai_setup_guide()
-    
-    print("\n" + "=" * 50)
-    print("📊 JINA AI CONFIGURATION TEST SUMMARY")
-    print("=" * 50)
-    print(f"🎯 Configuration Status: {results['configuration_status'].upper()}")
-    
-    if results["configuration_status"] in ["excellent", "good"]:
-        print("✅ Jina AI integration is properly configured")
-        print("🚀 Ready for production use with valid API key")
-        print("📖 See JINA_AI_SETUP_GUIDE.md for API key setup instructions")
-        return 0
-    else:
-        print("⚠️ Jina AI integration needs configuration")
-        print("📖 See JINA_AI_SETUP_GUIDE.md for setup instructions")
-        return 1
-
-
-if __name__ == "__main__":
-    exit_code = asyncio.run(main())
-    exit(exit_code)
@@ -1,187 +0,0 @@
-#!/usr/bin/env python3
-"""
-Test Jina AI Integration
-Validates that Jina AI APIs are properly integrated and functional
-"""
-
-import asyncio
-import json
-import os
-from datetime import datetime
-
-# Set minimal environment for testing
-os.environ.setdefault("SECRET_KEY", "test-secret-key-for-jina-ai-testing-only")
-os.environ.setdefault("JINA_API_KEY", "test-api-key")  # Will be overridden if real key exists
-os.environ.setdefault("JINA_READER_ENDPOINT", "https://r.jina.ai")
-os.environ.setdefault("JINA_SEARCH_ENDPOINT", "https://s.jina.ai")
-
-from services.jina_ai_client import JinaAIClient
-
-
-async def test_jina_ai_integration():
-    """Test Jina AI client integration"""
-    print("🚀 Testing Jina AI Integration")
-    print("=" * 40)
-    
-    try:
-        # Test Jina AI client initialization
-        async with JinaAIClient() as jina_client:
-            print("✅ Jina AI client initialized successfully")
-            
-            # Test service status
-            status = await jina_client.get_service_status()
-            print(f"📊 Service Status: {json.dumps(status, indent=2)}")
-            
-            # Test Reader API (doesn't require API key)
-            print("\n🔍 Testing Jina AI Reader API...")
-            try:
-                reader_result = await jina_client.read_url("https://example.com")
-                
-                print(f"✅ Reader API successful: {reader_result.get('success', False)}")
-                print(f"📄 Content length: {len(reader_result.get('content', ''))}")
-                print(f"🔧 Source: {reader_result.get('source')}")
-                
-                if reader_result.get("success"):
-                    print("✅ Confirmed: Jina AI Reader API is working")
-                else:
-                    print("⚠️ Reader API returned unsuccessful result")
-                
-            except Exception as e:
-                print(f"⚠️ Reader API test failed (may be expected without API key): {e}")
-            
-            # Test Search API (may require API key)
-            print("\n🔍 Testing Jina AI Search API...")
-            try:
-                search_result = await jina_client.search("artificial intelligence")
-                
-                print(f"✅ Search API successful: {search_result.get('success', False)}")
-                print(f"📊 Query: {search_result.get('query')}")
-                print(f"🔧 Source: {search_result.get('source')}")
-                
-                if search_result.get("success"):
-                    print("✅ Confirmed: Jina AI Search API is working")
-                else:
-                    print("⚠️ Search API returned unsuccessful result")
-                
-            except Exception as e:
-                print(f"⚠️ Search API test failed (may require API key): {e}")
-            
-            # Test Embeddings API (requires API key)
-            if jina_client.api_key and jina_client.api_key != "test-api-key":
-                print("\n🤖 Testing Jina AI Embeddings API...")
-                try:
-                    embeddings_result = await jina_client.get_embeddings(
-                        ["Hello world", "Test embedding"]
-                    )
-                    
-                    print(f"✅ Embeddings API successful: {embeddings_result.get('success', False)}")
-                    print(f"📊 Embeddings count: {len(embeddings_result.get('embeddings', []))}")
-                    print(f"🔧 Model: {embeddings_result.get('model')}")
-                    
-                except Exception as e:
-                    print(f"⚠️ Embeddings API test failed: {e}")
-            else:
-                print("\n⚠️ Skipping Embeddings API test (requires valid API key)")
-            
-            # Test Reranker API (requires API key)
-            if jina_client.api_key and jina_client.api_key != "test-api-key":
-                print("\n🎯 Testing Jina AI Reranker API...")
-                try:
-                    reranker_result = await jina_client.rerank(
-                        "machine learning",
-                        ["AI is the future", "Cats are cute", "Machine learning algorithms"]
-                    )
-                    
-                    print(f"✅ Reranker API successful: {reranker_result.get('success', False)}")
-                    print(f"📊 Results count: {len(reranker_result.get('results', []))}")
-                    print(f"🔧 Model: {reranker_result.get('model')}")
-                    
-                except Exception as e:
-                    print(f"⚠️ Reranker API test failed: {e}")
-            else:
-                print("\n⚠️ Skipping Reranker API test (requires valid API key)")
-            
-            print("\n🎉 Jina AI integration tests completed!")
-            return True
-            
-    except Exception as e:
-        print(f"❌ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-
-async def test_multimodal_jina_integration():
-    """Test multimodal processing with Jina AI"""
-    print("\n🚀 Testing Multimodal Processing with Jina AI")
-    print("=" * 50)
-    
-    try:
-        # Set environment for multimodal test
-        os.environ.setdefault("ENABLE_MULTIMODAL_PROCESSING", "false")  # Disable for simple test
-        
-        from services.jina_ai_client import JinaAIClient
-        from features.multimodal_processing import PDFAnalyzer
-        
-        async with JinaAIClient() as jina_client:
-            print("✅ Jina AI client initialized for multimodal test")
-            
-            # Test PDF analyzer with Jina AI
-            pdf_analyzer = PDFAnalyzer(jina_ai_client=jina_client)
-            
-            # Test with a simple PDF URL (this would normally be a real PDF)
-            print("\n📄 Testing PDF processing with Jina AI...")
-            try:
-                # Note: This will test the Jina AI Reader path
-                pdf_result = await pdf_analyzer.process("https://example.com/sample.pdf")
-                
-                print(f"✅ PDF processing completed")
-                print(f"📊 Processing method: {pdf_result.get('processing_method', 'unknown')}")
-                print(f"🔧 Source: {pdf_result.get('source', 'unknown')}")
-                
-                if pdf_result.get("processing_method") == "jina_ai_reader":
-                    print("✅ Confirmed: PDF processing uses Jina AI Reader as PRIMARY")
-                else:
-                    print(f"⚠️ Expected jina_ai_reader, got: {pdf_result.get('processing_method')}")
-                
-            except Exception as e:
-                print(f"⚠️ PDF processing test failed: {e}")
-            
-            print("\n🎉 Multimodal Jina AI integration tests completed!")
-            return True
-            
-    except Exception as e:
-        print(f"❌ Multimodal test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-
-async def main():
-    """Main test execution"""
-    print("🚀 Starting Jina AI Integration Test Suite")
-    print("=" * 60)
-    
-    # Test basic Jina AI integration
-    basic_success = await test_jina_ai_integration()
-    
-    # Test multimodal integration
-    multimodal_success = await test_multimodal_jina_integration()
-    
-    overall_success = basic_success and multimodal_success
-    
-    if overall_success:
-        print("\n✅ Jina AI Integration: SUCCESSFUL")
-        print("🚀 Jina AI is now integrated as CORE AI PROCESSING ENGINE")
-        exit_code = 0
-    else:
-        print("\n❌ Jina AI Integration: PARTIAL SUCCESS")
-        print("⚠️ Some tests failed - check API key configuration")
-        exit_code = 1
-    
-    return exit_code
-
-
-if __name__ == "__main__":
-    exit_code = asyncio.run(main())
-    exit(exit_code)
@@ -0,0 +1,127 @@
+"""
+Tests for the crawl4ai Docker client's result cache and extraction strategies
+"""
+
+import pytest
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+from services.crawl4ai_client import Crawl4aiDockerClient
+
+
+class TestCrawl4aiResultCache:
+    """Test suite for the opt-in crawl result cache"""
+
+    @pytest.fixture
+    def settings(self):
+        """Settings pointing at a local crawl4ai service"""
+        return Mock(CRAWL4AI_ENDPOINT="http://localhost:11235", CRAWL4AI_TIMEOUT=30)
+
+    def make_client(self, settings, **kwargs):
+        """Client whose crawl requests are answered by a mock"""
+        with patch("services.crawl4ai_client.get_settings", return_value=settings):
+            client = Crawl4aiDockerClient(**kwargs)
+        client.session = Mock()
+        client._post_crawl = AsyncMock(side_effect=lambda payload, url: {
+            "url": url,
+            "success": True,
+            "metadata": {"links": ["https://example.com/a"]}
+        })
+        return client
+
+    @pytest.mark.asyncio
+    async def test_cache_is_off_by_default(self, settings):
+        """Without cache_ttl every crawl reaches the service"""
+        client = self.make_client(settings)
+
+        await client.crawl_url("https://example.com")
+        await client.crawl_url("https://example.com")
+
+        assert client._post_crawl.await_count == 2
+        assert len(client._html_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_cached_results_are_independent_copies(self, settings):
+        """A cache hit skips the service and never shares nested data"""
+        client = self.make_client(settings, cache_ttl=60)
+
+        first = await client.crawl_url("https://example.com")
+        first["metadata"]["links"].append("https://example.com/changed")
+        second = await client.crawl_url("https://example.com")
+
+        assert client._post_crawl.await_count == 1
+        assert second["metadata"]["links"] == ["https://example.com/a"]
+
+    @pytest.mark.asyncio
+    async def test_cache_size_is_capped(self, settings):
+        """The oldest entries are dropped beyond cache_size"""
+        client = self.make_client(settings, cache_ttl=60, cache_size=2)
+
+        for i in range(3):
+            await client.crawl_url(f"https://example.com/?page={i}")
+
+        assert len(client._html_cache) == 2
+        await client.crawl_url("https://example.com/?page=0")
+        assert client._post_crawl.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_evicted_on_insert(self, settings):
+        """Storing a result drops entries older than cache_ttl"""
+        client = self.make_client(settings, cache_ttl=60)
+
+        with patch("services.crawl4ai_client.time.monotonic", return_value=1000.0):
+            await client.crawl_url("https://example.com/old")
+        with patch("services.crawl4ai_client.time.monotonic", return_value=1061.0):
+            await client.crawl_url("https://example.com/new")
+
+        assert len(client._html_cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_inflight_crawls(self, settings):
+        """close() stops crawls still in flight before closing the session"""
+        client = self.make_client(settings)
+        session = client.session
+        session.close = AsyncMock()
+        started = asyncio.Event()
+
+        async def slow_crawl(payload, url):
+            started.set()
+            await asyncio.Event().wait()
+
+        client._post_crawl = slow_crawl
+        crawl = asyncio.ensure_future(client.crawl_url("https://example.com"))
+        await started.wait()
+        await client.close()
+
+        with pytest.raises(asyncio.CancelledError):
+            await crawl
+        assert client._inflight == {}
+        session.close.assert_awaited_once()
+
+
+class TestCrawl4aiExtractionStrategies:
+    """Test suite for the extract_with_* helpers"""
+
+    @pytest.fixture
+    def client(self):
+        """Client whose crawl_url is a mock"""
+        settings = Mock(CRAWL4AI_ENDPOINT="http://localhost:11235", CRAWL4AI_TIMEOUT=30)
+        with patch("services.crawl4ai_client.get_settings", return_value=settings):
+            client = Crawl4aiDockerClient()
+        client.crawl_url = AsyncMock(return_value={"success": True})
+        return client
+
+    @pytest.mark.asyncio
+    async def test_extract_helpers_send_built_strategies(self, client):
+        """Each helper sends what build_extraction_strategy produces for its arguments"""
+        await client.extract_with_css("https://example.com", {"title": "h1"})
+        await client.extract_with_xpath("https://example.com", {"title": "//h1"})
+        await client.extract_with_llm("https://example.com", "Find the title", schema={"title": "string"})
+
+        strategies = [call.kwargs["extraction_strategy"] for call in client.crawl_url.await_args_list]
+        assert strategies == [
+            client.build_extraction_strategy(extraction_config={"css_selectors": {"title": "h1"}}),
+            client.build_extraction_strategy(extraction_config={"xpath_expressions": {"title": "//h1"}}),
+            {"type": "llm", "query": "Find the title", "schema": {"title": "string"}}
+        ]
+        assert strategies[0] == {"type": "css", "selectors": {"title": "h1"}}
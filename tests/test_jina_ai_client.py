@@ -0,0 +1,138 @@
+"""
+Tests for JinaAIClient request coalescing and concurrency limits
+"""
+
+import pytest
+import asyncio
+from unittest.mock import Mock, patch
+
+from services.jina_ai_client import JinaAIClient
+
+
+class FakeResponse:
+    """Reader API response that completes once its session releases it"""
+
+    def __init__(self, session, url):
+        self.session = session
+        self.url = url
+        self.status = 200
+
+    async def __aenter__(self):
+        self.session.active += 1
+        self.session.peak = max(self.session.peak, self.session.active)
+        await self.session.release.wait()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.session.active -= 1
+
+    async def text(self):
+        return f"content of {self.url}"
+
+
+class FakeSession:
+    """Stand-in for aiohttp.ClientSession that records every GET"""
+
+    def __init__(self):
+        self.requests = []
+        self.active = 0
+        self.peak = 0
+        self.release = asyncio.Event()
+        self.closed = False
+
+    def get(self, url, params=None):
+        self.requests.append(url)
+        return FakeResponse(self, url)
+
+    async def close(self):
+        self.closed = True
+
+
+class TestJinaAIClientRequests:
+    """Test suite for in-flight request handling"""
+
+    @pytest.fixture
+    def settings(self):
+        """Settings with a Jina AI key and the default endpoints"""
+        return Mock(
+            JINA_API_KEY="test-key",
+            JINA_READER_ENDPOINT="https://r.jina.ai",
+            JINA_SEARCH_ENDPOINT="https://s.jina.ai",
+            JINA_EMBEDDINGS_ENDPOINT="https://api.jina.ai/v1/embeddings",
+            JINA_RERANKER_ENDPOINT="https://api.jina.ai/v1/rerank"
+        )
+
+    def make_client(self, settings, **kwargs):
+        """Client whose session is a FakeSession"""
+        with patch("services.jina_ai_client.get_settings", return_value=settings):
+            client = JinaAIClient(**kwargs)
+        client.session = FakeSession()
+        return client
+
+    @pytest.mark.asyncio
+    async def test_identical_reads_share_one_request(self, settings):
+        """Two concurrent reads of the same URL make one Reader API request"""
+        client = self.make_client(settings)
+
+        reads = asyncio.gather(
+            client.read_url("https://example.com"),
+            client.read_url("https://example.com")
+        )
+        await asyncio.sleep(0)
+        client.session.release.set()
+        first, second = await reads
+
+        assert client.session.requests == ["https://r.jina.ai/https://example.com"]
+        assert first == second
+        assert first["content"] == "content of https://r.jina.ai/https://example.com"
+
+    @pytest.mark.asyncio
+    async def test_joined_results_are_independent_copies(self, settings):
+        """Changing one caller's result leaves the other's untouched"""
+        client = self.make_client(settings)
+
+        reads = asyncio.gather(
+            client.read_url("https://example.com"),
+            client.read_url("https://example.com")
+        )
+        await asyncio.sleep(0)
+        client.session.release.set()
+        first, second = await reads
+
+        first["content"] = "changed"
+        assert second["content"] == "content of https://r.jina.ai/https://example.com"
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap_limits_open_requests(self, settings):
+        """No more than max_concurrency requests are open at once"""
+        client = self.make_client(settings, max_concurrency=2)
+
+        reads = asyncio.gather(*(
+            client.read_url(f"https://example.com/?page={i}") for i in range(5)
+        ))
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert client.session.active == 2
+
+        client.session.release.set()
+        results = await reads
+
+        assert len(client.session.requests) == 5
+        assert client.session.peak == 2
+        assert all(result["success"] for result in results)
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_inflight_requests(self, settings):
+        """close() stops requests still in flight before closing the session"""
+        client = self.make_client(settings)
+        session = client.session
+
+        read = asyncio.ensure_future(client.read_url("https://example.com"))
+        await asyncio.sleep(0)
+        await client.close()
+
+        with pytest.raises(asyncio.CancelledError):
+            await read
+        assert session.active == 0
+        assert session.closed
+        assert client._inflight == {}
@@ -0,0 +1,117 @@
+"""
+Tests for SwissKnifeScraper.scrape and scrape_batch against a mocked crawl4ai client
+"""
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from core.scraper import SwissKnifeScraper, ScrapeJob
+from services.crawl4ai_client import Crawl4aiDockerClient
+from utils.exceptions import ScrapingError
+
+
+class TestScrapeBatch:
+    """Test suite for batched scraping"""
+
+    @pytest.fixture
+    def settings(self):
+        """Settings pointing at a local crawl4ai service"""
+        return Mock(CRAWL4AI_ENDPOINT="http://localhost:11235", CRAWL4AI_TIMEOUT=30)
+
+    @pytest.fixture
+    def scraper(self, settings):
+        """Initialized scraper whose only component is a mocked crawl4ai client"""
+        with patch("core.scraper.get_settings", return_value=settings), \
+                patch("services.crawl4ai_client.get_settings", return_value=settings):
+            scraper = SwissKnifeScraper()
+            scraper.crawl4ai_client = Crawl4aiDockerClient()
+        scraper.crawl4ai_client.crawl_url = AsyncMock(
+            side_effect=lambda url, **kwargs: {"url": url, "success": True}
+        )
+        scraper.crawl4ai_client.crawl_batch = AsyncMock(
+            side_effect=lambda jobs, return_exceptions=False: [
+                {"url": job["url"], "success": True} for job in jobs
+            ]
+        )
+        scraper.is_initialized = True
+        return scraper
+
+    @pytest.mark.asyncio
+    async def test_scrape_uses_shared_extraction_strategy(self, scraper):
+        """scrape() sends the strategy built by build_extraction_strategy"""
+        config = {"css_selectors": {"title": "h1"}}
+
+        result = await scraper.scrape("https://example.com", extraction_config=config)
+
+        scraper.crawl4ai_client.crawl_url.assert_awaited_once_with(
+            "https://example.com",
+            extraction_strategy={"type": "css", "selectors": {"title": "h1"}}
+        )
+        assert result["method"] == "crawl4ai_docker_primary_optimized"
+        assert result["extraction_type"] == "css"
+
+    @pytest.mark.asyncio
+    async def test_batch_matches_scrape_requests(self, scraper):
+        """Batched jobs carry the same strategies scrape() would send"""
+        jobs = [
+            ScrapeJob("https://example.com"),
+            ScrapeJob("https://example.com/css", extraction_config={"css_selectors": {"title": "h1"}}),
+            ScrapeJob("https://example.com/llm", query="Find the title", extraction_config={"llm": True})
+        ]
+
+        results = await scraper.scrape_batch(jobs)
+
+        crawl_jobs = scraper.crawl4ai_client.crawl_batch.await_args.args[0]
+        assert crawl_jobs == [
+            {"url": "https://example.com", "crawler_config": {}},
+            {"url": "https://example.com/css", "extraction_strategy": {"type": "css", "selectors": {"title": "h1"}}},
+            {"url": "https://example.com/llm", "extraction_strategy": {"type": "llm", "query": "Find the title"}}
+        ]
+        assert [result["url"] for result in results] == [job.url for job in jobs]
+        assert [result["extraction_type"] for result in results] == ["basic", "css", "llm"]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_jobs_take_the_fallback_path(self, scraper):
+        """A job whose crawl failed falls back like scrape() does"""
+        scraper.crawl4ai_client.crawl_batch = AsyncMock(return_value=[
+            {"url": "https://example.com/ok", "success": True},
+            ScrapingError("crawl4ai API error: HTTP 500")
+        ])
+        scraper.extraction_engine = Mock()
+        scraper.extraction_engine.analyze_and_extract = AsyncMock(return_value={"title": "Example"})
+
+        results = await scraper.scrape_batch([
+            ScrapeJob("https://example.com/ok"),
+            ScrapeJob("https://example.com/broken", query="Find the title")
+        ])
+
+        assert results[0]["method"] == "crawl4ai_docker_primary_optimized"
+        assert results[1]["method"] == "adaptive_extraction_fallback"
+        scraper.extraction_engine.analyze_and_extract.assert_awaited_once_with(
+            "https://example.com/broken", "Find the title"
+        )
+
+    @pytest.mark.asyncio
+    async def test_batch_serves_cached_jobs_without_crawling(self, scraper):
+        """Jobs with a cached result are not sent to crawl4ai"""
+        cached = {"url": "https://example.com/cached", "method": "crawl4ai_docker_primary_optimized"}
+        optimizer = Mock()
+        optimizer._generate_cache_key = Mock(side_effect=lambda service, method, params: params["url"])
+        optimizer.get_cached_result = AsyncMock(
+            side_effect=lambda key: cached if key == "https://example.com/cached" else None
+        )
+        optimizer.intelligent_request_routing = AsyncMock(return_value="crawl4ai_primary")
+        optimizer.optimize_crawl4ai_config = AsyncMock(return_value={"cache_mode": "enabled"})
+        optimizer.set_cached_result = AsyncMock()
+        optimizer.optimization_config = {"cache_ttl": {}}
+        scraper.performance_optimizer = optimizer
+
+        results = await scraper.scrape_batch([
+            ScrapeJob("https://example.com/cached"),
+            ScrapeJob("https://example.com/fresh")
+        ])
+
+        crawl_jobs = scraper.crawl4ai_client.crawl_batch.await_args.args[0]
+        assert [job["url"] for job in crawl_jobs] == ["https://example.com/fresh"]
+        assert results[0] is cached
+        optimizer.set_cached_result.assert_awaited_once()
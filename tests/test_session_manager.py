@@ -0,0 +1,87 @@
+"""
+Tests for SessionManager password changes under the Redis lock
+"""
+
+import pytest
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+from services.session_manager import SessionManager
+from utils.exceptions import AuthenticationError
+
+
+class FakeRedis:
+    """In-memory stand-in for the SET NX / compare-and-delete calls the lock makes"""
+
+    def __init__(self):
+        self.data = {}
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def eval(self, script, numkeys, key, nonce):
+        if self.data.get(key) == nonce:
+            del self.data[key]
+            return 1
+        return 0
+
+
+class TestChangePasswordLock:
+    """Test suite for serialized password changes"""
+
+    @pytest.fixture
+    def settings(self):
+        """Settings with a JWT secret"""
+        return Mock(JWT_SECRET_KEY="test-jwt-secret-key-for-session-manager-tests")
+
+    def make_manager(self, settings, redis_client=None):
+        """SessionManager with mocked repositories and password hashing"""
+        with patch("services.session_manager.get_settings", return_value=settings), \
+                patch("services.session_manager.RepositoryManager"):
+            manager = SessionManager(Mock(), redis_client=redis_client)
+        manager.pwd_context = Mock()
+        manager.pwd_context.verify = Mock(return_value=True)
+        manager.pwd_context.hash = Mock(return_value="new-hash")
+        manager.repos = Mock()
+        manager.repos.users.update = AsyncMock()
+        manager.repos.sessions.deactivate_user_sessions = AsyncMock()
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_concurrent_changes_are_serialized(self, settings):
+        """A second change for the same user is rejected while the first holds the lock"""
+        redis_client = FakeRedis()
+        manager = self.make_manager(settings, redis_client)
+        lookup_started = asyncio.Event()
+        release_lookup = asyncio.Event()
+
+        async def slow_get_by_id(user_id):
+            lookup_started.set()
+            await release_lookup.wait()
+            return {"id": user_id, "password_hash": "old-hash"}
+
+        manager.repos.users.get_by_id = slow_get_by_id
+
+        first = asyncio.ensure_future(manager.change_password("user-1", "old", "new-1"))
+        await lookup_started.wait()
+        with pytest.raises(AuthenticationError):
+            await manager.change_password("user-1", "old", "new-2")
+
+        release_lookup.set()
+        assert await first is True
+        manager.repos.users.update.assert_awaited_once_with("user-1", {"password_hash": "new-hash"})
+        assert redis_client.data == {}
+
+    @pytest.mark.asyncio
+    async def test_lock_is_released_for_the_next_change(self, settings):
+        """Sequential changes each take and release the lock"""
+        redis_client = FakeRedis()
+        manager = self.make_manager(settings, redis_client)
+        manager.repos.users.get_by_id = AsyncMock(return_value={"id": "user-1", "password_hash": "old-hash"})
+
+        assert await manager.change_password("user-1", "old", "new-1") is True
+        assert await manager.change_password("user-1", "new-1", "new-2") is True
+        assert manager.repos.users.update.await_count == 2